@@ -11,7 +11,18 @@ from src.api.v1.categories.category_controller import router as category_router
 from src.api.v1.comments.comment_controller import router as comment_router
 from src.api.v1.likes.like_controller import router as like_router
 from src.api.v1.files.file_controller import router as file_router
+from src.api.v1.metrics.metrics_controller import router as metrics_router
+from src.api.v1.dependencies import build_container
+from src.core.config.settings import settings
 from src.core.database.connection import prisma_connection
+from src.core.database.cursor import NEXT_CURSOR_HEADER
+from src.services.articles.view_counter import view_counter
+from src.services.auth.cache import redis_client
+from src.services.likes.like_buffer import like_buffer
+from src.services.likes.like_reconciler import like_reconciler
+from src.services.auth.password_hasher import password_hasher
+from src.services.auth.token_blacklist import token_blacklist
+from src.services.s3.upload_sweeper import upload_sweeper
 import logging
 
 
@@ -23,9 +34,26 @@ async def lifespan(_app: FastAPI):
     # Startup
     print("Start Server")
     await prisma_connection.connect()
+    await redis_client.connect()
+    await token_blacklist.start()
+    _app.state.container = build_container()  # 서비스/클라이언트는 앱 수명 동안 공유
+    await view_counter.start()
+    await like_buffer.start()
+    if settings.LIKE_RECONCILE_ENABLED:
+        await like_reconciler.start()
+    password_hasher.start()
+    await upload_sweeper.start(_app.state.container.file_service)
     yield
     # Shutdown
     print("Shutdown Server")
+    await view_counter.stop()  # 남은 조회수 반영 후 연결 종료
+    await like_reconciler.stop()
+    await like_buffer.stop()  # 남은 좋아요 반영
+    await upload_sweeper.stop()
+    _app.state.container.close()
+    password_hasher.shutdown()
+    await token_blacklist.stop()
+    await redis_client.close()
     await prisma_connection.disconnect()
 
 
@@ -43,6 +71,8 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # 브라우저 클라이언트가 페이지네이션 커서와 조건부 요청 헤더를 읽을 수 있도록 노출
+    expose_headers=[NEXT_CURSOR_HEADER, "ETag", "Last-Modified"],
 )
 
 # API v1 prefix
@@ -56,6 +86,7 @@ app.include_router(category_router, prefix=API_V1_PREFIX)
 app.include_router(comment_router, prefix=API_V1_PREFIX)
 app.include_router(like_router, prefix=API_V1_PREFIX)
 app.include_router(file_router, prefix=API_V1_PREFIX)
+app.include_router(metrics_router, prefix=API_V1_PREFIX)
 
 
 @app.get("/")
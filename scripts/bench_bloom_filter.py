@@ -0,0 +1,95 @@
+"""
+토큰 블랙리스트 Bloom filter의 실제 오탐률과 메모리를 설정한 error_rate와 비교합니다.
+DB/Redis 없이 실행되며, 누락(false negative)이 있거나 오탐률이 목표의 2배를 넘으면 종료 코드 1로 끝납니다.
+
+    python -m scripts.bench_bloom_filter --capacity 100000 --probes 200000
+
+- 크기(--capacity)와 목표 오탐률(--error-rates)마다 필터를 만들고 capacity 개의 토큰 지문을
+  넣은 뒤, 넣지 않은 지문 --probes 개로 실제 오탐률을 잽니다.
+- 같은 지문을 set에 담았을 때의 메모리(sys.getsizeof 합계)와 조회 시간도 함께 출력합니다.
+- 용량을 넘겨 넣었을 때(--overfill 배) 오탐률이 얼마나 오르는지도 보여 줍니다.
+"""
+
+import argparse
+import hashlib
+import sys
+import time
+import uuid
+
+from src.services.cache.bloom_filter import BloomFilter
+
+
+def fingerprints(count: int) -> list[str]:
+    # token_blacklist와 같은 sha256 hex 지문
+    return [hashlib.sha256(uuid.uuid4().bytes).hexdigest() for _ in range(count)]
+
+
+def set_bytes(items: set[str]) -> int:
+    return sys.getsizeof(items) + sum(sys.getsizeof(item) for item in items)
+
+
+def lookup_us(container, probes: list[str]) -> float:
+    started = time.perf_counter()
+    for probe in probes:
+        probe in container
+    return (time.perf_counter() - started) / len(probes) * 1_000_000
+
+
+def measure(capacity: int, error_rate: float, fill: int, probes: list[str]):
+    bloom = BloomFilter(capacity, error_rate)
+    members = fingerprints(fill)
+    for member in members:
+        bloom.add(member)
+
+    missing = sum(member not in bloom for member in members)
+    false_positives = sum(probe in bloom for probe in probes)
+    return bloom, members, missing, false_positives / len(probes)
+
+
+def main(args: argparse.Namespace) -> int:
+    probes = fingerprints(args.probes)
+    failures = []
+    print(
+        f"{'target':>8} {'fill':>9} {'observed':>9} {'estimated':>9} "
+        f"{'bytes':>10} {'k':>3} {'bloom us':>9} {'set bytes':>11} {'set us':>7}"
+    )
+
+    for error_rate in args.error_rates:
+        for ratio in (1, args.overfill):
+            fill = int(args.capacity * ratio)
+            bloom, members, missing, observed = measure(
+                args.capacity, error_rate, fill, probes
+            )
+            members_set = set(members)
+            stats = bloom.stats()
+            print(
+                f"{error_rate:8.4%} {fill:9d} {observed:9.4%} "
+                f"{stats['estimated_error_rate']:9.4%} {stats['bytes']:10d} "
+                f"{stats['hash_count']:3d} {lookup_us(bloom, probes):9.2f} "
+                f"{set_bytes(members_set):11d} {lookup_us(members_set, probes):7.2f}"
+            )
+
+            if missing:
+                failures.append(f"{missing} inserted items reported missing")
+            if ratio == 1 and observed > error_rate * 2:
+                failures.append(
+                    f"observed {observed:.4%} false positives for a {error_rate:.4%} target"
+                )
+
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    if failures:
+        return 1
+    print("OK")
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--capacity", type=int, default=100000)
+    parser.add_argument("--probes", type=int, default=200000)
+    parser.add_argument(
+        "--error-rates", type=float, nargs="+", default=[0.01, 0.001, 0.0001]
+    )
+    parser.add_argument("--overfill", type=float, default=2.0)
+    sys.exit(main(parser.parse_args()))
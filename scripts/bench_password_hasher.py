@@ -0,0 +1,147 @@
+"""
+bcrypt를 이벤트 루프에서 직접 돌릴 때와 PasswordHasher 프로세스 풀에서 돌릴 때를 비교합니다.
+DB/Redis 없이 실행되며, 기대한 동작과 다르면 종료 코드 1로 끝납니다.
+
+    python -m scripts.bench_password_hasher --logins 20
+
+- 이벤트 루프 지연: 10ms마다 깨어나는 작업을 돌리면서 --logins 개의 비밀번호 검증을 동시에
+  실행하고, 그 작업이 늦게 깨어난 최대 시간과 전체 소요 시간을 비교합니다.
+- 큐 포화: max_pending을 넘는 검증을 한꺼번에 보내 초과분이 503(ServiceUnavailableException)으로
+  바로 거절되는지 확인합니다.
+- 재해시: 다른 cost로 만든 해시를 verify_and_update가 BCRYPT_ROUNDS 해시로 바꿔 주는지 확인합니다.
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+
+from passlib.hash import bcrypt
+
+from src.core.config.settings import settings
+from src.core.exceptions.base import ServiceUnavailableException
+from src.services.auth.auth_utils import hash_password, verify_password
+from src.services.auth.password_hasher import PasswordHasher
+
+PASSWORD = "correct horse battery staple"
+TICK = 0.01
+
+
+async def max_loop_lag(logins) -> tuple[float, float]:
+    """
+    logins()를 실행하는 동안 이벤트 루프가 늦게 깨어난 최대 시간과 전체 소요 시간(ms)을 반환합니다.
+    """
+    lag = 0.0
+    done = asyncio.Event()
+
+    async def ticker() -> None:
+        nonlocal lag
+        while not done.is_set():
+            started = time.perf_counter()
+            await asyncio.sleep(TICK)
+            lag = max(lag, time.perf_counter() - started - TICK)
+
+    ticking = asyncio.create_task(ticker())
+    await asyncio.sleep(0)
+    started = time.perf_counter()
+    await logins()
+    elapsed = time.perf_counter() - started
+    done.set()
+    await ticking
+    return lag * 1000, elapsed * 1000
+
+
+async def check(args: argparse.Namespace) -> list[str]:
+    failures = []
+    hashed = hash_password(PASSWORD)
+
+    async def inline() -> None:
+        async def one() -> None:
+            # 예전 방식: 코루틴 안에서 bcrypt를 그대로 호출
+            verify_password(PASSWORD, hashed)
+
+        await asyncio.gather(*(one() for _ in range(args.logins)))
+
+    hasher = PasswordHasher(workers=args.workers, max_pending=args.logins)
+    hasher.start()
+    try:
+        await hasher.verify(PASSWORD, hashed)  # 워커 프로세스 기동 비용 제외
+
+        async def pooled() -> None:
+            await asyncio.gather(
+                *(hasher.verify(PASSWORD, hashed) for _ in range(args.logins))
+            )
+
+        inline_lag, inline_elapsed = await max_loop_lag(inline)
+        pooled_lag, pooled_elapsed = await max_loop_lag(pooled)
+        print(
+            f"{args.logins} concurrent verifies at {settings.BCRYPT_ROUNDS} rounds:\n"
+            f"  inline  max loop lag {inline_lag:8.1f} ms  total {inline_elapsed:8.1f} ms\n"
+            f"  pool    max loop lag {pooled_lag:8.1f} ms  total {pooled_elapsed:8.1f} ms"
+            f"  ({args.workers} workers)"
+        )
+        if pooled_lag >= inline_lag:
+            failures.append("the process pool did not reduce event loop lag")
+    finally:
+        hasher.shutdown()
+
+    # 큐 포화: max_pending 개까지만 받고 나머지는 바로 503
+    hasher = PasswordHasher(workers=args.workers, max_pending=args.max_pending)
+    hasher.start()
+    try:
+        results = await asyncio.gather(
+            *(hasher.verify(PASSWORD, hashed) for _ in range(args.max_pending * 2)),
+            return_exceptions=True,
+        )
+    finally:
+        hasher.shutdown()
+    rejected = sum(isinstance(r, ServiceUnavailableException) for r in results)
+    print(
+        f"{args.max_pending * 2} verifies with max_pending={args.max_pending}: "
+        f"{rejected} rejected, stats={hasher.stats()}"
+    )
+    if rejected != args.max_pending:
+        failures.append(f"expected {args.max_pending} rejections, got {rejected}")
+
+    # 재해시: 다른 cost의 해시는 검증 성공 시 새 해시가 돌아와야 합니다.
+    old_rounds = max(4, settings.BCRYPT_ROUNDS - 2)
+    old_hash = bcrypt.using(rounds=old_rounds).hash(PASSWORD)
+    hasher = PasswordHasher(workers=1, max_pending=4)
+    try:
+        verified, new_hash = await hasher.verify_and_update(PASSWORD, old_hash)
+        print(
+            f"rehash {old_rounds} -> {settings.BCRYPT_ROUNDS} rounds: "
+            f"verified={verified} new_hash={new_hash is not None}"
+        )
+        if not verified or new_hash is None:
+            failures.append("an outdated hash was not rehashed")
+        elif bcrypt.from_string(new_hash).rounds != settings.BCRYPT_ROUNDS:
+            failures.append("the rehash did not use BCRYPT_ROUNDS")
+        else:
+            verified, again = await hasher.verify_and_update(PASSWORD, new_hash)
+            if not verified or again is not None:
+                failures.append("a current hash was rehashed again")
+    finally:
+        hasher.shutdown()
+
+    return failures
+
+
+def main(args: argparse.Namespace) -> int:
+    failures = asyncio.run(check(args))
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    if failures:
+        return 1
+    print("OK")
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--logins", type=int, default=20)
+    parser.add_argument("--workers", type=int, default=settings.PASSWORD_HASH_WORKERS)
+    parser.add_argument(
+        "--max-pending", type=int, default=settings.PASSWORD_HASH_MAX_PENDING
+    )
+    sys.exit(main(parser.parse_args()))
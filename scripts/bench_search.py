@@ -0,0 +1,121 @@
+"""
+키워드 검색(POST /articles/search 의 q) 벤치마크입니다. 개발용 DB에서 실행합니다.
+
+    python -m scripts.bench_search --seed 1000000 --queries 200
+
+- --seed N: 임의의 단어로 된 게시글 N개를 generate_series로 한 번에 넣고 search_vector를 채웁니다.
+  (bench 사용자 하나를 만들어 작성자로 씁니다. 이미 채웠다면 생략)
+- 자주/보통/드물게 나오는 단어마다 첫 페이지, skip 페이지, 커서 다음 페이지의 지연 시간
+  (p50/p95, ms)을 재고, EXPLAIN으로 GIN 인덱스(Bitmap Index Scan) 사용 여부를 출력합니다.
+"""
+
+import argparse
+import asyncio
+import time
+
+from src.api.v1.articles.article_repository import ArticleRepository, SearchParams
+from src.core.config.settings import settings
+from src.core.database.connection import prisma_connection
+
+# 앞쪽 단어일수록 자주 나오도록 뽑습니다. (power(random(), 3))
+VOCABULARY = [
+    "python", "database", "index", "cache", "redis", "postgres", "async", "query",
+    "latency", "search", "backend", "deploy", "kernel", "compiler", "network",
+    "storage", "bloom", "cursor", "vacuum", "replica", "sharding", "tsvector",
+    "zeppelin", "quasar", "obsidian", "marmalade",
+]  # fmt: skip
+
+QUERIES = {"frequent": "python", "medium": "vacuum replica", "rare": "marmalade"}
+
+
+async def seed(count: int) -> None:
+    prisma = prisma_connection.prisma
+    user = await prisma.user.upsert(
+        where={"email": "bench@example.com"},
+        data={
+            "create": {
+                "username": "bench",
+                "email": "bench@example.com",
+                "hashedpassword": "-",
+            },
+            "update": {},
+        },
+    )
+    words = ", ".join(f"'{word}'" for word in VOCABULARY)
+    pick = f"(ARRAY[{words}])[1 + floor(power(random(), 3) * {len(VOCABULARY)})::int]"
+    started = time.perf_counter()
+    await prisma.execute_raw(
+        f"""
+        INSERT INTO "article" ("title", "content", "user_id", "created_at", "updated_at")
+        SELECT {pick} || ' ' || {pick},
+               -- g를 참조해야 본문이 행마다 새로 만들어집니다.
+               (SELECT string_agg({pick}, ' ') FROM generate_series(1, 60) w
+                WHERE g > 0),
+               $1, now(), now()
+        FROM generate_series(1, $2) g
+        """,
+        user.id,
+        count,
+    )
+    await ArticleRepository().refresh_search_vector()
+    await prisma.execute_raw('ANALYZE "article"')
+    print(f"seeded {count} articles in {time.perf_counter() - started:.1f}s")
+
+
+async def timed(repository: ArticleRepository, params: SearchParams, runs: int):
+    samples = []
+    next_cursor = None
+    for _ in range(runs):
+        started = time.perf_counter()
+        _, next_cursor = await repository.full_text_search(params)
+        samples.append((time.perf_counter() - started) * 1000)
+    samples.sort()
+    return (
+        samples[len(samples) // 2],
+        samples[int(len(samples) * 0.95) - 1],
+        next_cursor,
+    )
+
+
+async def main(args: argparse.Namespace) -> None:
+    await prisma_connection.connect()
+    try:
+        if args.seed:
+            await seed(args.seed)
+
+        total = await prisma_connection.prisma.article.count()
+        print(f"articles: {total}, text search config: {settings.SEARCH_TEXT_CONFIG}")
+        repository = ArticleRepository()
+
+        for label, q in QUERIES.items():
+            first = SearchParams(q=q, limit=20, with_files=False)
+            p50, p95, cursor = await timed(repository, first, args.queries)
+            print(f"{label:8} {q!r:18} first page   p50={p50:7.2f} p95={p95:7.2f}")
+
+            skipped = SearchParams(q=q, limit=20, skip=200, with_files=False)
+            p50, p95, _ = await timed(repository, skipped, args.queries)
+            print(f"{label:8} {q!r:18} skip=200     p50={p50:7.2f} p95={p95:7.2f}")
+
+            if cursor:
+                following = SearchParams(q=q, limit=20, cursor=cursor, with_files=False)
+                p50, p95, _ = await timed(repository, following, args.queries)
+                print(f"{label:8} {q!r:18} cursor page  p50={p50:7.2f} p95={p95:7.2f}")
+
+        plan = await prisma_connection.prisma.query_raw(
+            """
+            EXPLAIN SELECT "id" FROM "article"
+            WHERE "search_vector" @@ websearch_to_tsquery($1::regconfig, $2)
+            """,
+            settings.SEARCH_TEXT_CONFIG,
+            QUERIES["rare"],
+        )
+        print("\n".join(row["QUERY PLAN"] for row in plan))
+    finally:
+        await prisma_connection.disconnect()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--seed", type=int, default=0, help="insert N articles first")
+    parser.add_argument("--queries", type=int, default=100, help="runs per query")
+    asyncio.run(main(parser.parse_args()))
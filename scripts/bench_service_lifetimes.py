@@ -0,0 +1,100 @@
+"""
+요청마다 서비스를 만들던 방식과 앱 수명 동안 공유하는 ServiceContainer를 비교하는 벤치마크입니다.
+
+    python -m scripts.bench_service_lifetimes --requests 200
+    python -m scripts.bench_service_lifetimes --url http://localhost:8000 --requests 2000
+
+- 기본: GET /articles/?limit=30 한 번이 예전에 만들던 객체(ArticleService() 와 그 안의
+  FileService()/boto3 클라이언트, 그리고 게시글마다 만들던 FileService() 30개)와 컨테이너에서
+  꺼내 쓰는 경우의 요청당 시간과 메모리 할당(tracemalloc)을 비교합니다. DB/S3 연결은 필요 없습니다.
+- --url: 실행 중인 서버에 GET /api/v1/articles/?limit=30 을 보내 p50/p95와 처리량을 잽니다.
+  변경 전후 커밋에서 각각 실행해 비교합니다.
+"""
+
+import argparse
+import asyncio
+import time
+import tracemalloc
+
+import httpx
+
+from src.api.v1.articles.article_service import ArticleService
+from src.api.v1.dependencies import build_container
+from src.api.v1.files.file_service import FileService
+
+PAGE_SIZE = 30
+
+
+def per_request_services() -> None:
+    ArticleService()
+    for _ in range(PAGE_SIZE):
+        FileService()
+
+
+def shared_services(container) -> None:
+    container.article_service
+    container.file_service
+
+
+def measure(label: str, func, requests: int) -> None:
+    func()  # import와 최초 로딩 비용 제외
+    started = time.perf_counter()
+    for _ in range(requests):
+        func()
+    elapsed = time.perf_counter() - started
+
+    # 요청 한 번 동안 새로 할당된 메모리의 최대치
+    tracemalloc.start()
+    func()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    print(
+        f"{label:12} {elapsed / requests * 1000:9.3f} ms/request  "
+        f"{peak / 1024:9.1f} KiB allocated/request"
+    )
+
+
+async def load(url: str, requests: int, concurrency: int) -> None:
+    samples: list[float] = []
+    semaphore = asyncio.Semaphore(concurrency)
+    async with httpx.AsyncClient(base_url=url, timeout=30) as client:
+
+        async def one() -> None:
+            async with semaphore:
+                started = time.perf_counter()
+                response = await client.get("/api/v1/articles/", params={"limit": 30})
+                response.raise_for_status()
+                samples.append((time.perf_counter() - started) * 1000)
+
+        started = time.perf_counter()
+        await asyncio.gather(*(one() for _ in range(requests)))
+        elapsed = time.perf_counter() - started
+
+    samples.sort()
+    print(
+        f"GET /articles/?limit=30 x{requests}: "
+        f"p50={samples[len(samples) // 2]:.2f}ms "
+        f"p95={samples[int(len(samples) * 0.95) - 1]:.2f}ms "
+        f"{requests / elapsed:.1f} req/s"
+    )
+
+
+def main(args: argparse.Namespace) -> None:
+    if args.url:
+        asyncio.run(load(args.url, args.requests, args.concurrency))
+        return
+
+    container = build_container()
+    try:
+        measure("per-request", per_request_services, args.requests)
+        measure("container", lambda: shared_services(container), args.requests)
+    finally:
+        container.close()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=200)
+    parser.add_argument("--url", help="measure a running server instead")
+    parser.add_argument("--concurrency", type=int, default=20)
+    main(parser.parse_args())
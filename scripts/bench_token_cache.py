@@ -0,0 +1,95 @@
+"""
+인증된 요청마다 JWT를 다시 검증하던 방식과 검증된 payload 캐시(token_cache)의 CPU 시간을 비교합니다.
+DB/Redis 없이 실행되며, 캐시가 다른 결과를 내거나 위조 토큰을 통과시키면 종료 코드 1로 끝납니다.
+
+    python -m scripts.bench_token_cache --requests 10000 --users 100
+
+- --users 명의 토큰을 만들고, --requests 번의 verify_access_token 호출을 토큰들에 고르게
+  나눠 보냅니다. 캐시를 매번 비운 경우(= 매 요청 jwt.decode)와 캐시를 쓰는 경우의
+  요청당 CPU 시간(time.process_time)을 비교합니다.
+- 캐시된 payload가 jwt.decode 결과와 같은지, 캐시된 토큰의 서명만 바꾼 토큰이 거절되는지 확인합니다.
+"""
+
+import argparse
+import asyncio
+import sys
+import time
+
+from fastapi import HTTPException
+from jose import jwt
+
+from src.api.v1.auth.auth_service import AuthService
+
+
+async def cpu_ms_per_request(
+    service: AuthService, tokens: list[str], requests: int, cached: bool
+) -> float:
+    service.token_cache.clear()
+    started = time.process_time()
+    for index in range(requests):
+        if not cached:
+            service.token_cache.clear()
+        await service.verify_access_token(tokens[index % len(tokens)])
+    return (time.process_time() - started) / requests * 1000
+
+
+async def check(args: argparse.Namespace) -> list[str]:
+    service = AuthService()
+    tokens = [
+        service.create_access_token({"user_email": f"bench-{index}@example.com"})
+        for index in range(args.users)
+    ]
+    failures = []
+
+    uncached = await cpu_ms_per_request(service, tokens, args.requests, cached=False)
+    cached = await cpu_ms_per_request(service, tokens, args.requests, cached=True)
+    print(
+        f"{args.requests} verifications over {args.users} tokens "
+        f"({service.jwt_algorithm}):\n"
+        f"  jwt.decode every time {uncached * 1000:8.1f} us/request CPU\n"
+        f"  token_cache           {cached * 1000:8.1f} us/request CPU "
+        f"({uncached / cached:.1f}x)\n"
+        f"  cache stats: {service.token_cache.stats()}"
+    )
+
+    # 캐시 결과가 매번 검증한 결과와 같아야 합니다.
+    for token in tokens:
+        _, payload = await service.verify_access_token(token)
+        decoded = jwt.decode(
+            token,
+            service.secretkey,
+            algorithms=[service.jwt_algorithm],
+            audience="blog-app-users",
+            issuer="blog-app",
+        )
+        if payload != decoded:
+            failures.append("a cached payload differs from jwt.decode")
+            break
+
+    # 서명이 다른 토큰은 캐시 키(토큰 전체 digest)가 달라 다시 검증되고 거절돼야 합니다.
+    header, body, signature = tokens[0].split(".")
+    forged = f"{header}.{body}.{signature[::-1]}"
+    try:
+        await service.verify_access_token(forged)
+        failures.append("a token with a forged signature was accepted")
+    except HTTPException:
+        pass
+
+    return failures
+
+
+def main(args: argparse.Namespace) -> int:
+    failures = asyncio.run(check(args))
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    if failures:
+        return 1
+    print("OK")
+    return 0
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--requests", type=int, default=10000)
+    parser.add_argument("--users", type=int, default=100)
+    sys.exit(main(parser.parse_args()))
@@ -0,0 +1,172 @@
+"""
+presigned POST 직접 업로드 흐름(upload-intent -> S3 POST -> complete)을 moto S3로 확인합니다.
+실제 AWS나 DB 없이 실행되며, 실패하면 종료 코드 1로 끝납니다.
+
+    pip install "moto[s3]"
+    python -m scripts.check_direct_upload
+
+- FileService는 그대로 쓰고, DB 리포지토리만 메모리 구현으로 바꿉니다.
+- 확인 항목: 발급된 폼 필드로 올린 객체를 complete가 head_object로 확인해 ready로 바꾸는지,
+  올리지 않은 파일은 complete가 거절하는지, 오래된 pending 업로드 정리가 객체까지 지우는지.
+"""
+
+import asyncio
+import os
+import sys
+from datetime import datetime, timedelta, timezone
+from types import SimpleNamespace
+
+for name, value in {
+    "AWS_ACCESS_KEY_ID": "testing",
+    "AWS_SECRET_ACCESS_KEY": "testing",
+    "AWS_S3_BUCKET_NAME": "direct-upload-check",
+    "AWS_S3_REGION": "us-east-1",
+}.items():
+    os.environ.setdefault(name, value)
+
+import requests  # noqa: E402
+from moto import mock_aws  # noqa: E402
+
+from src.api.v1.files import file_service as file_service_module  # noqa: E402
+from src.api.v1.files.file_repository import (  # noqa: E402
+    FILE_STATUS_PENDING,
+    FILE_STATUS_READY,
+    FileData,
+)
+from src.core.config.settings import settings  # noqa: E402
+from src.core.exceptions.base import BadRequestException  # noqa: E402
+from src.schemas.request import FileUploadIntentRequest  # noqa: E402
+from src.services.s3.base_s3_service import create_s3_client  # noqa: E402
+
+USER_ID = 1
+ARTICLE_ID = 1
+
+
+class MemoryFileRepository:
+    def __init__(self):
+        self.files: dict[int, tuple[FileData, datetime]] = {}
+
+    async def create_pending(self, file: FileData):
+        id = len(self.files) + 1
+        file.status = FILE_STATUS_PENDING
+        self.files[id] = (file, datetime.now(timezone.utc))
+        return SimpleNamespace(id=id)
+
+    async def get_file(self, id: int) -> FileData | None:
+        return self.files[id][0] if id in self.files else None
+
+    async def mark_ready(self, id: int, size: int, mimetype: str):
+        file = self.files[id][0]
+        file.size, file.mimetype, file.status = size, mimetype, FILE_STATUS_READY
+
+    async def delete_stale_pending(self, created_before: datetime, limit: int):
+        expired = [
+            (id, file.path)
+            for id, (file, created_at) in self.files.items()
+            if file.status == FILE_STATUS_PENDING and created_at < created_before
+        ][:limit]
+        for id, _ in expired:
+            del self.files[id]
+        return expired
+
+
+class MemoryArticleRepository:
+    async def find_by_id(self, article_id: int):
+        return SimpleNamespace(id=article_id, user_id=USER_ID)
+
+    async def touch(self, article_id: int):
+        pass
+
+
+async def no_op(*args):
+    pass
+
+
+def post(intent, body: bytes, content_type: str) -> int:
+    response = requests.post(
+        intent.url,
+        data=intent.fields,
+        files={"file": ("upload", body, content_type)},
+    )
+    return response.status_code
+
+
+async def check() -> list[str]:
+    # Redis 없이 실행하도록 게시글 캐시 무효화만 끕니다.
+    file_service_module.article_cache = SimpleNamespace(invalidate=no_op)
+    s3_client = create_s3_client()
+    s3_client.create_bucket(Bucket=settings.AWS_S3_BUCKET_NAME)
+    service = file_service_module.FileService(
+        s3_client=s3_client,
+        file_repository=MemoryFileRepository(),
+        article_repository=MemoryArticleRepository(),
+    )
+    user = SimpleNamespace(id=USER_ID)
+    failures = []
+
+    # 1. 발급 -> 직접 업로드 -> complete
+    body = b"\x89PNG" + b"0" * 2048
+    intent = await service.create_upload_intent(
+        USER_ID,
+        FileUploadIntentRequest(
+            article_id=ARTICLE_ID, filename="a.png", content_type="image/png"
+        ),
+    )
+    status = post(intent, body, "image/png")
+    if status not in (200, 201, 204):
+        failures.append(f"presigned POST returned {status}")
+    completed = await service.complete_upload(intent.file_id, user)
+    if completed.size != len(body):
+        failures.append(f"complete recorded size {completed.size}, not {len(body)}")
+    stored = await service.file_repository.get_file(intent.file_id)
+    if stored.status != FILE_STATUS_READY:
+        failures.append("completed file is not ready")
+
+    # 2. 올리지 않고 complete
+    missing = await service.create_upload_intent(
+        USER_ID,
+        FileUploadIntentRequest(
+            article_id=ARTICLE_ID, filename="b.png", content_type="image/png"
+        ),
+    )
+    try:
+        await service.complete_upload(missing.file_id, user)
+        failures.append("complete accepted an upload that never happened")
+    except BadRequestException:
+        pass
+
+    # 3. 올렸지만 complete하지 않은 업로드 정리
+    abandoned = await service.create_upload_intent(
+        USER_ID,
+        FileUploadIntentRequest(
+            article_id=ARTICLE_ID, filename="c.png", content_type="image/png"
+        ),
+    )
+    post(abandoned, body, "image/png")
+    key = (await service.file_repository.get_file(abandoned.file_id)).path
+    expired = await service.expire_pending_uploads(
+        datetime.now(timezone.utc) + timedelta(seconds=1), limit=100
+    )
+    if expired != 2:
+        failures.append(f"expired {expired} pending uploads, expected 2")
+    if await service.head_file(key) is not None:
+        failures.append("expired upload's S3 object was not deleted")
+    if await service.file_repository.get_file(intent.file_id) is None:
+        failures.append("a completed upload was expired")
+
+    return failures
+
+
+def main() -> int:
+    with mock_aws():
+        failures = asyncio.run(check())
+    for failure in failures:
+        print(f"FAIL: {failure}")
+    if failures:
+        return 1
+    print("OK")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,94 @@
+"""
+좋아요 토글을 동시에 쏟아부은 뒤 article.likes_count가 like 행 수와 정확히 같은지 확인합니다.
+개발용 DB에서 실행하며, 어긋나면 종료 코드 1로 끝납니다.
+
+    python -m scripts.check_like_concurrency --users 50 --toggles 2000 --concurrency 200
+
+- 게시글 하나와 사용자 --users 명을 만들고, 임의의 사용자가 좋아요/취소를 --toggles 번
+  (최대 --concurrency 개씩 동시에) 실행합니다. 같은 사용자의 좋아요/취소가 서로 겹치도록
+  사용자 수를 동시 실행 수보다 적게 두는 것이 좋습니다.
+- LikeRepository.add/remove를 직접 호출하므로 Redis나 like_buffer와 무관하게 DB 문장만 검증합니다.
+"""
+
+import argparse
+import asyncio
+import random
+import sys
+import uuid
+
+from src.api.v1.likes.like_repository import LikeRepository
+from src.core.database.connection import prisma_connection
+
+
+async def setup(users: int) -> tuple[int, list[int]]:
+    prisma = prisma_connection.prisma
+    run = uuid.uuid4().hex[:8]
+    user_ids = []
+    for index in range(users):
+        user = await prisma.user.create(
+            data={
+                "username": f"like-check-{run}-{index}",
+                "email": f"like-check-{run}-{index}@example.com",
+                "hashedpassword": "-",
+            }
+        )
+        user_ids.append(user.id)
+    article = await prisma.article.create(
+        data={"title": "like check", "content": run, "user_id": user_ids[0]}
+    )
+    return article.id, user_ids
+
+
+async def hammer(article_id: int, user_ids: list[int], toggles: int, concurrency: int):
+    repository = LikeRepository()
+    semaphore = asyncio.Semaphore(concurrency)
+    changed = 0
+
+    async def toggle() -> None:
+        nonlocal changed
+        user_id = random.choice(user_ids)
+        async with semaphore:
+            if random.random() < 0.5:
+                result = await repository.add(article_id=article_id, user_id=user_id)
+            else:
+                result = await repository.remove(article_id=article_id, user_id=user_id)
+        changed += result.changed
+
+    await asyncio.gather(*(toggle() for _ in range(toggles)))
+    return changed
+
+
+async def main(args: argparse.Namespace) -> int:
+    await prisma_connection.connect()
+    prisma = prisma_connection.prisma
+    try:
+        article_id, user_ids = await setup(args.users)
+        changed = await hammer(article_id, user_ids, args.toggles, args.concurrency)
+
+        article = await prisma.article.find_unique(where={"id": article_id})
+        rows = await prisma.like.count(where={"article_id": article_id})
+        print(
+            f"toggles={args.toggles} changed={changed} "
+            f"likes_count={article.likes_count} like_rows={rows}"
+        )
+
+        if not args.keep:
+            await prisma.article.delete(where={"id": article_id})
+            await prisma.user.delete_many(where={"id": {"in": user_ids}})
+
+        if article.likes_count != rows:
+            print("FAIL: likes_count drifted from the like rows")
+            return 1
+        print("OK")
+        return 0
+    finally:
+        await prisma_connection.disconnect()
+
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[1])
+    parser.add_argument("--users", type=int, default=50)
+    parser.add_argument("--toggles", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=200)
+    parser.add_argument("--keep", action="store_true", help="keep the test rows")
+    sys.exit(asyncio.run(main(parser.parse_args())))
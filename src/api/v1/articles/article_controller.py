@@ -1,10 +1,29 @@
-from fastapi import APIRouter, status, Depends, UploadFile, Query, Form, File, Path
+from fastapi import (
+    APIRouter,
+    status,
+    Depends,
+    UploadFile,
+    Query,
+    Form,
+    File,
+    Path,
+    Request,
+    Response,
+)
 
 from src.schemas.request import ArticleUpdate, ArticleSearch
-from src.schemas.response import ArticleResponse, User, UserRole
+from src.schemas.response import (
+    ArticleResponse,
+    ArticleSearchResponse,
+    User,
+    UserRole,
+)
 from src.api.v1.articles.article_service import ArticleService
+from src.api.v1.dependencies import get_article_service
 from src.api.v1.auth.auth_service import get_current_user
 from src.api.v1.auth.role_dependency import require_minimum_role
+from src.core.database.cursor import NEXT_CURSOR_HEADER
+from src.core.http.conditional import conditional_get, latest
 
 
 router = APIRouter(prefix="/articles", tags=["Articles"])
@@ -12,13 +31,27 @@ router = APIRouter(prefix="/articles", tags=["Articles"])
 
 @router.get("/", status_code=status.HTTP_200_OK)
 async def get_articles_handler(
+    request: Request,
+    response: Response,
     skip: int = Query(0, ge=0),
     limit: int = Query(10, ge=1, le=30),
-    article_service: ArticleService = Depends(),
+    cursor: str | None = Query(None, description="Value of X-Next-Cursor"),
+    with_files: bool = Query(True, description="Include file metadata"),
+    article_service: ArticleService = Depends(get_article_service),
     current_user: User | None = Depends(get_current_user),
 ) -> list[ArticleResponse]:
 
-    articles = await article_service.find_many(skip=skip, limit=limit)
+    articles, next_cursor = await article_service.find_many(
+        skip=skip, limit=limit, cursor=cursor, with_files=with_files
+    )
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+
+    not_modified = conditional_get(
+        request, response, map(ArticleService.validator, articles)
+    )
+    if not_modified:
+        return not_modified
 
     return articles
 
@@ -26,12 +59,23 @@ async def get_articles_handler(
 @router.get("/{article_id}", status_code=status.HTTP_200_OK)
 async def get_article_handler(
     article_id: int,
-    article_service: ArticleService = Depends(),
+    request: Request,
+    response: Response,
+    article_service: ArticleService = Depends(get_article_service),
     current_user: User | None = Depends(get_current_user),
 ) -> ArticleResponse:
 
     article = await article_service.find_by_id(article_id=article_id)
 
+    not_modified = conditional_get(
+        request,
+        response,
+        ArticleService.validator(article),
+        last_modified=latest([article.updated_at]),
+    )
+    if not_modified:
+        return not_modified
+
     return article
 
 
@@ -41,7 +85,7 @@ async def create_article_handler(
     content: str = Form(...),
     select_categories: str = Form(...),
     files: list[UploadFile] = File(None),
-    article_service: ArticleService = Depends(),
+    article_service: ArticleService = Depends(get_article_service),
     authorized_user: User = Depends(require_minimum_role(UserRole.AUTHOR)),
 ) -> ArticleResponse:
 
@@ -65,7 +109,7 @@ async def create_article_handler(
 async def update_article_handler(
     article_id: int,
     update_article: ArticleUpdate,
-    article_service: ArticleService = Depends(),
+    article_service: ArticleService = Depends(get_article_service),
     current_user: User = Depends(get_current_user),
 ) -> ArticleResponse:
 
@@ -80,7 +124,7 @@ async def update_article_handler(
 @router.delete("/{id}", status_code=status.HTTP_204_NO_CONTENT)
 async def delete_article_handler(
     id: int = Path(...),
-    article_service: ArticleService = Depends(),
+    article_service: ArticleService = Depends(get_article_service),
     current_user: User = Depends(get_current_user),
 ) -> None:
 
@@ -91,10 +135,13 @@ async def delete_article_handler(
 @router.post("/search", status_code=status.HTTP_200_OK)
 async def search_articles_handler(
     search_params: ArticleSearch,
-    article_service: ArticleService = Depends(),
+    response: Response,
+    article_service: ArticleService = Depends(get_article_service),
     current_user: User | None = Depends(get_current_user),
-) -> list[ArticleResponse]:
+) -> list[ArticleSearchResponse]:
 
-    articles = await article_service.search(search_params)
+    articles, next_cursor = await article_service.search(search_params)
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
 
     return articles
@@ -1,9 +1,54 @@
 from datetime import date, datetime, timedelta, timezone
 from dataclasses import dataclass
 
+from src.core.config.settings import settings
 from src.core.database.base_repo import BaseRepository
+from src.core.database.cursor import decode_cursor, encode_cursor, keyset_where
 from src.core.exceptions.base import NotFoundException
 
+FILE_STATUS_READY = "ready"
+
+# (created_at, id) 복합 인덱스와 같은 순서로 정렬해야 keyset 페이지네이션이 안정적입니다.
+ARTICLE_ORDER = [{"created_at": "desc"}, {"id": "desc"}]
+
+
+def article_include(with_files: bool = True) -> dict:
+    """
+    ArticleResponse를 만드는 데 필요한 관계만 포함합니다.
+    좋아요 수는 likes_count 컬럼을 사용하므로 likes 관계는 불러오지 않습니다.
+    """
+    include = {"categories": {"include": {"category": True}}}
+    if with_files:
+        # 업로드가 끝나지 않은(pending) 파일은 노출하지 않습니다.
+        include["files"] = {"where": {"status": FILE_STATUS_READY}}
+    return include
+
+
+def day_range(day: date) -> tuple[datetime, datetime]:
+    """
+    하루 단위 검색을 위한 [시작, 끝) UTC 범위를 반환합니다.
+    """
+    start_datetime = datetime.combine(day, datetime.min.time()).replace(
+        tzinfo=timezone.utc
+    )
+    return start_datetime, start_datetime + timedelta(days=1)
+
+
+# title(A) 가중치가 content(B)보다 높도록 search_vector를 구성합니다.
+SEARCH_VECTOR_SQL = """
+    setweight(to_tsvector($1::regconfig, coalesce("title", '')), 'A') ||
+    setweight(to_tsvector($1::regconfig, coalesce("content", '')), 'B')
+"""
+
+HEADLINE_OPTIONS = (
+    "MaxFragments=2, MaxWords=20, MinWords=5, StartSel=<mark>, StopSel=</mark>"
+)
+
+# 본문의 HTML을 먼저 escape해서, 발췌에는 강조용 <mark> 태그만 남도록 합니다.
+ESCAPED_CONTENT_SQL = """
+    replace(replace(replace(a."content", '&', '&amp;'), '<', '&lt;'), '>', '&gt;')
+"""
+
 
 @dataclass
 class UpdateParams:
@@ -27,26 +72,33 @@ class SearchParams:
     updated_date: date | None = None
     skip: int = 0
     limit: int = 10
+    cursor: str | None = None
+    with_files: bool = True
+    q: str | None = None
 
 
 class ArticleRepository(BaseRepository):
     def __init__(self):
         super().__init__("article")
 
-    async def find_many(self, skip: int, limit: int):
+    async def find_many(
+        self,
+        skip: int,
+        limit: int,
+        cursor: str | None = None,
+        with_files: bool = True,
+    ):
         """
         여러 게시글을 조회합니다.
+        cursor가 주어지면 skip 대신 (created_at, id) 기준 keyset 페이지네이션을 사용합니다.
+        with_files=False 이면 파일 관계를 불러오지 않습니다.
         """
         return await super().find_many(
-            skip=skip,
+            where=keyset_where(cursor),
+            skip=None if cursor else skip,
             take=limit,
-            order={"created_at": "desc"},
-            include={
-                "user": True,
-                "categories": {"include": {"category": True}},
-                "likes": True,
-                "files": True,
-            },
+            order=ARTICLE_ORDER,
+            include=article_include(with_files=with_files),
         )
 
     async def find_by_id(self, article_id: int):
@@ -55,55 +107,116 @@ class ArticleRepository(BaseRepository):
         """
         article = await super().find_unique(
             where={"id": article_id},
-            include={
-                "user": True,
-                "categories": {"include": {"category": True}},
-                "likes": True,
-                "files": True,
-            },
+            include=article_include(),
         )
 
         if not article:
             raise NotFoundException(name=f"Article with id {article_id}")
         return article
 
-    async def increment_view_count(self, article_id: int):
+    async def add_views(self, deltas: dict[int, int]) -> int:
         """
-        게시글 조회수를 증가시킵니다.
+        여러 게시글의 조회수를 한 번의 UPDATE로 증가시킵니다.
+        deltas는 {article_id: 증가량} 형태입니다.
         """
-        return await super().update(
-            where={"id": article_id},
-            data={"views": {"increment": 1}},
-            include={
-                "user": True,
-                "categories": {"include": {"category": True}},
-                "likes": True,
-            },
+        if not deltas:
+            return 0
+
+        # 키와 값 모두 내부 집계기에서 만든 정수이므로 VALUES 목록에 직접 넣습니다.
+        values = ", ".join(
+            f"({int(article_id)}, {int(count)})" for article_id, count in deltas.items()
+        )
+        return await self.prisma.execute_raw(
+            f"""
+            UPDATE "article" AS a
+            SET "views" = a."views" + v.n
+            FROM (VALUES {values}) AS v(id, n)
+            WHERE a."id" = v.id
+            """
         )
 
-    async def increment_likes_count(self, article_id: int):
+    async def get_likes_count(self, article_id: int) -> int:
         """
-        게시글 좋아요 수를 증가시킵니다.
+        게시글의 likes_count 컬럼 값을 조회합니다. (관계는 불러오지 않습니다)
         """
-        return await super().update(
-            where={"id": article_id},
-            data={"likes_count": {"increment": 1}},
-        )
+        article = await super().find_unique(where={"id": article_id})
+        if not article:
+            raise NotFoundException(name=f"Article with id {article_id}")
+        return article.likes_count
 
-    async def decrement_likes_count(self, article_id: int):
+    async def find_drifted_likes_counts(
+        self, after_id: int, limit: int
+    ) -> tuple[int | None, list[int]]:
         """
-        게시글 좋아요 수를 감소시킵니다.
+        id가 after_id보다 큰 게시글 limit개의 likes_count를 like 테이블 집계와 비교합니다.
+        (이 배치의 마지막 id, 값이 다른 게시글 id 목록)을 반환하며, 마지막 배치면 id는 None 입니다.
         """
-        return await super().update(
-            where={"id": article_id},
-            data={"likes_count": {"decrement": 1}},
+        rows = await self.prisma.query_raw(
+            """
+            WITH batch AS (
+                SELECT "id", "likes_count" FROM "article"
+                WHERE "id" > $1
+                ORDER BY "id"
+                LIMIT $2
+            ),
+            counts AS (
+                SELECT "article_id", count(*)::int AS actual FROM "like"
+                WHERE "article_id" IN (SELECT "id" FROM batch)
+                GROUP BY "article_id"
+            )
+            SELECT b."id", b."likes_count" <> COALESCE(c.actual, 0) AS drifted
+            FROM batch b
+            LEFT JOIN counts c ON c."article_id" = b."id"
+            ORDER BY b."id"
+            """,
+            after_id,
+            limit,
         )
+        last_id = rows[-1]["id"] if len(rows) == limit else None
+        return last_id, [row["id"] for row in rows if row["drifted"]]
+
+    async def fix_likes_counts(self, article_ids: list[int]) -> list[int]:
+        """
+        게시글들의 likes_count를 like 테이블 기준으로 다시 계산하고, 실제로 바뀐 id를 반환합니다.
+
+        먼저 게시글 행을 잠가 진행 중인 좋아요 토글이 끝나기를 기다린 뒤,
+        새 스냅샷에서 다시 집계하므로 동시에 들어온 토글을 덮어쓰지 않습니다.
+        """
+        if not article_ids:
+            return []
+
+        # 내부에서 조회한 정수 id이므로 목록에 직접 넣습니다.
+        ids = ", ".join(str(int(article_id)) for article_id in article_ids)
+        async with self.prisma.tx() as transaction:
+            await transaction.query_raw(
+                f'SELECT "id" FROM "article" WHERE "id" IN ({ids}) FOR UPDATE'
+            )
+            rows = await transaction.query_raw(
+                f"""
+                WITH counts AS (
+                    SELECT a."id", (
+                        SELECT count(*)::int FROM "like" l WHERE l."article_id" = a."id"
+                    ) AS actual
+                    FROM "article" a
+                    WHERE a."id" IN ({ids})
+                )
+                UPDATE "article" AS a
+                SET "likes_count" = c.actual
+                FROM counts c
+                WHERE a."id" = c."id" AND a."likes_count" <> c.actual
+                RETURNING a."id"
+                """
+            )
+        return [row["id"] for row in rows]
 
-    async def set_likes_count(self, article_id: int, count: int):
+    async def touch(self, article_id: int):
         """
-        게시글 좋아요 수를 설정합니다.
+        게시글의 updated_at을 갱신합니다.
+        첨부 파일처럼 다른 테이블의 변경도 ETag / Last-Modified에 반영되도록 사용합니다.
         """
-        await super().update(where={"id": article_id}, data={"likes_count": count})
+        await super().update(
+            where={"id": article_id}, data={"updated_at": datetime.now(timezone.utc)}
+        )
 
     async def search(self, params: SearchParams):
         """
@@ -116,36 +229,136 @@ class ArticleRepository(BaseRepository):
             filters["user_id"] = params.user_id
 
         if params.created_date is not None:
-            start_datetime = datetime.combine(
-                params.created_date, datetime.min.time()
-            ).replace(tzinfo=timezone.utc)
-            end_datetime = start_datetime + timedelta(days=1)
+            start_datetime, end_datetime = day_range(params.created_date)
             filters["created_at"] = {
                 "gte": start_datetime,
                 "lt": end_datetime,
             }
 
         if params.updated_date is not None:
-            start_datetime = datetime.combine(
-                params.updated_date, datetime.min.time()
-            ).replace(tzinfo=timezone.utc)
-            end_datetime = start_datetime + timedelta(days=1)
+            start_datetime, end_datetime = day_range(params.updated_date)
             filters["updated_at"] = {
                 "gte": start_datetime,
                 "lt": end_datetime,
             }
 
+        if params.cursor:
+            filters = {"AND": [filters, keyset_where(params.cursor)]}
+
         return await super().find_many(
             where=filters,
-            skip=params.skip,
+            skip=None if params.cursor else params.skip,
             take=params.limit,
-            order={"created_at": "desc"},
-            include={
-                "user": True,
-                "categories": {"include": {"category": True}},
-                "likes": True,
-                "files": True,
-            },
+            order=ARTICLE_ORDER,
+            include=article_include(with_files=params.with_files),
+        )
+
+    async def full_text_search(self, params: SearchParams):
+        """
+        search_vector(GIN 인덱스)로 키워드 검색을 수행합니다.
+        관련도 순으로 정렬하며 (rank, id) 커서로 keyset 페이지네이션합니다.
+        커서가 없으면 skip 만큼 건너뜁니다(OFFSET).
+        ((article, rank, snippet) 튜플 목록, 다음 페이지 커서)를 반환하며, snippet은
+        HTML escape된 본문 발췌에 <mark> 태그만 들어 있습니다.
+        커서는 순위를 매긴 마지막 행으로 만드므로, 두 쿼리 사이에 삭제된 게시글이
+        빠져 페이지가 짧아져도 다음 페이지가 이어집니다.
+        """
+        args: list = [settings.SEARCH_TEXT_CONFIG, params.q]
+        conditions = ['a."search_vector" @@ q.query']
+
+        def arg(value) -> str:
+            args.append(value)
+            return f"${len(args)}"
+
+        if params.user_id is not None:
+            conditions.append(f'a."user_id" = {arg(params.user_id)}')
+        if params.category_id is not None:
+            conditions.append(
+                'EXISTS (SELECT 1 FROM "category_to_article" c '
+                'WHERE c."article_id" = a."id" '
+                f'AND c."category_id" = {arg(params.category_id)})'
+            )
+        for column, day in (
+            ("created_at", params.created_date),
+            ("updated_at", params.updated_date),
+        ):
+            if day is not None:
+                start, end = (
+                    value.replace(tzinfo=None).isoformat() for value in day_range(day)
+                )
+                conditions.append(
+                    f'a."{column}" >= {arg(start)}::timestamp '
+                    f'AND a."{column}" < {arg(end)}::timestamp'
+                )
+        if params.cursor:
+            last_rank, last_id = decode_cursor(params.cursor, float, int)
+            conditions.append(
+                '(ts_rank(a."search_vector", q.query)::float8, a."id") < '
+                f"({arg(last_rank)}::float8, {arg(last_id)}::int)"
+            )
+
+        page = f"LIMIT {arg(params.limit)}"
+        if not params.cursor and params.skip:
+            page += f" OFFSET {arg(params.skip)}"
+
+        # 순위와 페이지 자르기를 먼저 하고, 비용이 큰 ts_headline은 잘린 행에만 계산합니다.
+        headline_options = arg(HEADLINE_OPTIONS)
+        hits = await self.prisma.query_raw(
+            f"""
+            WITH q AS (SELECT websearch_to_tsquery($1::regconfig, $2) AS query),
+            ranked AS (
+                SELECT a."id", ts_rank(a."search_vector", q.query)::float8 AS rank
+                FROM "article" a, q
+                WHERE {" AND ".join(conditions)}
+                ORDER BY rank DESC, a."id" DESC
+                {page}
+            )
+            SELECT r."id", r.rank,
+                   ts_headline(
+                       $1::regconfig, {ESCAPED_CONTENT_SQL}, q.query, {headline_options}
+                   ) AS snippet
+            FROM ranked r
+            JOIN "article" a ON a."id" = r."id", q
+            ORDER BY r.rank DESC, r."id" DESC
+            """,
+            *args,
+        )
+        if not hits:
+            return [], None
+
+        next_cursor = None
+        if len(hits) == params.limit:
+            next_cursor = encode_cursor(hits[-1]["rank"], hits[-1]["id"])
+
+        articles = await super().find_many(
+            where={"id": {"in": [hit["id"] for hit in hits]}},
+            include=article_include(with_files=params.with_files),
+        )
+        by_id = {article.id: article for article in articles}
+        results = [
+            (by_id[hit["id"]], hit["rank"], hit["snippet"])
+            for hit in hits
+            if hit["id"] in by_id
+        ]
+        return results, next_cursor
+
+    async def refresh_search_vector(self, article_id: int | None = None, client=None):
+        """
+        게시글의 search_vector를 다시 계산합니다.
+        article_id가 없으면 아직 계산되지 않은 모든 게시글을 채웁니다(backfill).
+        """
+        client = client or self.prisma
+        if article_id is None:
+            return await client.execute_raw(
+                f'UPDATE "article" SET "search_vector" = {SEARCH_VECTOR_SQL} '
+                'WHERE "search_vector" IS NULL',
+                settings.SEARCH_TEXT_CONFIG,
+            )
+        return await client.execute_raw(
+            f'UPDATE "article" SET "search_vector" = {SEARCH_VECTOR_SQL} '
+            'WHERE "id" = $2',
+            settings.SEARCH_TEXT_CONFIG,
+            article_id,
         )
 
     async def create(
@@ -167,12 +380,9 @@ class ArticleRepository(BaseRepository):
                         ],
                     },
                 },
-                include={
-                    "user": True,
-                    "categories": {"include": {"category": True}},
-                    "likes": True,
-                },
+                include=article_include(with_files=False),
             )
+            await self.refresh_search_vector(article.id, client=transaction)
         return article
 
     async def delete(self, article_id: int):
@@ -208,14 +418,12 @@ class ArticleRepository(BaseRepository):
                 ],
             }
 
-        updated_article = await super().update(
-            where={"id": article.id},
-            data=update_data,
-            include={
-                "user": True,
-                "categories": {"include": {"category": True}},
-                "likes": True,
-                "files": True,
-            },
-        )
+        async with self.prisma.tx() as transaction:
+            updated_article = await transaction.article.update(
+                where={"id": article.id},
+                data=update_data,
+                include=article_include(),
+            )
+            if params.title is not None or params.content is not None:
+                await self.refresh_search_vector(article.id, client=transaction)
         return updated_article
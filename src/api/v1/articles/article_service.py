@@ -4,10 +4,20 @@ from src.api.v1.articles.article_repository import (
     SearchParams,
     UpdateParams,
 )
-from src.schemas.response import ArticleResponse, UserRole, User, FileResponse
-from src.api.v1.files.file_service import FileService
+from src.schemas.response import (
+    ArticleResponse,
+    ArticleSearchResponse,
+    UserRole,
+    User,
+    FileResponse,
+)
+from src.api.v1.files.file_service import FileService, get_file_type
 from src.api.v1.likes.like_repository import LikeRepository
+from src.core.database.cursor import next_page_cursor
 from src.core.exceptions.base import PermissionDeniedException
+from src.services.articles.article_cache import article_cache
+from src.services.articles.view_counter import view_counter
+from src.services.likes.like_buffer import like_buffer
 
 
 class ArticleService:
@@ -21,20 +31,42 @@ class ArticleService:
     It also includes a staticmethod for transforming article data into ArticleResponse.
     """
 
-    def __init__(self):
-        self.article_repository = ArticleRepository()
-        self.like_repository = LikeRepository()
-        self.file_service = FileService()
+    def __init__(
+        self,
+        article_repository: ArticleRepository | None = None,
+        like_repository: LikeRepository | None = None,
+        file_service: FileService | None = None,
+    ):
+        self.article_repository = article_repository or ArticleRepository()
+        self.like_repository = like_repository or LikeRepository()
+        self.file_service = file_service or FileService()
 
-    async def find_many(self, skip: int, limit: int):
-        articles = await self.article_repository.find_many(skip=skip, limit=limit)
-        return [self.process_article(article) for article in articles]
+    async def find_many(
+        self,
+        skip: int,
+        limit: int,
+        cursor: str | None = None,
+        with_files: bool = True,
+    ):
+        articles = await self.article_repository.find_many(
+            skip=skip, limit=limit, cursor=cursor, with_files=with_files
+        )
+        results = [self.process_article(article) for article in articles]
+        return results, self.next_cursor(articles, limit)
 
     async def find_by_id(self, article_id: int):
-        article = await self.article_repository.find_by_id(article_id=article_id)
-        # 조회수 증가
-        await self.article_repository.increment_view_count(article_id=article_id)
-        return self.process_article(article)
+        article = await article_cache.get(article_id)
+        if article is None:
+            article = self.process_article(
+                await self.article_repository.find_by_id(article_id=article_id)
+            )
+            await article_cache.set(article)
+
+        # 조회수 증가 (write-behind, 주기적으로 일괄 반영)
+        view_counter.record(article_id)
+        article.views += view_counter.pending(article_id)
+        article.likes_count += like_buffer.pending_delta(article_id)
+        return article
 
     async def search(self, params: SearchParams):
         # Create a SearchParams instance
@@ -45,10 +77,29 @@ class ArticleService:
             updated_date=params.updated_date,
             skip=params.skip,
             limit=params.limit,
+            cursor=params.cursor,
+            with_files=params.with_files,
+            q=params.q,
         )
 
+        if params.q:
+            hits, next_cursor = await self.article_repository.full_text_search(params)
+            results = [
+                ArticleSearchResponse(
+                    **self.process_article(article).model_dump(),
+                    rank=rank,
+                    snippet=snippet,
+                )
+                for article, rank, snippet in hits
+            ]
+            return results, next_cursor
+
         articles = await self.article_repository.search(params)
-        return [self.process_article(article) for article in articles]
+        results = [
+            ArticleSearchResponse(**self.process_article(article).model_dump())
+            for article in articles
+        ]
+        return results, self.next_cursor(articles, params.limit)
 
     async def create(
         self,
@@ -78,6 +129,7 @@ class ArticleService:
                 detail="Only the author can update articles."
             )
         updated_article = await self.article_repository.update(params)
+        await article_cache.invalidate(params.article_id)
         return self.process_article(updated_article)
 
     async def delete(self, article_id: int, current_user: User):
@@ -90,32 +142,45 @@ class ArticleService:
                 detail="Insufficient permissions to delete the article."
             )
 
-        # Fetch associated file IDs
-        file_ids = [file.id for file in article.files]
-        for file_id in file_ids:
-            await self.file_service.delete(id=file_id, current_user=current_user)
+        # 업로드가 끝나지 않은(pending) 파일도 S3 객체까지 함께 삭제합니다.
+        await self.file_service.delete_article_files(article_id)
 
         await self.article_repository.delete(article_id=article_id)
+        await article_cache.invalidate(article_id)
+
+    @staticmethod
+    def validator(article: ArticleResponse) -> tuple:
+        """
+        Values that identify one version of an article response, used for ETags.
+        File changes bump updated_at; views are write-behind and deliberately excluded.
+        """
+        return (article.id, article.updated_at, article.likes_count)
+
+    @staticmethod
+    def next_cursor(articles: list, limit: int) -> str | None:
+        """
+        Build the cursor for the next page from the last (created_at, id) pair.
+        A short page means there is nothing left to fetch.
+        """
+        return next_page_cursor(articles, limit)
 
     @staticmethod
     def process_article(article):
         """
         This method processes article data for ArticleResponse.
-        - Calculate likes_count
         - Extract category IDs
-        - Process file information
-        """
-        # Calculate likes_count
-        article.likes_count = len(article.likes) if article.likes else 0
+        - Process file information (skipped when files were not included)
 
+        likes_count and comments_count come straight from the denormalized
+        article columns.
+        """
         # Extract category IDs
         categories = [item.category.id for item in article.categories]
 
         # Process files
         files = []
-        file_service = FileService()  # FileService 인스턴스 생성
-        for file in article.files:
-            file_type = file_service._get_file_type(file.mimetype)
+        for file in article.files or []:
+            file_type = get_file_type(file.mimetype)
             url = f"/api/v1/files/?id={file.id}"
 
             files.append(
@@ -140,5 +205,6 @@ class ArticleService:
             updated_at=article.updated_at,
             categories=categories,
             likes_count=article.likes_count,
+            comments_count=article.comments_count,
             files=files,
         )
@@ -1,10 +1,11 @@
 import logging
 from fastapi import APIRouter, status, Depends, HTTPException
 from fastapi.security import OAuth2PasswordRequestForm
-from src.services.auth.auth_utils import verify_password
+from src.services.auth.password_hasher import password_hasher
 from src.schemas.request import PasswordUpdateRequest
 from src.schemas.response import JWTResponse, User
 from src.api.v1.users.user_service import UserService
+from src.api.v1.dependencies import get_user_service
 from src.api.v1.auth.auth_service import (
     get_current_user,
     auth_service,
@@ -19,7 +20,7 @@ router = APIRouter(prefix="/auth", tags=["Authentication"])
 @router.post("/login", response_model=JWTResponse)
 async def login(
     form_data: OAuth2PasswordRequestForm = Depends(),
-    user_service: UserService = Depends(),
+    user_service: UserService = Depends(get_user_service),
 ):
     """
     OAuth2 호환 로그인 엔드포인트
@@ -36,7 +37,10 @@ async def login(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
-    if not verify_password(form_data.password, user.hashedpassword):
+    verified, new_hash = await password_hasher.verify_and_update(
+        form_data.password, user.hashedpassword
+    )
+    if not verified:
         logging.warning(f"Login failed: Invalid password - {form_data.username}")
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -44,6 +48,12 @@ async def login(
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+    # 해시 설정(BCRYPT_ROUNDS)이 바뀌었으면 평문을 알고 있는 지금 다시 해시합니다.
+    if new_hash:
+        await user_service.update_hashed_password(
+            email=user.email, hashed_password=new_hash
+        )
+
     token_data = {"user_email": user.email}
     access_token = auth_service.create_access_token(token_data)
     logging.info(f"Login successful: {form_data.username}")
@@ -72,7 +82,7 @@ async def user_logout_handler(
 @router.put("/update-password", status_code=status.HTTP_200_OK)
 async def password_update_handler(
     request: PasswordUpdateRequest,
-    user_service: UserService = Depends(),
+    user_service: UserService = Depends(get_user_service),
     current_user: User | None = Depends(get_current_user),
 ):
     if current_user.email != request.email:
@@ -80,7 +90,9 @@ async def password_update_handler(
             status_code=status.HTTP_403_FORBIDDEN, detail="Invalid Credentials"
         )
 
-    if not verify_password(request.password, current_user.hashedpassword):
+    # 캐시된 사용자에는 비밀번호 해시가 없으므로 DB에서 다시 읽습니다.
+    user = await user_service.find_one_by_email(current_user.email)
+    if not await password_hasher.verify(request.password, user.hashedpassword):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN, detail="Invalid Credentials"
         )
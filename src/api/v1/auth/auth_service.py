@@ -1,14 +1,20 @@
+import hashlib
+import time
 from datetime import datetime, timezone, timedelta
 from typing import Dict, Any, Tuple
 import logging
+from uuid import uuid4
 from fastapi import status, HTTPException, Depends
 from fastapi.security import OAuth2PasswordBearer
 from jose import jwt, JWTError
-from passlib.context import CryptContext
 from src.api.v1.users.user_repository import UserRepository
 from src.schemas.response import TokenData, User
-from src.services.auth.cache import redis_client
+from src.services.auth.password_hasher import password_hasher
+from src.services.auth.principal_cache import principal_cache, without_secrets
+from src.services.auth.token_blacklist import token_blacklist
 from src.core.config.settings import settings
+from src.core.metrics.registry import metrics_registry
+from src.services.cache.memory_cache import TTLLRUCache
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl="/api/v1/auth/login", auto_error=True)
 
@@ -28,9 +34,8 @@ class AuthService:
         self.secretkey: str = settings.JWT_SECRET_KEY
         self.jwt_algorithm: str = settings.JWT_ALGORITHM
         self.token_expire_minutes = settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES
-        self.pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
-        # schemes = ["bcrypt"] : 비밀번호 암호화 알고리즘
-        # deprecated="auto" : 사용되지 않는 알고리즘 자동 처리
+        # 서명 검증을 마친 토큰의 payload 캐시 (토큰 digest -> payload, exp까지 유지)
+        self.token_cache = TTLLRUCache(maxsize=settings.JWT_DECODE_CACHE_MAX_ENTRIES)
 
     def create_access_token(self, data: Dict[str, Any]) -> str:
         to_encode = data.copy()
@@ -47,6 +52,7 @@ class AuthService:
                 "aud": "blog-app-users",  # 토큰 대상자
                 "type": "access",  # 토큰 타입
                 "sub": data.get("user_email"),  # JWT 표준에 맞게 sub 클레임 사용
+                "jti": uuid4().hex,  # 토큰 식별자 (principal 캐시 키)
             }
         )
 
@@ -68,6 +74,11 @@ class AuthService:
             headers={"WWW-Authenticate": "Bearer"},
         )
 
+        digest = self._token_digest(token)
+        cached = self.token_cache.get(digest)
+        if cached is not None:
+            return TokenData(user_email=cached["sub"]), dict(cached)
+
         try:
             payload = jwt.decode(
                 token,
@@ -85,12 +96,29 @@ class AuthService:
                 raise credentials_exception
 
             token_data = TokenData(user_email=user_email)
+            self._cache_payload(digest, payload)
             return token_data, payload
 
         except JWTError as e:
             logging.error(f"JWTError in verify_access_token: {str(e)}")
             raise credentials_exception
 
+    @staticmethod
+    def _token_digest(token: str) -> str:
+        return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+    def _cache_payload(self, digest: str, payload: Dict[str, Any]) -> None:
+        """
+        검증된 payload를 토큰 만료 시각까지 캐시합니다.
+        블랙리스트 확인은 get_current_user에서 매번 따로 하므로 캐시와 무관합니다.
+        """
+        exp = payload.get("exp")
+        if exp is None:
+            return
+        ttl = exp - time.time()
+        if ttl > 0:
+            self.token_cache.set(digest, dict(payload), ttl=ttl)
+
     async def logged_in_user(self, token: str) -> User:
         credentials_exception = HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -99,7 +127,7 @@ class AuthService:
         )
 
         try:
-            token_data, _ = await self.verify_access_token(token)
+            token_data, payload = await self.verify_access_token(token)
             logging.info(f"Token data verified: {token_data}")
 
             # user_email이 있는지 확인
@@ -107,6 +135,12 @@ class AuthService:
                 logging.error("No user_email in token_data")
                 raise credentials_exception
 
+            # 캐시된 사용자가 있으면 DB 조회를 생략합니다.
+            jti = payload.get("jti")
+            user = principal_cache.get(jti)
+            if user is not None:
+                return user
+
             # 사용자 조회 시도
             user = await self.user_repository.find_one_by_email(
                 user_email=token_data.user_email
@@ -116,7 +150,9 @@ class AuthService:
                 logging.error(f"No user found for email: {token_data.user_email}")
                 raise credentials_exception
 
-            return user
+            principal_cache.set(jti, user, payload.get("exp"))
+            # 캐시에서 꺼낸 경우와 같게 비밀번호 해시 없이 반환합니다.
+            return without_secrets(user)
 
         except Exception as e:
             logging.error(f"Error in logged_in_user: {str(e)}")
@@ -125,7 +161,9 @@ class AuthService:
     async def logout(self, token: str) -> bool:
         """토큰을 블랙리스트에 추가하여 로그아웃 처리"""
         try:
-            _, payload = await self.verify_access_token(token)
+            token_data, payload = await self.verify_access_token(token)
+            principal_cache.evict(payload.get("jti"), token_data.user_email)
+            self.token_cache.delete(self._token_digest(token))
             exp_timestamp = payload.get("exp")
 
             # 현재 시간과 만료 시간 사이의 차이 계산
@@ -136,8 +174,8 @@ class AuthService:
                 logging.info("Token is already expired")
                 return True  # 이미 만료된 토큰은 처리 필요 없음
 
-            # Redis에 블랙리스트 토큰 저장
-            redis_client.setex(f"bl_{token}", ttl, "1")
+            # Redis에 블랙리스트 토큰 저장 (다른 워커의 Bloom filter에도 전파)
+            await token_blacklist.add(token, ttl)
             logging.info(f"Token blacklisted successfully, TTL: {ttl} seconds")
             return True
 
@@ -157,7 +195,7 @@ class AuthService:
                 headers={"WWW-Authenticate": "Bearer"},
             )
 
-        if not self.pwd_context.verify(password, user.hashedpassword):
+        if not await password_hasher.verify(password, user.hashedpassword):
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Incorrect email or password",
@@ -170,12 +208,13 @@ class AuthService:
 
 # 전역 인스턴스 생성
 auth_service = AuthService()
+metrics_registry.register("jwt_cache", auth_service.token_cache.stats)
 
 
 # 의존성 함수 정의
 async def get_current_user(token: str = Depends(oauth2_scheme)):
     try:
-        if redis_client.get(f"bl_{token}"):
+        if await token_blacklist.contains(token):
             raise HTTPException(
                 status_code=status.HTTP_401_UNAUTHORIZED,
                 detail="Token is blacklisted",
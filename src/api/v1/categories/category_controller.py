@@ -1,29 +1,53 @@
-from fastapi import APIRouter, Depends
+from fastapi import APIRouter, Depends, Request, Response
 
 from src.api.v1.categories.category_service import CategoryService
+from src.api.v1.dependencies import get_category_service
 from src.schemas.response import (
     User,
     CategoriesResponse,
     CategoryToArticleResponse,
 )
 from src.api.v1.auth.auth_service import get_current_user
+from src.core.http.conditional import conditional_get
 
 router = APIRouter(prefix="/categories", tags=["Categories"])
 
 
 @router.get("/", response_model=CategoriesResponse)
 async def get_cats_handler(
-    category_service: CategoryService = Depends(),
+    request: Request,
+    response: Response,
+    category_service: CategoryService = Depends(get_category_service),
 ) -> CategoriesResponse:
     """Fetch all categories."""
     categories = await category_service.find_all()
+
+    # category 테이블에는 updated_at이 없으므로 이름과 소속 게시글의 버전으로 계산합니다.
+    not_modified = conditional_get(
+        request,
+        response,
+        [
+            (
+                category.id,
+                category.name,
+                tuple(
+                    (article.id, article.updated_at, article.likes_count)
+                    for article in category.articles
+                ),
+            )
+            for category in categories
+        ],
+    )
+    if not_modified:
+        return not_modified
+
     return CategoriesResponse(categories=categories)
 
 
 @router.get("/of-article/", response_model=CategoryToArticleResponse)
 async def get_cats_of_article_handler(
     article_id: int,
-    category_service: CategoryService = Depends(),
+    category_service: CategoryService = Depends(get_category_service),
     current_user: User | None = Depends(get_current_user),
 ) -> CategoryToArticleResponse:
     """Fetch categories of an article."""
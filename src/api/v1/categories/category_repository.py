@@ -16,17 +16,8 @@ class CategoryRepository(BaseRepository):
         """
         try:
             return await super().find_many(
-                include={
-                    "articles": {
-                        "include": {
-                            "article": {
-                                "include": {
-                                    "likes": True  # likes 관계를 포함하여 가져옵니다.
-                                }
-                            }
-                        }
-                    }
-                }
+                # 좋아요 수는 article.likes_count 컬럼을 사용하므로 likes는 불러오지 않습니다.
+                include={"articles": {"include": {"article": True}}}
             )
         except PrismaError as e:
             logging.error(f"Error in find_all: {e}")
@@ -43,13 +34,7 @@ class CategoryRepository(BaseRepository):
                 where={"articles": {"some": {"article_id": article_id}}},
                 include={
                     "articles": {
-                        "include": {
-                            "article": {
-                                "include": {
-                                    "likes": True,
-                                }
-                            }
-                        },
+                        "include": {"article": True},
                         "where": {"article_id": article_id},
                     }
                 },
@@ -9,8 +9,8 @@ import logging
 
 
 class CategoryService:
-    def __init__(self):
-        self.category_repository = CategoryRepository()
+    def __init__(self, category_repository: CategoryRepository | None = None):
+        self.category_repository = category_repository or CategoryRepository()
 
     async def find_all(self):
         """Fetch all categories and their articles."""
@@ -18,15 +18,7 @@ class CategoryService:
             categories = await self.category_repository.find_all()
             # category.articles를 article 객체들의 리스트로 변환
             for category in categories:
-                article_list = []
-                for item in category.articles:
-                    article = item.article
-                    article.likes_count = len(article.likes) if article.likes else 0
-
-                    del article.likes
-                article_list.append(article)
-
-                category.articles = article_list
+                category.articles = [item.article for item in category.articles]
             return categories
 
         except DatabaseException as e:
@@ -44,10 +36,6 @@ class CategoryService:
                 return None
 
             article_item = categories[0].articles[0].article
-            article_item.likes_count = (
-                len(article_item.likes) if article_item.likes else 0
-            )
-            del article_item.likes
             article = ArticleToCategory(
                 **article_item.model_dump()
             )  # model_dump 로 딕셔너리 변환
@@ -1,15 +1,21 @@
-from fastapi import APIRouter, Depends, Query
+from fastapi import APIRouter, Depends, Query, Request, Response
 
-from src.schemas.request import CommentCreate, CommentUpdate
+from src.schemas.request import CommentCreate, CommentPreviewRequest, CommentUpdate
 from src.api.v1.comments.comment_service import CommentService
+from src.api.v1.dependencies import get_comment_service
 from src.schemas.response import (
     User,
+    CommentCountResponse,
+    CommentPreviewResponse,
     CommentResponse,
+    CommentThreadResponse,
     CommentUpdateResponse,
     UserRole,
 )
 from src.api.v1.auth.auth_service import get_current_user
 from src.api.v1.auth.role_dependency import require_minimum_role
+from src.core.database.cursor import NEXT_CURSOR_HEADER
+from src.core.http.conditional import conditional_get
 
 router = APIRouter(prefix="/comments", tags=["Comments"])
 
@@ -18,29 +24,85 @@ router = APIRouter(prefix="/comments", tags=["Comments"])
 async def get_comments_handler(
     skip: int = Query(0, ge=0),
     limit: int = Query(10, ge=1, le=30),
-    comment_service: CommentService = Depends(),
+    comment_service: CommentService = Depends(get_comment_service),
 ) -> list[CommentResponse]:
     return await comment_service.find_many(skip=skip, limit=limit)
 
 
 @router.get("/by-filters")
 async def get_comments_by_filters_handler(
+    request: Request,
+    response: Response,
     article_id: int | None = None,
     user_id: int | None = None,
-    comment_service: CommentService = Depends(),
+    cursor: str | None = Query(None, description="Value of X-Next-Cursor"),
+    limit: int = Query(20, ge=1, le=100),
+    comment_service: CommentService = Depends(get_comment_service),
 ) -> list[CommentResponse]:
 
-    comment_filters = {"article_id": article_id, "user_id": user_id}
-    comments = await comment_service.find_by_filters(comment_filters)
+    comment_filters = {
+        "article_id": article_id,
+        "user_id": user_id,
+        "cursor": cursor,
+        "limit": limit,
+    }
+    comments, next_cursor = await comment_service.find_by_filters(comment_filters)
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+
+    not_modified = conditional_get(
+        request,
+        response,
+        [(comment.id, comment.updated_at) for comment in comments],
+    )
+    if not_modified:
+        return not_modified
 
     return comments
 
 
+@router.get("/counts")
+async def get_comment_counts_handler(
+    article_ids: list[int] = Query(..., min_length=1, max_length=100),
+    comment_service: CommentService = Depends(get_comment_service),
+) -> list[CommentCountResponse]:
+    return await comment_service.count_by_articles(article_ids)
+
+
+@router.post("/preview")
+async def get_comment_previews_handler(
+    request: CommentPreviewRequest,
+    comment_service: CommentService = Depends(get_comment_service),
+) -> list[CommentPreviewResponse]:
+    """피드 렌더링용: 여러 게시글의 최신 댓글 limit개씩"""
+    return await comment_service.preview(
+        article_ids=request.article_ids, limit=request.limit
+    )
+
+
+@router.get("/thread")
+async def get_comment_thread_handler(
+    response: Response,
+    article_id: int,
+    root: int | None = Query(None, description="Fetch only this comment's subtree"),
+    depth: int | None = Query(None, ge=0, le=50, description="Max depth below root"),
+    cursor: str | None = Query(None, description="Value of X-Next-Cursor"),
+    limit: int = Query(50, ge=1, le=200),
+    comment_service: CommentService = Depends(get_comment_service),
+) -> list[CommentThreadResponse]:
+    thread, next_cursor = await comment_service.find_thread(
+        article_id=article_id, root_id=root, depth=depth, cursor=cursor, limit=limit
+    )
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return thread
+
+
 @router.post("/")
 async def create_comment_handler(
     article_id: int,
     comment: CommentCreate,
-    comment_service: CommentService = Depends(),
+    comment_service: CommentService = Depends(get_comment_service),
     authorized_user: User | None = Depends(require_minimum_role(UserRole.AUTHOR)),
 ) -> CommentResponse:
     comment_data = comment.to_comment_data(
@@ -54,7 +116,7 @@ async def create_comment_handler(
 @router.put("/")
 async def update_comment_handler(
     new_comment: CommentUpdate,
-    comment_service: CommentService = Depends(),
+    comment_service: CommentService = Depends(get_comment_service),
     current_user: User | None = Depends(get_current_user),
 ) -> CommentUpdateResponse:
     new_comment = new_comment.to_comment_data(user_id=current_user.id)
@@ -65,7 +127,7 @@ async def update_comment_handler(
 @router.delete("/{comment_id}")
 async def delete_comment_handler(
     comment_id: int,
-    comment_service: CommentService = Depends(),
+    comment_service: CommentService = Depends(get_comment_service),
     current_user: User | None = Depends(get_current_user),
 ):
     deleted_comment = await comment_service.delete(
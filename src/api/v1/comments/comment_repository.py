@@ -2,6 +2,31 @@ from dataclasses import dataclass
 from typing import TypedDict
 
 from src.core.database.base_repo import BaseRepository
+from src.core.database.cursor import decode_cursor, keyset_where
+from src.core.exceptions.base import NotFoundException
+
+# 댓글은 작성 순서대로 보여 주며, 같은 시각이면 id로 순서를 고정합니다.
+COMMENT_ORDER = [{"created_at": "asc"}, {"id": "asc"}]
+COMMENT_PAGE_LIMIT = 20
+PATH_SEGMENT_WIDTH = 10
+
+
+def comment_path(parent_path: str | None, comment_id: int) -> str:
+    """
+    부모 경로 뒤에 자신의 id를 붙인 경로를 만듭니다.
+    id를 고정 폭으로 채우므로 경로의 문자열 순서가 곧 트리의 전위 순회 순서입니다.
+    """
+    segment = str(comment_id).zfill(PATH_SEGMENT_WIDTH)
+    return f"{parent_path}.{segment}" if parent_path else segment
+
+
+def next_sibling_path(path: str) -> str:
+    """
+    마지막 id를 1 늘린 경로입니다. [path, next_sibling_path(path)) 범위가 곧 path의 서브트리입니다.
+    """
+    head, _, last = path.rpartition(".")
+    segment = str(int(last) + 1).zfill(PATH_SEGMENT_WIDTH)
+    return f"{head}.{segment}" if head else segment
 
 
 @dataclass
@@ -9,12 +34,15 @@ class CommentData(TypedDict):
     user_id: int
     article_id: int
     content: str
+    parent_id: int | None
 
 
 @dataclass
 class CommentFilters(TypedDict, total=False):
     article_id: int | None = None
     user_id: int | None = None
+    cursor: str | None = None  # 이전 페이지의 X-Next-Cursor
+    limit: int = COMMENT_PAGE_LIMIT
 
 
 @dataclass
@@ -32,7 +60,7 @@ class CommentRepository(BaseRepository):
         """
         여러 댓글을 조회합니다.
         """
-        return await super().find_many(skip=skip, take=limit)
+        return await super().find_many(skip=skip, take=limit, order={"id": "asc"})
 
     async def find_by_id(self, comment_id: int):
         """
@@ -42,7 +70,8 @@ class CommentRepository(BaseRepository):
 
     async def find_by_filters(self, filters: CommentFilters):
         """
-        필터 조건에 맞는 댓글을 조회합니다.
+        필터 조건에 맞는 댓글을 (created_at, id) 순서로 한 페이지만 조회합니다.
+        (article_id | user_id, created_at, id) 인덱스의 범위 스캔으로 다음 페이지를 가져옵니다.
         """
         where_clause = {}
         if filters.get("article_id"):
@@ -50,18 +79,151 @@ class CommentRepository(BaseRepository):
         if filters.get("user_id"):
             where_clause["user_id"] = filters["user_id"]
 
-        return await super().find_many(where=where_clause)
+        keyset = keyset_where(filters.get("cursor"), descending=False)
+        if keyset:
+            where_clause = {"AND": [where_clause, keyset]}
+
+        return await super().find_many(
+            where=where_clause,
+            order=COMMENT_ORDER,
+            take=filters.get("limit") or COMMENT_PAGE_LIMIT,
+        )
+
+    async def find_thread(
+        self,
+        article_id: int,
+        root_id: int | None = None,
+        depth: int | None = None,
+        cursor: str | None = None,
+        limit: int = COMMENT_PAGE_LIMIT,
+    ):
+        """
+        게시글의 댓글 트리(root_id가 있으면 그 댓글의 서브트리)를 경로 순서로 조회합니다.
+
+        서브트리는 [root.path, next_sibling_path(root.path)) 범위이므로
+        (article_id, path) 인덱스 범위 스캔 한 번으로 가져옵니다.
+        depth는 root로부터의 최대 깊이, cursor는 이전 페이지 마지막 댓글의 경로입니다.
+        """
+        where: dict = {"article_id": article_id}
+        path_filter: dict = {}
+        base_depth = 0
+
+        if root_id is not None:
+            root = await super().find_unique(where={"id": root_id})
+            if root is None or root.article_id != article_id:
+                raise NotFoundException(name=f"Comment with id {root_id}")
+            path_filter = {"gte": root.path, "lt": next_sibling_path(root.path)}
+            base_depth = root.depth
+
+        if cursor:
+            (last_path,) = decode_cursor(cursor, str)
+            path_filter["gt"] = last_path
+        if path_filter:
+            where["path"] = path_filter
+        if depth is not None:
+            where["depth"] = {"lte": base_depth + depth}
+
+        return await super().find_many(where=where, order={"path": "asc"}, take=limit)
 
     async def create(self, data: CommentData):
         """
-        새 댓글을 생성합니다.
+        새 댓글을 생성합니다. parent_id가 있으면 해당 댓글의 답글로 생성합니다.
+        경로에 자신의 id가 들어가므로 생성 후 같은 트랜잭션에서 경로를 채웁니다.
+        """
+        async with self.prisma.tx() as transaction:
+            parent = None
+            if data.get("parent_id"):
+                parent = await transaction.comment.find_unique(
+                    where={"id": data["parent_id"]}
+                )
+                if parent is None or parent.article_id != data["article_id"]:
+                    raise NotFoundException(name=f"Comment with id {data['parent_id']}")
+
+            comment = await transaction.comment.create(
+                data={
+                    "user_id": data["user_id"],
+                    "article_id": data["article_id"],
+                    "content": data["content"],
+                    "parent_id": parent.id if parent else None,
+                    "depth": parent.depth + 1 if parent else 0,
+                }
+            )
+            await transaction.article.update(
+                where={"id": data["article_id"]},
+                data={"comments_count": {"increment": 1}},
+            )
+            return await transaction.comment.update(
+                where={"id": comment.id},
+                data={
+                    "path": comment_path(parent.path if parent else None, comment.id)
+                },
+            )
+
+    async def find_latest_by_articles(
+        self, article_ids: list[int], limit: int
+    ) -> dict[int, list[dict]]:
+        """
+        게시글별 최신 댓글 limit개를 한 번의 쿼리로 조회합니다.
+        반환값은 {article_id: [댓글 행, ...]} 이며 최신순입니다.
+        """
+        # 요청 스키마에서 검증된 정수 id이므로 목록에 직접 넣습니다.
+        ids = ", ".join(str(int(article_id)) for article_id in article_ids)
+        rows = await self.prisma.query_raw(
+            f"""
+            SELECT "id", "user_id", "article_id", "parent_id", "depth",
+                   "content", "created_at", "updated_at"
+            FROM (
+                SELECT c.*, ROW_NUMBER() OVER (
+                    PARTITION BY c."article_id"
+                    ORDER BY c."created_at" DESC, c."id" DESC
+                ) AS rn
+                FROM "comment" c
+                WHERE c."article_id" IN ({ids})
+            ) AS ranked
+            WHERE rn <= $1
+            ORDER BY "article_id", rn
+            """,
+            limit,
+        )
+        latest: dict[int, list[dict]] = {article_id: [] for article_id in article_ids}
+        for row in rows:
+            latest[row["article_id"]].append(row)
+        return latest
+
+    async def count_by_articles(self, article_ids: list[int]) -> dict[int, int]:
         """
-        return await super().create(
-            data={
-                "user_id": data["user_id"],
-                "article_id": data["article_id"],
-                "content": data["content"],
-            }
+        여러 게시글의 댓글 수를 comments_count 컬럼에서 한 번에 조회합니다.
+        """
+        articles = await self.prisma.article.find_many(
+            where={"id": {"in": article_ids}}
+        )
+        return {article.id: article.comments_count for article in articles}
+
+    async def recount(self) -> int:
+        """
+        모든 게시글의 comments_count를 comment 테이블 기준으로 다시 계산합니다.
+        (comments_count 추가 이전 데이터의 일회성 보정용)
+        """
+        return await self.prisma.execute_raw("""
+            UPDATE "article" AS a
+            SET "comments_count" = COALESCE(c.n, 0)
+            FROM "article" AS t
+            LEFT JOIN (
+                SELECT "article_id", count(*)::int AS n FROM "comment" GROUP BY "article_id"
+            ) AS c ON c."article_id" = t."id"
+            WHERE a."id" = t."id" AND a."comments_count" <> COALESCE(c.n, 0)
+            """)
+
+    async def backfill_paths(self) -> int:
+        """
+        답글 기능 이전에 작성된(경로가 비어 있는) 댓글을 최상위 댓글로 채웁니다.
+        """
+        return await self.prisma.execute_raw(
+            """
+            UPDATE "comment" SET "path" = lpad("id"::text, $1, '0')
+            WHERE "path" = ''
+            """,
+            PATH_SEGMENT_WIDTH,
         )
 
     async def update(self, data: UpdateCommentData):
@@ -75,6 +237,27 @@ class CommentRepository(BaseRepository):
 
     async def delete(self, comment_id: int):
         """
-        댓글을 삭제합니다.
+        댓글을 삭제합니다. 답글도 함께 삭제(cascade)되므로 서브트리 크기만큼 댓글 수를 줄입니다.
         """
-        return await super().delete(where={"id": comment_id})
+        async with self.prisma.tx() as transaction:
+            comment = await transaction.comment.find_unique(where={"id": comment_id})
+            if comment is None:
+                return None
+
+            removed = 1
+            if comment.path:
+                removed = await transaction.comment.count(
+                    where={
+                        "article_id": comment.article_id,
+                        "path": {
+                            "gte": comment.path,
+                            "lt": next_sibling_path(comment.path),
+                        },
+                    }
+                )
+            deleted = await transaction.comment.delete(where={"id": comment_id})
+            await transaction.article.update(
+                where={"id": comment.article_id},
+                data={"comments_count": {"decrement": removed}},
+            )
+            return deleted
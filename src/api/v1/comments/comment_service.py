@@ -1,25 +1,197 @@
+import logging
+from uuid import uuid4
+
 from src.api.v1.comments.comment_repository import (
     CommentRepository,
     CommentFilters,
     CommentData,
     UpdateCommentData,
 )
-from src.schemas.response import User, UserRole
+from src.core.config.settings import settings
+from src.core.database.cursor import encode_cursor, next_page_cursor
+from src.core.metrics.registry import metrics_registry
+from src.services.auth.cache import redis_client
+from src.services.cache.memory_cache import TTLLRUCache
+from src.services.articles.article_cache import article_cache
+from src.schemas.response import (
+    CommentCountResponse,
+    CommentPreviewResponse,
+    CommentResponse,
+    CommentThreadResponse,
+    User,
+    UserRole,
+)
 from fastapi import HTTPException
 
+PREVIEW_VERSION_PREFIX = "comment_preview_version:"
+
+
+def _preview_version_key(article_id: int) -> str:
+    return f"{PREVIEW_VERSION_PREFIX}{article_id}"
+
 
 class CommentService:
-    def __init__(self):
-        self.comment_repository = CommentRepository()
+    def __init__(self, comment_repository: CommentRepository | None = None):
+        self.comment_repository = comment_repository or CommentRepository()
+        # article_id -> (캐시할 때의 버전, 조회한 개수, 최신 댓글 목록)
+        self.preview_cache = TTLLRUCache(
+            maxsize=settings.COMMENT_PREVIEW_CACHE_MAX_ENTRIES,
+            ttl=settings.COMMENT_PREVIEW_CACHE_TTL,
+        )
+        # 버전 키는 그 버전으로 캐시된 항목보다 오래 남아야 합니다.
+        self.preview_version_ttl = settings.COMMENT_PREVIEW_CACHE_TTL * 2
+        metrics_registry.register("comment_previews", self.preview_cache.stats)
 
     async def find_many(self, skip: int = 0, limit: int = 10):
         return await self.comment_repository.find_many(skip=skip, limit=limit)
 
     async def find_by_filters(self, request: CommentFilters):
-        return await self.comment_repository.find_by_filters(request)
+        """
+        (댓글 목록, 다음 페이지 커서)를 반환합니다.
+        """
+        comments = await self.comment_repository.find_by_filters(request)
+        return comments, next_page_cursor(comments, request["limit"])
+
+    async def find_thread(
+        self,
+        article_id: int,
+        root_id: int | None = None,
+        depth: int | None = None,
+        cursor: str | None = None,
+        limit: int = 20,
+    ) -> tuple[list[CommentThreadResponse], str | None]:
+        """
+        댓글 트리 한 페이지와 다음 페이지 커서를 반환합니다.
+        """
+        comments = await self.comment_repository.find_thread(
+            article_id=article_id,
+            root_id=root_id,
+            depth=depth,
+            cursor=cursor,
+            limit=limit,
+        )
+        next_cursor = (
+            encode_cursor(comments[-1].path) if len(comments) == limit else None
+        )
+        return self.build_tree(comments), next_cursor
+
+    @staticmethod
+    def build_tree(comments: list) -> list[CommentThreadResponse]:
+        """
+        경로 순서(전위 순회)로 정렬된 댓글을 한 번 훑어 트리로 만듭니다.
+        부모가 항상 자식보다 먼저 나오므로, 부모가 이 페이지에 없는 댓글만 최상위가 됩니다.
+        """
+        nodes: dict[int, CommentThreadResponse] = {}
+        roots: list[CommentThreadResponse] = []
+        for comment in comments:
+            # replies 관계는 불러오지 않았으므로(None) 댓글 필드만 옮깁니다.
+            node = CommentThreadResponse(
+                **CommentResponse.model_validate(comment).model_dump()
+            )
+            nodes[node.id] = node
+            parent = nodes.get(node.parent_id)
+            if parent is not None:
+                parent.replies.append(node)
+            else:
+                roots.append(node)
+        return roots
+
+    async def preview(
+        self, article_ids: list[int], limit: int
+    ) -> list[CommentPreviewResponse]:
+        """
+        게시글별 최신 댓글 limit개를 반환합니다.
+        캐시에 limit개 이상 조회해 둔 게시글은 캐시에서, 나머지는 한 번의 쿼리로 가져옵니다.
+
+        워커 내 캐시 항목은 캐시할 때 읽은 Redis 버전 키(comment_preview_version:<id>)와
+        함께 저장하고, 요청마다 MGET 한 번으로 버전을 비교해 다른 워커에서 바뀐 게시글은
+        다시 조회합니다. 버전은 DB 조회 전에 읽으므로 조회 중에 바뀐 댓글도 다음 요청에서
+        다시 조회됩니다. Redis 장애 중(fallback 캐시)에는 다른 워커의 변경이
+        COMMENT_PREVIEW_CACHE_TTL 동안 늦게 보일 수 있습니다.
+        """
+        article_ids = list(dict.fromkeys(article_ids))
+        versions = await self._preview_versions(article_ids)
+        previews: dict[int, list[CommentResponse]] = {}
+        for article_id in article_ids:
+            cached = self.preview_cache.get(article_id)
+            if (
+                versions is not None
+                and cached is not None
+                and cached[0] == versions[article_id]
+                and cached[1] >= limit
+            ):
+                previews[article_id] = cached[2][:limit]
+
+        missing = [
+            article_id for article_id in article_ids if article_id not in previews
+        ]
+        if missing:
+            latest = await self.comment_repository.find_latest_by_articles(
+                missing, limit
+            )
+            for article_id, rows in latest.items():
+                comments = [CommentResponse.model_validate(row) for row in rows]
+                if versions is not None:
+                    self.preview_cache.set(
+                        article_id, (versions[article_id], limit, comments)
+                    )
+                previews[article_id] = comments
+
+        return [
+            CommentPreviewResponse(
+                article_id=article_id,
+                comments=[comment.model_copy() for comment in previews[article_id]],
+            )
+            for article_id in article_ids
+        ]
+
+    async def _preview_versions(self, article_ids: list[int]) -> dict | None:
+        """
+        게시글별 미리보기 버전을 읽습니다. 읽지 못하면 None (캐시를 쓰지 않음)
+        """
+        if not article_ids:
+            return {}
+        try:
+            values = await redis_client.mget(
+                *(_preview_version_key(article_id) for article_id in article_ids)
+            )
+        except Exception as e:
+            logging.error(f"Comment preview version read failed: {e}")
+            return None
+        return dict(zip(article_ids, values))
+
+    async def _invalidate_preview(self, article_id: int) -> None:
+        """
+        이 워커의 항목을 지우고, 버전을 새 값으로 바꿔 다른 워커의 항목도 무효화합니다.
+        INCR 대신 매번 새 값을 쓰므로 버전 키가 만료된 뒤에도 예전 버전이 다시 나오지 않습니다.
+        """
+        self.preview_cache.delete(article_id)
+        try:
+            await redis_client.setex(
+                _preview_version_key(article_id),
+                self.preview_version_ttl,
+                uuid4().hex,
+            )
+        except Exception as e:
+            logging.error(f"Comment preview invalidation failed: {e}")
+
+    async def count_by_articles(
+        self, article_ids: list[int]
+    ) -> list[CommentCountResponse]:
+        counts = await self.comment_repository.count_by_articles(article_ids)
+        return [
+            CommentCountResponse(
+                article_id=article_id, comments_count=counts[article_id]
+            )
+            for article_id in dict.fromkeys(article_ids)
+            if article_id in counts
+        ]
 
     async def create(self, request: CommentData):
-        return await self.comment_repository.create(request)
+        comment = await self.comment_repository.create(request)
+        await article_cache.invalidate(comment.article_id)
+        await self._invalidate_preview(comment.article_id)
+        return comment
 
     async def update(self, request: UpdateCommentData, current_user: User):
         comment = await self.comment_repository.find_by_id(request["id"])
@@ -31,7 +203,9 @@ class CommentService:
                 status_code=403, detail="Insufficient permissions to update the comment"
             )
 
-        return await self.comment_repository.update(request)
+        updated_comment = await self.comment_repository.update(request)
+        await self._invalidate_preview(comment.article_id)
+        return updated_comment
 
     async def delete(self, comment_id: int, current_user: User):
         comment = await self.comment_repository.find_by_id(comment_id)
@@ -49,4 +223,6 @@ class CommentService:
             )
 
         await self.comment_repository.delete(comment_id=comment_id)
+        await article_cache.invalidate(comment.article_id)
+        await self._invalidate_preview(comment.article_id)
         return
@@ -0,0 +1,109 @@
+from concurrent.futures import Executor, ThreadPoolExecutor
+from dataclasses import dataclass
+from typing import Any
+
+from fastapi import Request
+
+from src.api.v1.articles.article_repository import ArticleRepository
+from src.api.v1.articles.article_service import ArticleService
+from src.api.v1.categories.category_repository import CategoryRepository
+from src.api.v1.categories.category_service import CategoryService
+from src.api.v1.comments.comment_repository import CommentRepository
+from src.api.v1.comments.comment_service import CommentService
+from src.api.v1.files.file_repository import FileRepository
+from src.api.v1.files.file_service import FileService
+from src.api.v1.likes.like_repository import LikeRepository
+from src.api.v1.likes.like_service import LikeService
+from src.api.v1.users.user_repository import UserRepository
+from src.api.v1.users.user_service import UserService
+from src.core.config.settings import settings
+from src.services.s3.base_s3_service import create_s3_client
+
+
+@dataclass
+class ServiceContainer:
+    """
+    앱 수명 동안 한 번만 생성되는 서비스/클라이언트 모음입니다.
+    서비스와 리포지토리는 요청별 상태를 갖지 않으므로 모든 요청이 공유합니다.
+    """
+
+    s3_client: Any
+    s3_executor: Executor
+    article_service: ArticleService
+    category_service: CategoryService
+    comment_service: CommentService
+    file_service: FileService
+    like_service: LikeService
+    user_service: UserService
+
+    def close(self) -> None:
+        """
+        lifespan 종료 시 호출되어 진행 중인 S3 작업을 마친 뒤 스레드 풀을 정리합니다.
+        """
+        self.s3_executor.shutdown(wait=True)
+
+
+def build_container() -> ServiceContainer:
+    """
+    lifespan 시작 시 호출되어 리포지토리, S3 클라이언트, 서비스를 구성합니다.
+    """
+    s3_client = create_s3_client()
+    s3_executor = ThreadPoolExecutor(
+        max_workers=settings.S3_EXECUTOR_WORKERS, thread_name_prefix="s3"
+    )
+
+    article_repository = ArticleRepository()
+    like_repository = LikeRepository()
+
+    file_service = FileService(
+        s3_client=s3_client,
+        file_repository=FileRepository(),
+        article_repository=article_repository,
+        executor=s3_executor,
+    )
+
+    return ServiceContainer(
+        s3_client=s3_client,
+        s3_executor=s3_executor,
+        article_service=ArticleService(
+            article_repository=article_repository,
+            like_repository=like_repository,
+            file_service=file_service,
+        ),
+        category_service=CategoryService(category_repository=CategoryRepository()),
+        comment_service=CommentService(comment_repository=CommentRepository()),
+        file_service=file_service,
+        like_service=LikeService(
+            like_repository=like_repository,
+            article_repository=article_repository,
+        ),
+        user_service=UserService(user_repository=UserRepository()),
+    )
+
+
+def _container(request: Request) -> ServiceContainer:
+    return request.app.state.container
+
+
+def get_article_service(request: Request) -> ArticleService:
+    return _container(request).article_service
+
+
+def get_category_service(request: Request) -> CategoryService:
+    return _container(request).category_service
+
+
+def get_comment_service(request: Request) -> CommentService:
+    return _container(request).comment_service
+
+
+def get_file_service(request: Request) -> FileService:
+    return _container(request).file_service
+
+
+def get_like_service(request: Request) -> LikeService:
+    return _container(request).like_service
+
+
+def get_user_service(request: Request) -> UserService:
+    return _container(request).user_service
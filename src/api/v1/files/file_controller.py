@@ -2,8 +2,15 @@ from fastapi import APIRouter, UploadFile, Depends, HTTPException, File
 from fastapi.responses import RedirectResponse
 
 from src.api.v1.files.file_service import FileService
+from src.api.v1.dependencies import get_file_service
 from src.api.v1.auth.auth_service import get_current_user
-from src.schemas.response import User, FileUploadResponse
+from src.schemas.request import FileUploadIntentRequest
+from src.schemas.response import (
+    User,
+    FileResponse,
+    FileUploadIntentResponse,
+    FileUploadResponse,
+)
 from src.core.exceptions.base import NotFoundException
 
 
@@ -14,25 +21,47 @@ router = APIRouter(prefix="/files", tags=["Files"])
 async def upload_handler(
     article_id: int,
     files: list[UploadFile] = File(None),
-    file_service: FileService = Depends(),
+    file_service: FileService = Depends(get_file_service),
     current_user: User = Depends(get_current_user),
 ) -> FileUploadResponse:
-    file_urls = await file_service.upload(
+    return await file_service.upload(
         article_id=article_id, user_id=current_user.id, files=files
     )
-    return FileUploadResponse(urls=file_urls)
+
+
+@router.post("/upload-intent")
+async def upload_intent_handler(
+    request: FileUploadIntentRequest,
+    file_service: FileService = Depends(get_file_service),
+    current_user: User = Depends(get_current_user),
+) -> FileUploadIntentResponse:
+    return await file_service.create_upload_intent(
+        user_id=current_user.id, request=request
+    )
+
+
+@router.post("/{id}/complete")
+async def complete_upload_handler(
+    id: int,
+    file_service: FileService = Depends(get_file_service),
+    current_user: User = Depends(get_current_user),
+) -> FileResponse:
+    return await file_service.complete_upload(id, current_user)
 
 
 @router.get("/")
-async def get_handler(id: int, file_service: FileService = Depends()):
-    file_url = await file_service.get_url(id)
-    return RedirectResponse(url=file_url)
+async def get_handler(id: int, file_service: FileService = Depends(get_file_service)):
+    file_url, max_age = await file_service.get_url(id)
+    # signed URL이 유효한 동안 브라우저/CDN이 리다이렉트를 재사용하도록 합니다.
+    return RedirectResponse(
+        url=file_url, headers={"Cache-Control": f"public, max-age={max_age}"}
+    )
 
 
 @router.delete("/")
 async def delete_handler(
     id: int,
-    file_service: FileService = Depends(),
+    file_service: FileService = Depends(get_file_service),
     current_user: User = Depends(get_current_user),
 ):
     try:
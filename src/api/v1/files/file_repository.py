@@ -1,9 +1,13 @@
 from dataclasses import dataclass
+from datetime import datetime
 from typing import List
 from pydantic import ConfigDict
 
 from src.core.database.base_repo import BaseRepository
 
+FILE_STATUS_PENDING = "pending"
+FILE_STATUS_READY = "ready"
+
 
 @dataclass
 class FileData:
@@ -13,6 +17,7 @@ class FileData:
     mimetype: str
     article_id: int
     size: int = 0
+    status: str = FILE_STATUS_READY
 
     model_config = ConfigDict(from_attributes=True, populate_by_name=True)
 
@@ -37,6 +42,49 @@ class FileRepository(BaseRepository):
         )
         return created_file.id
 
+    async def create_many(self, files: List[FileData]) -> int:
+        """
+        여러 파일 정보를 한 번의 쿼리로 저장합니다.
+        """
+        return await self.model.create_many(
+            data=[
+                {
+                    "path": file.path,
+                    "filename": file.filename,
+                    "mimetype": file.mimetype,
+                    "article_id": file.article_id,
+                    "user_id": file.user_id,
+                    "size": file.size,
+                }
+                for file in files
+            ]
+        )
+
+    async def create_pending(self, file: FileData):
+        """
+        presigned POST 업로드를 기다리는 파일 정보를 저장합니다.
+        """
+        return await super().create(
+            data={
+                "path": file.path,
+                "filename": file.filename,
+                "mimetype": file.mimetype,
+                "article_id": file.article_id,
+                "user_id": file.user_id,
+                "size": file.size,
+                "status": FILE_STATUS_PENDING,
+            }
+        )
+
+    async def mark_ready(self, id: int, size: int, mimetype: str):
+        """
+        업로드가 확인된 파일을 사용 가능 상태로 바꿉니다.
+        """
+        return await super().update(
+            where={"id": id},
+            data={"size": size, "mimetype": mimetype, "status": FILE_STATUS_READY},
+        )
+
     async def get_file(self, id: int) -> FileData:
         """
         ID로 파일 정보를 조회합니다.
@@ -50,6 +98,7 @@ class FileRepository(BaseRepository):
                 mimetype=file.mimetype,
                 article_id=file.article_id,
                 size=file.size,
+                status=file.status,
             )
 
         return None
@@ -61,6 +110,44 @@ class FileRepository(BaseRepository):
         files = await super().find_many(where={"article_id": article_id})
         return [FileData.model_config(file) for file in files]
 
+    async def find_by_article(self, article_id: int):
+        """
+        게시글에 속한 모든 파일(업로드 대기 중인 파일 포함)을 조회합니다.
+        """
+        return await super().find_many(where={"article_id": article_id})
+
+    async def delete_by_article(self, article_id: int) -> int:
+        """
+        게시글에 속한 모든 파일 정보를 삭제합니다.
+        """
+        return await self.model.delete_many(where={"article_id": article_id})
+
+    async def delete_stale_pending(
+        self, created_before: datetime, limit: int
+    ) -> list[tuple[int, str]]:
+        """
+        created_before 이전에 만들어진 pending 파일 정보를 최대 limit개 삭제하고
+        삭제한 (id, S3 key) 목록을 반환합니다.
+        그 사이 완료(ready)된 파일은 삭제하지 않습니다.
+        """
+        rows = await self.prisma.query_raw(
+            """
+            DELETE FROM "file"
+            WHERE "id" IN (
+                SELECT "id" FROM "file"
+                WHERE "status" = $1 AND "created_at" < $2::timestamp
+                ORDER BY "id"
+                LIMIT $3
+            )
+              AND "status" = $1
+            RETURNING "id", "path"
+            """,
+            FILE_STATUS_PENDING,
+            created_before.replace(tzinfo=None).isoformat(),
+            limit,
+        )
+        return [(row["id"], row["path"]) for row in rows]
+
     async def delete(self, id: int):
         """
         파일 정보를 삭제합니다.
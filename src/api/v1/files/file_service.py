@@ -1,101 +1,279 @@
+import asyncio
 import logging
+from concurrent.futures import Executor
+from datetime import datetime
 from fastapi import UploadFile, File, HTTPException
-from botocore.exceptions import BotoCoreError, NoCredentialsError
 from typing import List
 
 from src.services.s3.base_s3_service import BaseS3Service
-from src.api.v1.files.file_repository import FileRepository, FileData
+from src.api.v1.files.file_repository import (
+    FILE_STATUS_READY,
+    FileRepository,
+    FileData,
+)
 from src.api.v1.articles.article_repository import ArticleRepository
 from src.core.exceptions.base import NotFoundException, BadRequestException
-from src.schemas.response import User, UserRole, FileType, FileResponse
+from src.core.config.settings import settings
+from src.schemas.response import (
+    User,
+    UserRole,
+    FileType,
+    FileResponse,
+    FileUploadError,
+    FileUploadIntentResponse,
+    FileUploadResponse,
+)
+from src.schemas.request import FileUploadIntentRequest
+from src.core.metrics.registry import metrics_registry
+from src.services.articles.article_cache import article_cache
+from src.services.cache.memory_cache import TTLLRUCache
+
+
+ALLOWED_FILE_TYPES = {
+    "image": ["image/jpeg", "image/png", "image/gif", "image/jpg"],
+    "document": ["application/pdf", "application/msword"],
+}
+
+
+def get_file_type(mimetype: str) -> FileType:
+    """
+    MIME 타입으로 파일 종류를 판별합니다. (S3 클라이언트가 필요 없는 순수 함수)
+    """
+    for file_type, mime_types in ALLOWED_FILE_TYPES.items():
+        if mimetype in mime_types:
+            return file_type
+    return FileType.OTHER
 
 
 class FileService(BaseS3Service):
-    def __init__(self):
-        super().__init__()
-        self.file_repository = FileRepository()
-        self.article_repository = ArticleRepository()
+    def __init__(
+        self,
+        s3_client=None,
+        file_repository: FileRepository | None = None,
+        article_repository: ArticleRepository | None = None,
+        executor: Executor | None = None,
+    ):
+        super().__init__(s3_client=s3_client, executor=executor)
+        self.file_repository = file_repository or FileRepository()
+        self.article_repository = article_repository or ArticleRepository()
         self.max_file_size = 10 * 1024 * 1024  # 10MB
-        self.allowed_file_types = {
-            "image": ["image/jpeg", "image/png", "image/gif", "image/jpg"],
-            "document": ["application/pdf", "application/msword"],
+        self.allowed_file_types = ALLOWED_FILE_TYPES
+        self.path_cache = TTLLRUCache(
+            maxsize=settings.SIGNED_URL_CACHE_MAX_ENTRIES,
+            ttl=settings.FILE_PATH_CACHE_TTL,
+        )
+        metrics_registry.register("file_urls", self.stats)
+
+    def stats(self) -> dict:
+        return {
+            "signed_url_cache": self.signed_url_cache.stats(),
+            "path_cache": self.path_cache.stats(),
         }
 
     def _get_file_type(self, mimetype: str) -> FileType:
-        for file_type, mime_types in self.allowed_file_types.items():
-            if mimetype in mime_types:
-                return file_type
-        return FileType.OTHER
+        return get_file_type(mimetype)
 
     def _validate_file(self, file: UploadFile) -> bool:
-        if file.size > self.max_file_size:
+        # 크기를 알 수 없는 경우 업로드 중(upload_stream)에 max_file_size를 검사합니다.
+        return self._validate_metadata(file.content_type, file.size)
+
+    def _validate_metadata(self, content_type: str, size: int | None) -> bool:
+        if size is not None and size > self.max_file_size:
             raise BadRequestException(detail="File size exceeds the maximum limit")
 
         # Check if the content type is in any of the allowed mime types
         is_allowed = any(
-            file.content_type in mime_types
+            content_type in mime_types
             for mime_types in self.allowed_file_types.values()
         )
         if not is_allowed:
             raise BadRequestException(detail="Invalid file type")
         return True
 
-    async def upload(
-        self,
-        article_id: int,
-        user_id: int,
-        files: list[UploadFile] = File(None),
-    ) -> list[str]:
-        """
-        파일을 S3에 업로드하고 데이터베이스에 정보를 저장합니다.
-        """
-        # 게시글 확인
+    async def _check_article_author(self, article_id: int, user_id: int):
         article = await self.article_repository.find_by_id(article_id)
         if not article:
             raise NotFoundException(name="Article")
 
-        # 권한 확인
         if article.user_id != user_id:
             raise HTTPException(
                 status_code=403, detail="You are not the author of this article"
             )
 
+    async def upload(
+        self,
+        article_id: int,
+        user_id: int,
+        files: list[UploadFile] = File(None),
+    ) -> FileUploadResponse:
+        """
+        파일을 S3에 업로드하고 데이터베이스에 정보를 저장합니다.
+        """
+        # 게시글 및 권한 확인
+        await self._check_article_author(article_id, user_id)
+
         if not files:
             raise BadRequestException(detail="No files provided")
 
-        signed_urls = []
+        # 업로드 전에 모든 파일을 검증하여 일부만 올라가는 상황을 막습니다.
         for file in files:
-            try:
-                # validation
-                self._validate_file(file)
+            self._validate_file(file)
 
-                # S3에 파일 업로드
-                key = await self.upload_file(file, folder=f"articles/{article_id}")
+        semaphore = asyncio.Semaphore(settings.S3_UPLOAD_CONCURRENCY)
 
-                # 서명된 URL 생성
-                signed_url = self.generate_signed_url(key)
+        async def upload_one(file: UploadFile) -> tuple[str, int]:
+            async with semaphore:
+                return await self.upload_stream(
+                    file,
+                    folder=f"articles/{article_id}",
+                    max_size=self.max_file_size,
+                )
+
+        # S3 업로드를 동시에 실행하고, 실패한 파일은 응답에 담아 알려줍니다.
+        results = await asyncio.gather(
+            *(upload_one(file) for file in files), return_exceptions=True
+        )
 
-                # 파일 타입 결정
-                file_type = self._get_file_type(file.content_type)
+        uploaded: list[FileData] = []
+        failed: list[FileUploadError] = []
+        for file, result in zip(files, results):
+            if isinstance(result, BaseException):
+                if not isinstance(result, Exception):
+                    raise result
+                logging.error(f"Error uploading file {file.filename}: {result}")
+                detail = getattr(result, "detail", None) or str(result)
+                failed.append(FileUploadError(filename=file.filename, detail=detail))
+                continue
 
-                # 데이터베이스에 파일 정보 저장
-                file_data = FileData(
+            key, size = result
+            logging.info("Uploaded file with key: %s", key)
+            uploaded.append(
+                FileData(
                     user_id=user_id,
                     path=key,
                     filename=file.filename,
-                    mimetype=file_type,
+                    mimetype=file.content_type,
                     article_id=article_id,
-                    size=file.size,
+                    size=size,
+                )
+            )
+
+        # 데이터베이스에 파일 정보를 한 번에 저장
+        if uploaded:
+            try:
+                await self.file_repository.create_many(uploaded)
+            except Exception:
+                # 메타데이터 저장에 실패하면 S3에 올라간 객체를 정리합니다.
+                await asyncio.gather(
+                    *(self.delete_file(file.path) for file in uploaded),
+                    return_exceptions=True,
                 )
-                await self.file_repository.upload(file_data)
-                logging.info("Uploaded file with key: %s", key)
-                signed_urls.append(signed_url)
+                raise
 
-            except (BotoCoreError, NoCredentialsError) as e:
-                logging.error(f"Error uploading file {file.filename}: {e}")
-                continue  # 에러 발생 시 해당 파일 건너뛰기
+        signed_urls = [self.generate_signed_url(file.path) for file in uploaded]
 
-        return signed_urls
+        if signed_urls:
+            await self.article_repository.touch(article_id)
+        await article_cache.invalidate(article_id)
+        return FileUploadResponse(urls=signed_urls, failed=failed)
+
+    async def create_upload_intent(
+        self, user_id: int, request: FileUploadIntentRequest
+    ) -> FileUploadIntentResponse:
+        """
+        S3 직접 업로드용 presigned POST를 발급하고 pending 상태의 파일 정보를 저장합니다.
+        파일 내용은 API 서버를 거치지 않습니다.
+        """
+        await self._check_article_author(request.article_id, user_id)
+        self._validate_metadata(request.content_type, request.size)
+
+        filename = self.generate_unique_filename(request.filename)
+        key = f"articles/{request.article_id}/{filename}"
+        presigned = self.generate_presigned_post(
+            key, content_type=request.content_type, max_size=self.max_file_size
+        )
+
+        pending_file = await self.file_repository.create_pending(
+            FileData(
+                user_id=user_id,
+                path=key,
+                filename=request.filename,
+                mimetype=request.content_type,
+                article_id=request.article_id,
+                size=request.size or 0,
+            )
+        )
+        return FileUploadIntentResponse(
+            file_id=pending_file.id,
+            url=presigned["url"],
+            fields=presigned["fields"],
+            expires_in=settings.PRESIGNED_POST_EXPIRES_IN,
+        )
+
+    async def complete_upload(self, id: int, current_user: User) -> FileResponse:
+        """
+        S3에 객체가 실제로 올라왔는지 head_object로 확인한 뒤 파일을 사용 가능 상태로 바꿉니다.
+        """
+        file = await self.file_repository.get_file(id)
+        if not file:
+            raise NotFoundException(name="File")
+
+        if file.user_id != current_user.id:
+            raise HTTPException(
+                status_code=403, detail="You are not the owner of this file"
+            )
+
+        if file.status != FILE_STATUS_READY:
+            metadata = await self.head_file(file.path)
+            if metadata is None:
+                raise BadRequestException(detail="Uploaded object not found")
+
+            file.size = metadata["ContentLength"]
+            file.mimetype = metadata.get("ContentType") or file.mimetype
+            # presigned POST 정책으로도 막히지만 한 번 더 확인합니다.
+            self._validate_metadata(file.mimetype, file.size)
+
+            await self.file_repository.mark_ready(
+                id, size=file.size, mimetype=file.mimetype
+            )
+            await self.article_repository.touch(file.article_id)
+            await article_cache.invalidate(file.article_id)
+
+        return FileResponse(
+            id=id,
+            filename=file.filename,
+            mimetype=file.mimetype,
+            size=file.size,
+            type=self._get_file_type(file.mimetype),
+            url=f"/api/v1/files/?id={id}",
+        )
+
+    async def delete_article_files(self, article_id: int) -> None:
+        """
+        게시글의 모든 파일(업로드 대기 중인 파일 포함)을 S3와 DB에서 삭제합니다.
+        권한 확인은 게시글 삭제에서 합니다.
+        """
+        files = await self.file_repository.find_by_article(article_id)
+        await asyncio.gather(*(self.delete_file(file.path) for file in files))
+        await self.file_repository.delete_by_article(article_id)
+        for file in files:
+            self.path_cache.delete(file.id)
+
+    async def expire_pending_uploads(self, created_before: datetime, limit: int) -> int:
+        """
+        created_before 이전에 발급되고 완료되지 않은 업로드를 최대 limit개 정리합니다.
+        파일 정보를 먼저 지운 뒤, S3에 올라간 객체가 있으면 함께 삭제합니다.
+        """
+        expired = await self.file_repository.delete_stale_pending(created_before, limit)
+        results = await asyncio.gather(
+            *(self.delete_file(path) for _, path in expired), return_exceptions=True
+        )
+        for (id, path), result in zip(expired, results):
+            if isinstance(result, Exception):
+                logging.error(
+                    f"Failed to delete expired upload {id} ({path}): {result}"
+                )
+        return len(expired)
 
     async def get_article_files(self, article_id: int) -> List[FileResponse]:
         """
@@ -119,17 +297,20 @@ class FileService(BaseS3Service):
             )
         return result
 
-    async def get_url(self, id: int) -> str:
+    async def get_url(self, id: int) -> tuple[str, int]:
         """
-        파일의 서명된 URL을 반환합니다.
+        파일의 서명된 URL과 재사용 가능한 남은 시간(초)을 반환합니다.
+        id -> S3 key 매핑을 캐시하여 반복 요청 시 DB를 조회하지 않습니다.
         """
-        file = await self.file_repository.get_file(id)
-
-        if file:
-            signed_url = self.generate_signed_url(file.path)
-            return signed_url
+        path = self.path_cache.get(id)
+        if path is None:
+            file = await self.file_repository.get_file(id)
+            if not file or file.status != FILE_STATUS_READY:
+                raise NotFoundException(name="File")
+            path = file.path
+            self.path_cache.set(id, path)
 
-        raise NotFoundException(name="File")
+        return self.generate_signed_url_with_ttl(path)
 
     async def delete(self, id: int, current_user: User):
         """
@@ -151,9 +332,12 @@ class FileService(BaseS3Service):
 
         try:
             # S3에서 파일 삭제
-            self.delete_file(file.path)
+            await self.delete_file(file.path)
             # 데이터베이스에서 파일 정보 삭제
             await self.file_repository.delete(id)
+            self.path_cache.delete(id)
+            await self.article_repository.touch(file.article_id)
+            await article_cache.invalidate(file.article_id)
 
         except Exception as e:
             logging.error(f"Error deleting file {id} from S3: {e}")
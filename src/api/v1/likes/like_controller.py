@@ -1,9 +1,10 @@
 from fastapi import APIRouter, status, Depends
 
-from src.schemas.request import LikeCreate
-from src.schemas.response import User
+from src.schemas.request import LikeCreate, LikeStateRequest
+from src.schemas.response import LikeStateResponse, User
 from src.api.v1.auth.auth_service import get_current_user
 from src.api.v1.likes.like_service import LikeService
+from src.api.v1.dependencies import get_like_service
 
 router = APIRouter(prefix="/likes", tags=["Likes"])
 
@@ -11,7 +12,7 @@ router = APIRouter(prefix="/likes", tags=["Likes"])
 @router.post("/", status_code=status.HTTP_201_CREATED)
 async def like_handler(
     like: LikeCreate,
-    like_service: LikeService = Depends(),
+    like_service: LikeService = Depends(get_like_service),
     current_user: User | None = Depends(get_current_user),
 ):
 
@@ -20,10 +21,22 @@ async def like_handler(
     )
 
 
+@router.post("/state", status_code=status.HTTP_200_OK)
+async def like_state_handler(
+    request: LikeStateRequest,
+    like_service: LikeService = Depends(get_like_service),
+    current_user: User = Depends(get_current_user),
+) -> list[LikeStateResponse]:
+    """피드 렌더링용: 여러 게시글에 대한 내 좋아요 여부와 좋아요 수"""
+    return await like_service.states(
+        article_ids=request.article_ids, user_id=current_user.id
+    )
+
+
 # сделать артикл id как квери параметр
 @router.get("/")
 async def count_likes_of_article_handler(
-    article_id: int, like_service: LikeService = Depends()
+    article_id: int, like_service: LikeService = Depends(get_like_service)
 ):
 
     return await like_service.count_likes(article_id)
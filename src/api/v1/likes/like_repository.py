@@ -1,33 +1,164 @@
+from dataclasses import dataclass
+
 from src.core.database.base_repo import BaseRepository
 
 
+@dataclass
+class LikeToggleResult:
+    found: bool  # 게시글이 존재하는지
+    changed: bool  # 좋아요가 실제로 추가/삭제되었는지
+    likes_count: int | None = None  # 변경된 경우 새 좋아요 수
+
+
 class LikeRepository(BaseRepository):
     def __init__(self):
         super().__init__("like")
 
-    async def add(self, article_id: int, user_id: int):
+    async def add(self, article_id: int, user_id: int) -> LikeToggleResult:
         """
-        좋아요를 추가합니다.
+        좋아요를 추가하고 게시글 좋아요 수를 함께 증가시킵니다.
+        한 문장으로 실행되므로, 동시에 눌러도 실제로 추가된 행만큼만 증가합니다.
         """
-        return await super().create(
-            data={
-                "article": {"connect": {"id": article_id}},
-                "user": {"connect": {"id": user_id}},
-            }
+        rows = await self.prisma.query_raw(
+            """
+            WITH target AS (SELECT "id" FROM "article" WHERE "id" = $1),
+            inserted AS (
+                INSERT INTO "like" ("article_id", "user_id", "created_at", "updated_at")
+                SELECT "id", $2, now(), now() FROM target
+                ON CONFLICT DO NOTHING
+                RETURNING "article_id"
+            ),
+            updated AS (
+                UPDATE "article"
+                SET "likes_count" = "likes_count" + 1, "updated_at" = now()
+                WHERE "id" IN (SELECT "article_id" FROM inserted)
+                RETURNING "likes_count"
+            )
+            SELECT EXISTS (SELECT 1 FROM target) AS found,
+                   EXISTS (SELECT 1 FROM inserted) AS changed,
+                   (SELECT "likes_count" FROM updated) AS likes_count
+            """,
+            article_id,
+            user_id,
         )
+        return LikeToggleResult(**rows[0])
 
-    async def remove(self, article_id: int, user_id: int):
+    async def remove(self, article_id: int, user_id: int) -> LikeToggleResult:
         """
-        좋아요를 제거합니다.
+        좋아요를 삭제하고 게시글 좋아요 수를 함께 감소시킵니다.
         """
-        return await super().delete(
-            where={
-                "article_id_user_id": {
-                    "article_id": article_id,
-                    "user_id": user_id,
-                }
-            }
+        rows = await self.prisma.query_raw(
+            """
+            WITH target AS (SELECT "id" FROM "article" WHERE "id" = $1),
+            deleted AS (
+                DELETE FROM "like"
+                WHERE "article_id" = $1 AND "user_id" = $2
+                RETURNING "article_id"
+            ),
+            updated AS (
+                UPDATE "article"
+                SET "likes_count" = GREATEST("likes_count" - 1, 0),
+                    "updated_at" = now()
+                WHERE "id" IN (SELECT "article_id" FROM deleted)
+                RETURNING "likes_count"
+            )
+            SELECT EXISTS (SELECT 1 FROM target) AS found,
+                   EXISTS (SELECT 1 FROM deleted) AS changed,
+                   (SELECT "likes_count" FROM updated) AS likes_count
+            """,
+            article_id,
+            user_id,
+        )
+        return LikeToggleResult(**rows[0])
+
+    async def apply_changes(
+        self, changes: dict[tuple[int, int], bool]
+    ) -> list[tuple[int, int, bool]]:
+        """
+        {(article_id, user_id): 좋아요 여부} 목록을 한 문장으로 반영합니다.
+
+        좋아요 행을 추가/삭제한 뒤 실제로 바뀐 행 수만큼 게시글별 likes_count를 한 번씩 고칩니다.
+        이미 반영된 항목은 아무것도 바꾸지 않으므로 같은 목록을 다시 적용해도 안전합니다.
+        실제로 바뀐 (article_id, user_id, 좋아요 여부)를 반환합니다.
+        """
+        if not changes:
+            return []
+
+        # 모두 내부 버퍼에서 만든 정수/불리언이므로 VALUES 목록에 직접 넣습니다.
+        values = ", ".join(
+            f"({int(article_id)}, {int(user_id)}, {'true' if liked else 'false'})"
+            for (article_id, user_id), liked in changes.items()
+        )
+        rows = await self.prisma.query_raw(
+            f"""
+            WITH v("article_id", "user_id", liked) AS (VALUES {values}),
+            inserted AS (
+                INSERT INTO "like" ("article_id", "user_id", "created_at", "updated_at")
+                SELECT v."article_id", v."user_id", now(), now()
+                FROM v JOIN "article" a ON a."id" = v."article_id"
+                WHERE v.liked
+                ON CONFLICT DO NOTHING
+                RETURNING "article_id", "user_id"
+            ),
+            deleted AS (
+                DELETE FROM "like" l
+                USING v
+                WHERE NOT v.liked
+                  AND l."article_id" = v."article_id"
+                  AND l."user_id" = v."user_id"
+                RETURNING l."article_id", l."user_id"
+            ),
+            changed AS (
+                SELECT "article_id", "user_id", true AS liked FROM inserted
+                UNION ALL
+                SELECT "article_id", "user_id", false AS liked FROM deleted
+            ),
+            updated AS (
+                UPDATE "article" AS a
+                SET "likes_count" = GREATEST(a."likes_count" + d.n, 0),
+                    "updated_at" = now()
+                FROM (
+                    SELECT "article_id", sum(CASE WHEN liked THEN 1 ELSE -1 END) AS n
+                    FROM changed
+                    GROUP BY "article_id"
+                ) AS d
+                WHERE a."id" = d."article_id"
+                RETURNING a."id"
+            )
+            SELECT "article_id", "user_id", liked FROM changed
+            """
+        )
+        return [(row["article_id"], row["user_id"], row["liked"]) for row in rows]
+
+    async def find_states(
+        self, user_id: int, article_ids: list[int]
+    ) -> dict[int, tuple[bool, int]]:
+        """
+        여러 게시글에 대해 (사용자가 좋아요했는지, 좋아요 수)를 한 번에 조회합니다.
+        존재하지 않는 게시글은 결과에 포함되지 않습니다.
+        """
+        # 요청 스키마에서 검증된 정수 id이므로 목록에 직접 넣습니다.
+        ids = ", ".join(str(int(article_id)) for article_id in article_ids)
+        rows = await self.prisma.query_raw(
+            f"""
+            SELECT a."id", a."likes_count", l."user_id" IS NOT NULL AS liked
+            FROM "article" a
+            LEFT JOIN "like" l ON l."article_id" = a."id" AND l."user_id" = $1
+            WHERE a."id" IN ({ids})
+            """,
+            user_id,
         )
+        return {row["id"]: (row["liked"], row["likes_count"]) for row in rows}
+
+    async def find_user_ids(self, article_ids: list[int]) -> dict[int, list[int]]:
+        """
+        게시글별로 좋아요한 사용자 id 목록을 조회합니다.
+        """
+        likes = await super().find_many(where={"article_id": {"in": article_ids}})
+        user_ids: dict[int, list[int]] = {article_id: [] for article_id in article_ids}
+        for like in likes:
+            user_ids[like.article_id].append(like.user_id)
+        return user_ids
 
     async def find(self, article_id: int, user_id: int):
         """
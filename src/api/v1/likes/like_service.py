@@ -1,41 +1,118 @@
 from src.api.v1.likes.like_repository import LikeRepository
 from src.api.v1.articles.article_repository import ArticleRepository
+from src.core.exceptions.base import NotFoundException
+from src.schemas.response import LikeStateResponse
+from src.services.articles.article_cache import article_cache
+from src.services.likes.like_buffer import like_buffer
+from src.services.likes.like_state import like_state
 
 
 class LikeService:
-    def __init__(self):
-        self.like_repository = LikeRepository()
-        self.article_repository = ArticleRepository()
+    def __init__(
+        self,
+        like_repository: LikeRepository | None = None,
+        article_repository: ArticleRepository | None = None,
+    ):
+        self.like_repository = like_repository or LikeRepository()
+        self.article_repository = article_repository or ArticleRepository()
 
     async def like(self, dir: int, article_id: int, user_id: int):
-        article = await self.article_repository.find_by_id(article_id)
-        if not article:
-            return None
+        if like_buffer.enabled:
+            return await self._buffered_like(dir, article_id, user_id)
 
-        found_like = await self.like_repository.find(
-            article_id=article_id, user_id=user_id
-        )
+        # 좋아요 추가/취소와 likes_count 변경은 한 번의 쿼리로 함께 처리됩니다.
+        if dir == 1:
+            result = await self.like_repository.add(
+                article_id=article_id, user_id=user_id
+            )
+        else:
+            result = await self.like_repository.remove(
+                article_id=article_id, user_id=user_id
+            )
+
+        if not result.found:
+            raise NotFoundException(name=f"Article with id {article_id}")
+
+        if result.changed:
+            await article_cache.invalidate(article_id)
+            await like_state.record(article_id, user_id, liked=dir == 1)
 
         if dir == 1:
-            if found_like:
+            if not result.changed:
                 return f"You have alredy liked post: {article_id}"
+            return "successfully added like"
 
-            else:
-                await self.like_repository.add(article_id=article_id, user_id=user_id)
-                await self.article_repository.increment_likes_count(article_id)
-                return "successfully added like"
+        if not result.changed:
+            return "You never liked this post before"
+        return "Like cancelled"
 
-        else:
-            if not found_like:
-                return "You never liked this post before"
+    async def _buffered_like(self, dir: int, article_id: int, user_id: int):
+        """
+        좋아요/취소를 바로 쓰지 않고 like_buffer에 기록합니다.
+        현재 상태는 버퍼에 있으면 버퍼에서, 없으면 DB에서 읽습니다.
+        """
+        liked = like_buffer.state(article_id, user_id)
+        if liked is None:
+            states = await self.like_repository.find_states(user_id, [article_id])
+            if article_id not in states:
+                raise NotFoundException(name=f"Article with id {article_id}")
+            liked, _ = states[article_id]
+            # DB를 읽는 동안 같은 사용자의 다른 요청이 버퍼에 기록했을 수 있습니다.
+            buffered = like_buffer.state(article_id, user_id)
+            if buffered is not None:
+                liked = buffered
+
+        if dir == 1:
+            if liked:
+                return f"You have alredy liked post: {article_id}"
+            await like_buffer.record(article_id, user_id, liked=True)
+            return "successfully added like"
 
-            await self.like_repository.remove(article_id=article_id, user_id=user_id)
-            await self.article_repository.decrement_likes_count(article_id)
+        if not liked:
+            return "You never liked this post before"
+        await like_buffer.record(article_id, user_id, liked=False)
+        return "Like cancelled"
 
-            return "Like cancelled"
+    async def states(
+        self, article_ids: list[int], user_id: int
+    ) -> list[LikeStateResponse]:
+        """
+        여러 게시글의 좋아요 여부와 좋아요 수를 요청 순서대로 반환합니다.
+        Redis에 없는 게시글만 한 번의 IN 쿼리로 조회합니다. (없는 게시글은 제외)
+        """
+        article_ids = list(dict.fromkeys(article_ids))
+        states = await like_state.get(article_ids, user_id)
 
-    async def count_likes(self, article_id: int) -> int:
-        count = await self.like_repository.count(article_id)
-        await self.article_repository.set_likes_count(article_id, count)
+        missing = [article_id for article_id in article_ids if article_id not in states]
+        if missing:
+            found = await self.like_repository.find_states(user_id, missing)
+            states.update(found)
+            like_state.warm(
+                {article_id: count for article_id, (_, count) in found.items()}
+            )
 
-        return count
+        results = []
+        for article_id in article_ids:
+            if article_id not in states:
+                continue
+            liked, count = states[article_id]
+            # 버퍼에 남아 있는(아직 반영되지 않은) 좋아요를 더합니다.
+            buffered = like_buffer.state(article_id, user_id)
+            results.append(
+                LikeStateResponse(
+                    article_id=article_id,
+                    liked=liked if buffered is None else buffered,
+                    likes_count=count + like_buffer.pending_delta(article_id),
+                )
+            )
+        return results
+
+    async def count_likes(self, article_id: int) -> int:
+        # 읽기 전용: 캐시된 게시글이나 likes_count 컬럼을 사용합니다.
+        # 컬럼 값의 보정은 like_reconciler가 주기적으로 합니다.
+        cached = await article_cache.get(article_id)
+        if cached is not None:
+            count = cached.likes_count
+        else:
+            count = await self.article_repository.get_likes_count(article_id)
+        return count + like_buffer.pending_delta(article_id)
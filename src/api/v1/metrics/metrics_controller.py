@@ -0,0 +1,15 @@
+from fastapi import APIRouter, Depends, status
+
+from src.core.metrics.registry import metrics_registry
+from src.schemas.response import User, UserRole
+from src.api.v1.auth.role_dependency import require_minimum_role
+
+router = APIRouter(prefix="/metrics", tags=["Metrics"])
+
+
+@router.get("/", status_code=status.HTTP_200_OK)
+async def get_metrics_handler(
+    authorized_user: User = Depends(require_minimum_role(UserRole.ADMIN)),
+) -> dict[str, dict]:
+    """Cache hit/miss counters and other runtime statistics."""
+    return metrics_registry.snapshot()
@@ -1,6 +1,7 @@
 from fastapi import APIRouter, Depends, status, Query
 
 from src.api.v1.users.user_service import UserService
+from src.api.v1.dependencies import get_user_service
 from src.schemas.request import UserSignupRequest, UpdateUserRoleRequest
 from src.schemas.response import (
     User,
@@ -16,7 +17,7 @@ router = APIRouter(prefix="/users", tags=["Users"])
 
 @router.get("/", status_code=status.HTTP_200_OK)
 async def get_users_handler(
-    user_service: UserService = Depends(),
+    user_service: UserService = Depends(get_user_service),
     authorized_user: User = Depends(require_minimum_role(UserRole.ADMIN)),
 ) -> list[User] | None:
     return await user_service.find_many()
@@ -25,7 +26,7 @@ async def get_users_handler(
 @router.get("/role", status_code=status.HTTP_200_OK)
 async def get_user_by_role_handler(
     role: UserRole = Query(..., description="User role"),
-    user_service: UserService = Depends(),
+    user_service: UserService = Depends(get_user_service),
     authorized_user: User = Depends(require_minimum_role(UserRole.ADMIN)),
 ) -> list[UserResponse]:
     return await user_service.find_by_role(role)
@@ -34,7 +35,7 @@ async def get_user_by_role_handler(
 @router.get("/{user_id}", status_code=status.HTTP_200_OK)
 async def get_user_by_id_handler(
     user_id: int,
-    user_service: UserService = Depends(),
+    user_service: UserService = Depends(get_user_service),
     authorized_user: User = Depends(require_minimum_role(UserRole.ADMIN)),
 ) -> UserResponse:
     return await user_service.find_one_by_id(user_id)
@@ -44,7 +45,7 @@ async def get_user_by_id_handler(
 @router.post("/signup", status_code=status.HTTP_201_CREATED)
 async def user_signup_handler(
     request: UserSignupRequest,
-    user_service: UserService = Depends(),
+    user_service: UserService = Depends(get_user_service),
 ) -> SignUpResponse:
     return await user_service.signup(request)
 
@@ -54,7 +55,7 @@ async def user_signup_handler(
 async def update_user_role_handler(
     user_id: int,
     request: UpdateUserRoleRequest,
-    user_service: UserService = Depends(),
+    user_service: UserService = Depends(get_user_service),
     authorized_user: User = Depends(require_minimum_role(UserRole.ADMIN)),
 ) -> User:
     updated_user = await user_service.update_role(
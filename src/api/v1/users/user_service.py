@@ -3,12 +3,13 @@ from fastapi import HTTPException, status
 from src.schemas.request import UserSignupRequest
 from src.schemas.response import UserResponse, User, UserRole
 from src.api.v1.users.user_repository import UserRepository
-from src.services.auth.auth_utils import hash_password
+from src.services.auth.password_hasher import password_hasher
+from src.services.auth.token_blacklist import token_blacklist
 
 
 class UserService:
-    def __init__(self):
-        self.user_repository = UserRepository()
+    def __init__(self, user_repository: UserRepository | None = None):
+        self.user_repository = user_repository or UserRepository()
 
     async def find_many(self) -> list[User]:
         return await self.user_repository.find_many()
@@ -31,7 +32,7 @@ class UserService:
         return await self.user_repository.find_by_role(role=role)
 
     async def signup(self, request: UserSignupRequest):
-        hashed_password = hash_password(request.password)
+        hashed_password = await password_hasher.hash(request.password)
 
         # 새 사용자 가입시 기본 권한 부여
         return await self.user_repository.create(
@@ -42,13 +43,22 @@ class UserService:
         )
 
     async def update_password(self, email: str, new_password: str):
-        new_hashed_password: str = hash_password(new_password)
-        updated_user: UserResponse = await self.user_repository.update_password(
+        new_hashed_password: str = await password_hasher.hash(new_password)
+        return await self.update_hashed_password(
             email=email, hashed_password=new_hashed_password
         )
+
+    async def update_hashed_password(self, email: str, hashed_password: str):
+        updated_user: UserResponse = await self.user_repository.update_password(
+            email=email, hashed_password=hashed_password
+        )
+        await token_blacklist.publish_user_change(email)
         return updated_user
 
     async def update_role(self, user_id: int, new_role: UserRole):
-        return await self.user_repository.update_role(
+        updated_user = await self.user_repository.update_role(
             user_id=user_id, new_role=new_role
         )
+        if updated_user is not None:
+            await token_blacklist.publish_user_change(updated_user.email)
+        return updated_user
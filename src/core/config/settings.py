@@ -7,16 +7,83 @@ class Settings(BaseSettings):
     AWS_SECRET_ACCESS_KEY: str
     AWS_S3_BUCKET_NAME: str
     AWS_S3_REGION: str
+    S3_EXECUTOR_WORKERS: int = 8  # 블로킹 boto3 호출용 스레드 수
+    S3_UPLOAD_CONCURRENCY: int = 4  # 요청 하나에서 동시에 올리는 파일 수
+    # 한 번에 읽는 크기, 이보다 큰 파일은 multipart upload (S3 최소 part 크기 5MB 이상)
+    S3_MULTIPART_CHUNK_SIZE: int = 8 * 1024 * 1024
+    # Presigned URL은 만료 SIGNED_URL_REFRESH_MARGIN초 전까지 재사용
+    SIGNED_URL_EXPIRES_IN: int = 3600
+    SIGNED_URL_REFRESH_MARGIN: int = 300
+    SIGNED_URL_CACHE_MAX_ENTRIES: int = 10000
+    FILE_PATH_CACHE_TTL: int = 300  # 파일 id -> S3 key 캐시
+    PRESIGNED_POST_EXPIRES_IN: int = 600  # 직접 업로드(upload-intent) 유효 시간
+    # 완료(complete)되지 않은 직접 업로드 정리 (TTL은 PRESIGNED_POST_EXPIRES_IN보다 길게)
+    PENDING_UPLOAD_TTL: int = 3600
+    PENDING_UPLOAD_SWEEP_INTERVAL: float = 600
+    PENDING_UPLOAD_SWEEP_BATCH_SIZE: int = 500
 
     # Redis
     REDIS_HOST: str = "localhost"
     REDIS_PORT: int = 6379
     REDIS_DB: int = 0
+    REDIS_MAX_CONNECTIONS: int = 50
+    REDIS_SOCKET_TIMEOUT: float = 0.5  # 명령 응답 대기 시간(초)
+    REDIS_CONNECT_TIMEOUT: float = 1.0
+    # 연속 실패 REDIS_BREAKER_FAILURES 번이면 REDIS_BREAKER_RESET_SECONDS 동안 fallback 사용
+    REDIS_BREAKER_FAILURES: int = 5
+    REDIS_BREAKER_RESET_SECONDS: float = 30
+    # Redis 장애 시 사용하는 워커 내 대체 캐시
+    FALLBACK_CACHE_MAX_ENTRIES: int = 10000
+    FALLBACK_CACHE_SWEEP_INTERVAL: float = 60
+    # 로그아웃 토큰 Bloom filter (capacity 개일 때 오탐률 ERROR_RATE, 기본 약 180KB)
+    TOKEN_BLACKLIST_BLOOM_CAPACITY: int = 100000
+    TOKEN_BLACKLIST_BLOOM_ERROR_RATE: float = 0.001
+    TOKEN_BLACKLIST_REBUILD_INTERVAL: float = 3600  # 만료된 토큰 정리 주기
+
+    # Article views (write-behind 집계)
+    VIEW_FLUSH_INTERVAL_MS: int = 5000
+    VIEW_FLUSH_MAX_EVENTS: int = 1000
+    VIEW_COUNTER_USE_REDIS: bool = False
+
+    # likes_count 보정 작업 (여러 인스턴스 중 하나에서만 켜도 충분)
+    LIKE_RECONCILE_ENABLED: bool = True
+    LIKE_RECONCILE_INTERVAL: float = 600
+    LIKE_RECONCILE_BATCH_SIZE: int = 1000
+    # "내가 좋아요했는지" 조회용 Redis 집합 (likes:<article_id>)
+    LIKE_STATE_TTL: int = 600
+    LIKE_STATE_MAX_SET_SIZE: int = 10000  # 이보다 좋아요가 많으면 DB로 답함
+    # 좋아요 write-behind 버퍼 (인기 게시글의 likes_count 행 경합 완화, 선택 사항)
+    LIKE_BUFFER_ENABLED: bool = False
+    LIKE_BUFFER_FLUSH_INTERVAL_MS: int = 1000  # Redis journal 없이 유실될 수 있는 최대 구간
+    LIKE_BUFFER_MAX_EVENTS: int = 500
+    LIKE_BUFFER_OWNER_TTL: int = 30  # 이 시간 동안 응답 없는 인스턴스의 journal을 재생
+    LIKE_BUFFER_VERSION_TTL: int = 86400  # journal 재생 시 더 늦은 이벤트를 확인하는 기간
+
+    # Article detail cache (in-process LRU + Redis)
+    ARTICLE_CACHE_MAX_ENTRIES: int = 1000
+    ARTICLE_CACHE_LOCAL_TTL: int = 10
+    ARTICLE_CACHE_REDIS_TTL: int = 60
+
+    # 게시글별 최신 댓글 미리보기 캐시 (워커 내, 댓글 작성/수정/삭제 시 무효화)
+    COMMENT_PREVIEW_CACHE_TTL: int = 30
+    COMMENT_PREVIEW_CACHE_MAX_ENTRIES: int = 5000
+
+    # Article search (Postgres text search configuration)
+    SEARCH_TEXT_CONFIG: str = "simple"
+
+    # Password hashing (bcrypt, 별도 프로세스 풀에서 실행)
+    BCRYPT_ROUNDS: int = 12  # 변경 시 로그인 성공한 사용자의 해시를 자동으로 갱신
+    PASSWORD_HASH_WORKERS: int = 2
+    PASSWORD_HASH_MAX_PENDING: int = 32  # 초과 시 503 응답
 
     # JWT
     JWT_SECRET_KEY: str
     JWT_ALGORITHM: str = "HS256"
     JWT_ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
+    # 인증된 사용자(principal) 캐시, TTL은 토큰 만료 시각을 넘지 않음
+    PRINCIPAL_CACHE_TTL: int = 60
+    PRINCIPAL_CACHE_MAX_ENTRIES: int = 10000
+    JWT_DECODE_CACHE_MAX_ENTRIES: int = 10000  # 검증된 토큰 payload 캐시
 
     class Config:
         env_file = ".env"
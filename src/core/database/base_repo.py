@@ -16,7 +16,7 @@ class BaseRepository(Generic[T]):
     async def find_many(
         self,
         where: Optional[Dict[str, Any]] = None,
-        order: Optional[Dict[str, str]] = None,
+        order: Optional[Dict[str, str] | List[Dict[str, str]]] = None,
         include: Optional[Dict[str, bool]] = None,
         skip: Optional[int] = None,
         take: Optional[int] = None,
@@ -0,0 +1,80 @@
+import base64
+import binascii
+import json
+from datetime import datetime
+from typing import Any
+
+from src.core.exceptions.base import InvalidInputException
+
+# 다음 페이지 커서를 돌려주는 응답 헤더 (응답 본문 형식은 그대로 유지)
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+
+
+def encode_cursor(*values: Any) -> str:
+    """
+    정렬 키 값들을 불투명한(opaque) 커서 문자열로 인코딩합니다.
+    datetime 값은 ISO 8601 문자열로 저장됩니다.
+    """
+    payload = [
+        value.isoformat() if isinstance(value, datetime) else value for value in values
+    ]
+    raw = json.dumps(payload, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+
+def decode_cursor(cursor: str, *types: type) -> tuple:
+    """
+    커서 문자열을 디코딩하여 types 순서대로 변환된 값의 튜플을 반환합니다.
+    잘못된 커서는 InvalidInputException을 발생시킵니다.
+    """
+    try:
+        padded = cursor + "=" * (-len(cursor) % 4)
+        values = json.loads(base64.urlsafe_b64decode(padded.encode("ascii")))
+        if not isinstance(values, list) or len(values) != len(types):
+            raise ValueError("cursor arity mismatch")
+
+        decoded = []
+        for value, value_type in zip(values, types):
+            if value_type is datetime:
+                decoded.append(datetime.fromisoformat(value))
+            elif value_type is float and isinstance(value, (int, float)):
+                decoded.append(float(value))
+            elif isinstance(value, value_type) and not isinstance(value, bool):
+                decoded.append(value)
+            else:
+                raise ValueError("cursor value type mismatch")
+        return tuple(decoded)
+
+    except (ValueError, TypeError, binascii.Error, UnicodeError):
+        raise InvalidInputException(detail="Invalid cursor.")
+
+
+def next_page_cursor(rows: list, limit: int, field: str = "created_at") -> str | None:
+    """
+    마지막 행의 (field, id)로 다음 페이지 커서를 만듭니다.
+    limit보다 적게 조회되었으면 더 가져올 행이 없으므로 None 입니다.
+    """
+    if len(rows) < limit:
+        return None
+    last = rows[-1]
+    return encode_cursor(getattr(last, field), last.id)
+
+
+def keyset_where(
+    cursor: str | None, field: str = "created_at", descending: bool = True
+) -> dict[str, Any]:
+    """
+    (field, id) 복합 키 기준으로 커서 이후의 행을 조회하는 Prisma where 절을 만듭니다.
+    OFFSET 없이 인덱스 범위 스캔으로 다음 페이지를 가져오기 위해 사용합니다.
+    """
+    if not cursor:
+        return {}
+
+    value, last_id = decode_cursor(cursor, datetime, int)
+    op = "lt" if descending else "gt"
+    return {
+        "OR": [
+            {field: {op: value}},
+            {field: value, "id": {op: last_id}},
+        ]
+    }
@@ -41,6 +41,13 @@ class InternalServerException(AppException):
         )
 
 
+class ServiceUnavailableException(AppException):
+    def __init__(self, detail: str = "Service temporarily unavailable."):
+        super().__init__(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE, detail=detail
+        )
+
+
 class InvalidInputException(AppException):
     def __init__(self, detail: str = "Invalid input."):
         super().__init__(status_code=status.HTTP_400_BAD_REQUEST, detail=detail)
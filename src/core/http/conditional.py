@@ -0,0 +1,82 @@
+import hashlib
+from datetime import datetime, timezone
+from email.utils import format_datetime, parsedate_to_datetime
+from typing import Any, Iterable
+
+from fastapi import Request, Response, status
+
+
+def make_etag(parts: Iterable[Any]) -> str:
+    """
+    (id, updated_at, ...) 같은 검증용 값들로 강한(strong) ETag를 만듭니다.
+    응답 본문을 직렬화하지 않고 계산할 수 있도록 행의 식별 값만 사용합니다.
+    """
+    digest = hashlib.sha1(usedforsecurity=False)
+    for part in parts:
+        digest.update(repr(part).encode("utf-8"))
+        digest.update(b"\x1f")
+    return f'"{digest.hexdigest()}"'
+
+
+def latest(timestamps: Iterable[datetime | None]) -> datetime | None:
+    """
+    가장 최근 시각을 반환합니다. (Last-Modified 계산용)
+    """
+    values = [
+        value if value.tzinfo else value.replace(tzinfo=timezone.utc)
+        for value in timestamps
+        if value is not None
+    ]
+    return max(values) if values else None
+
+
+def _etag_matches(header: str, etag: str) -> bool:
+    if header.strip() == "*":
+        return True
+    # If-None-Match 는 약한 비교를 사용합니다 (RFC 9110 13.1.2)
+    return any(
+        candidate.strip().removeprefix("W/") == etag for candidate in header.split(",")
+    )
+
+
+def _not_modified_since(header: str, last_modified: datetime) -> bool:
+    try:
+        since = parsedate_to_datetime(header)
+    except (TypeError, ValueError):
+        return False
+    if since.tzinfo is None:
+        since = since.replace(tzinfo=timezone.utc)
+    return last_modified.replace(microsecond=0) <= since
+
+
+def conditional_get(
+    request: Request,
+    response: Response,
+    parts: Iterable[Any],
+    last_modified: datetime | None = None,
+) -> Response | None:
+    """
+    응답에 ETag / Last-Modified 헤더를 설정하고,
+    클라이언트의 캐시가 유효하면 본문 없는 304 응답을 반환합니다. 아니면 None 입니다.
+    """
+    headers = {"ETag": make_etag(parts)}
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(
+            last_modified.astimezone(timezone.utc), usegmt=True
+        )
+    response.headers.update(headers)
+
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        not_modified = _etag_matches(if_none_match, headers["ETag"])
+    else:
+        if_modified_since = request.headers.get("if-modified-since")
+        not_modified = (
+            if_modified_since is not None
+            and last_modified is not None
+            and _not_modified_since(if_modified_since, last_modified)
+        )
+
+    if not_modified:
+        return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+    return None
@@ -0,0 +1,28 @@
+import logging
+from typing import Any, Callable
+
+
+class MetricsRegistry:
+    """
+    각 컴포넌트(캐시, 집계기 등)의 통계 함수를 이름별로 등록해 두고
+    한 번에 스냅샷을 만들어 주는 레지스트리입니다.
+    """
+
+    def __init__(self):
+        self._sources: dict[str, Callable[[], dict[str, Any]]] = {}
+
+    def register(self, name: str, source: Callable[[], dict[str, Any]]) -> None:
+        self._sources[name] = source
+
+    def snapshot(self) -> dict[str, dict[str, Any]]:
+        result = {}
+        for name, source in self._sources.items():
+            try:
+                result[name] = source()
+            except Exception as e:
+                logging.error(f"Failed to collect metrics for {name}: {e}")
+                result[name] = {"error": str(e)}
+        return result
+
+
+metrics_registry = MetricsRegistry()
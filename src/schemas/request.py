@@ -64,20 +64,37 @@ class ArticleUpdate(BaseModel):
 
 
 class ArticleSearch(BaseModel):
+    q: str | None = Field(default=None, min_length=1, max_length=200)  # 키워드 검색
     user_id: int | None = None
     category_id: int | None = None
     created_date: date | None = None
     updated_date: date | None = None
     skip: int = Field(default=0, ge=0)
     limit: int = Field(default=10, ge=1, le=100)
+    cursor: str | None = None  # 이전 응답의 X-Next-Cursor 값, 지정 시 skip 무시
+    with_files: bool = True  # False 이면 파일 정보를 제외하고 조회
+
+
+# FILE--------------
+class FileUploadIntentRequest(BaseModel):
+    article_id: int
+    filename: str = Field(min_length=1, max_length=255)
+    content_type: str
+    size: int | None = Field(default=None, ge=1)  # 알고 있으면 미리 검증
 
 
 # COMMENT--------------
 class CommentCreate(BaseModel):
     content: str
+    parent_id: int | None = None  # 답글이면 부모 댓글 id
 
     def to_comment_data(self, user_id: int, article_id: int) -> CommentData:
-        return CommentData(user_id=user_id, article_id=article_id, content=self.content)
+        return CommentData(
+            user_id=user_id,
+            article_id=article_id,
+            content=self.content,
+            parent_id=self.parent_id,
+        )
 
 
 class CommentUpdate(BaseModel):
@@ -90,7 +107,16 @@ class CommentUpdate(BaseModel):
         )
 
 
+class CommentPreviewRequest(BaseModel):
+    article_ids: list[int] = Field(min_length=1, max_length=100)
+    limit: int = Field(default=3, ge=1, le=10)  # 게시글당 최신 댓글 수
+
+
 # LIKE--------------
 class LikeCreate(BaseModel):
     article_id: int
     dir: int = Field(ge=0, le=1)
+
+
+class LikeStateRequest(BaseModel):
+    article_ids: list[int] = Field(min_length=1, max_length=100)
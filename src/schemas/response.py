@@ -85,8 +85,27 @@ class LikeResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True, populate_by_name=True)
 
 
+class LikeStateResponse(BaseModel):
+    article_id: int
+    liked: bool
+    likes_count: int
+
+
+class FileUploadError(BaseModel):
+    filename: str | None = None
+    detail: str
+
+
+class FileUploadIntentResponse(BaseModel):
+    file_id: int
+    url: str  # multipart/form-data POST 대상
+    fields: dict[str, str]  # 파일과 함께 그대로 보내야 하는 폼 필드
+    expires_in: int
+
+
 class FileUploadResponse(BaseModel):
     urls: list[str]
+    failed: list[FileUploadError] = Field(default_factory=list)
 
     model_config = ConfigDict(from_attributes=True, populate_by_name=True)
 
@@ -101,15 +120,25 @@ class ArticleResponse(BaseModel):
     updated_at: datetime | None = None
     categories: list[int] | None = Field(default_factory=list)
     likes_count: int = 0
+    comments_count: int = 0
     files: List[FileResponse] | None = Field(default_factory=list)
 
     model_config = ConfigDict(from_attributes=True, populate_by_name=True)
 
 
+class ArticleSearchResponse(ArticleResponse):
+    rank: float | None = None  # q 검색 시 관련도 점수
+    snippet: str | None = None  # q 검색 시 <mark>로 강조된 본문 발췌 (그 외 HTML은 escape됨)
+
+    model_config = ConfigDict(from_attributes=True, populate_by_name=True)
+
+
 class CommentResponse(BaseModel):
     id: int
     user_id: int
     article_id: int
+    parent_id: int | None = None
+    depth: int = 0
     content: str
     created_at: datetime
     updated_at: datetime
@@ -117,6 +146,22 @@ class CommentResponse(BaseModel):
     model_config = ConfigDict(from_attributes=True, populate_by_name=True)
 
 
+class CommentThreadResponse(CommentResponse):
+    replies: list["CommentThreadResponse"] = Field(default_factory=list)
+
+    model_config = ConfigDict(from_attributes=True, populate_by_name=True)
+
+
+class CommentPreviewResponse(BaseModel):
+    article_id: int
+    comments: list[CommentResponse]
+
+
+class CommentCountResponse(BaseModel):
+    article_id: int
+    comments_count: int
+
+
 class CommentUpdateResponse(BaseModel):
     id: int
     content: str
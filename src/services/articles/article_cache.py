@@ -0,0 +1,102 @@
+import logging
+
+from src.core.config.settings import settings
+from src.core.metrics.registry import metrics_registry
+from src.schemas.response import ArticleResponse
+from src.services.auth.cache import redis_client
+from src.services.cache.memory_cache import TTLLRUCache
+
+
+class ArticleCache:
+    """
+    게시글 상세(ArticleResponse) read-through 캐시입니다.
+
+    - 1단계: 워커 내 LRU (짧은 TTL, 다른 워커의 무효화는 TTL 만료로 반영)
+    - 2단계: Redis (워커 간 공유, 무효화 시 즉시 삭제)
+
+    두 단계 모두 직렬화된 JSON 문자열을 저장하므로 호출자는 매번 새 객체를 받습니다.
+    """
+
+    KEY_PREFIX = "article:"
+
+    def __init__(
+        self,
+        max_entries: int = settings.ARTICLE_CACHE_MAX_ENTRIES,
+        local_ttl: int = settings.ARTICLE_CACHE_LOCAL_TTL,
+        redis_ttl: int = settings.ARTICLE_CACHE_REDIS_TTL,
+    ):
+        self.local = TTLLRUCache(maxsize=max_entries, ttl=local_ttl)
+        self.redis_ttl = redis_ttl
+        self.redis_hits = 0
+        self.redis_misses = 0
+
+    @property
+    def use_redis(self) -> bool:
+        # Redis 장애 시(회로 차단)에는 워커 내 LRU만 사용합니다.
+        return self.redis_ttl > 0 and redis_client.available
+
+    def _key(self, article_id: int) -> str:
+        return f"{self.KEY_PREFIX}{article_id}"
+
+    async def get(self, article_id: int) -> ArticleResponse | None:
+        payload = self.local.get(article_id)
+        if payload is None and self.use_redis:
+            try:
+                payload = await redis_client.get(self._key(article_id))
+            except Exception as e:
+                logging.error(f"Article cache read failed: {e}")
+                payload = None
+
+            if payload is None:
+                self.redis_misses += 1
+                return None
+            self.redis_hits += 1
+            self.local.set(article_id, payload)
+
+        if payload is None:
+            return None
+        return ArticleResponse.model_validate_json(payload)
+
+    async def set(self, article: ArticleResponse) -> None:
+        payload = article.model_dump_json()
+        self.local.set(article.id, payload)
+        if self.use_redis:
+            try:
+                await redis_client.setex(self._key(article.id), self.redis_ttl, payload)
+            except Exception as e:
+                logging.error(f"Article cache write failed: {e}")
+
+    async def invalidate(self, article_id: int) -> None:
+        self.local.delete(article_id)
+        if self.use_redis:
+            try:
+                await redis_client.delete(self._key(article_id))
+            except Exception as e:
+                logging.error(f"Article cache invalidation failed: {e}")
+
+    async def invalidate_many(self, article_ids) -> None:
+        """
+        여러 게시글을 한 번의 DEL로 무효화합니다.
+        """
+        article_ids = list(article_ids)
+        if not article_ids:
+            return
+        for article_id in article_ids:
+            self.local.delete(article_id)
+        if self.use_redis:
+            try:
+                await redis_client.delete(
+                    *(self._key(article_id) for article_id in article_ids)
+                )
+            except Exception as e:
+                logging.error(f"Article cache invalidation failed: {e}")
+
+    def stats(self) -> dict:
+        return {
+            "local": self.local.stats(),
+            "redis": {"hits": self.redis_hits, "misses": self.redis_misses},
+        }
+
+
+article_cache = ArticleCache()
+metrics_registry.register("article_cache", article_cache.stats)
@@ -0,0 +1,185 @@
+import asyncio
+import logging
+import uuid
+
+from src.api.v1.articles.article_repository import ArticleRepository
+from src.core.config.settings import settings
+from src.core.metrics.registry import metrics_registry
+from src.services.articles.article_cache import article_cache
+from src.services.auth.cache import redis_client
+
+
+class ViewCountAggregator:
+    """
+    게시글 조회수를 메모리에 모아 두었다가 주기적으로 한 번에 반영하는 write-behind 집계기입니다.
+
+    - record()는 DB를 건드리지 않고 버퍼만 증가시킵니다.
+    - flush_interval_ms 마다, 또는 max_events 건이 쌓이면 한 번의 UPDATE로 반영합니다.
+    - use_redis=True 이면 각 워커의 버퍼를 Redis 해시(HINCRBY)로 합친 뒤,
+      RENAME에 성공한 워커 하나만 DB에 반영합니다. RENAME한 해시를 읽지 못하면
+      다음 flush에서 다시 읽습니다.
+    - 캐시된 게시글 상세는 캐시할 때의 조회수를 가지고 있으므로, 반영한 게시글의
+      캐시를 지웁니다. 반영 중인 조회수는 끝날 때까지 pending()에 포함됩니다.
+    """
+
+    REDIS_KEY = "article_views"
+
+    def __init__(
+        self,
+        flush_interval_ms: int = settings.VIEW_FLUSH_INTERVAL_MS,
+        max_events: int = settings.VIEW_FLUSH_MAX_EVENTS,
+        use_redis: bool = settings.VIEW_COUNTER_USE_REDIS,
+    ):
+        self.article_repository = ArticleRepository()
+        self.flush_interval = flush_interval_ms / 1000
+        self.max_events = max_events
+        self.use_redis = use_redis
+        self._pending: dict[int, int] = {}
+        self._flushing: dict[int, int] = {}  # 반영 중인 이 워커의 조회수
+        self._pending_events = 0
+        self._claimed: list[str] = []  # RENAME으로 가져왔지만 아직 읽지 못한 해시
+        self._flush_lock = asyncio.Lock()
+        self._flush_task: asyncio.Task | None = None
+        self._task: asyncio.Task | None = None
+
+    def record(self, article_id: int) -> None:
+        """
+        조회 1건을 버퍼에 기록합니다.
+        """
+        self._pending[article_id] = self._pending.get(article_id, 0) + 1
+        self._pending_events += 1
+        if self._pending_events >= self.max_events and (
+            self._flush_task is None or self._flush_task.done()
+        ):
+            self._flush_task = asyncio.create_task(self.flush())
+            self._flush_task.add_done_callback(self._flush_done)
+
+    @staticmethod
+    def _flush_done(task: asyncio.Task) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            logging.error(f"View counter flush failed: {task.exception()}")
+
+    def pending(self, article_id: int) -> int:
+        """
+        아직 DB에 반영되지 않은 이 워커의 조회수를 반환합니다.
+        """
+        return self._pending.get(article_id, 0) + self._flushing.get(article_id, 0)
+
+    async def flush(self) -> None:
+        """
+        버퍼에 쌓인 조회수를 DB에 반영합니다. 실패하면 다음 주기에 다시 시도합니다.
+        """
+        async with self._flush_lock:
+            self._flushing, self._pending = self._pending, {}
+            self._pending_events = 0
+            try:
+                await self._flush(self._flushing)
+            finally:
+                self._flushing = {}
+
+    async def _flush(self, deltas: dict[int, int]) -> None:
+        if self.use_redis and redis_client.available:
+            deltas = await self._drain_shared(deltas)
+        if not deltas:
+            return
+
+        try:
+            await self.article_repository.add_views(deltas)
+        except Exception as e:
+            logging.error(f"Failed to flush article views: {e}")
+            self._restore(deltas)
+            return
+        await article_cache.invalidate_many(deltas)
+
+    async def _drain_shared(self, deltas: dict[int, int]) -> dict[int, int]:
+        """
+        로컬 버퍼를 Redis 해시에 합치고, 공유 버퍼 전체를 가져옵니다.
+        Redis에 합치지 못한 경우에만 로컬 버퍼를 그대로 돌려줍니다.
+        """
+        try:
+            if deltas:
+                pipe = redis_client.pipeline()
+                for article_id, count in deltas.items():
+                    pipe.hincrby(self.REDIS_KEY, article_id, count)
+                await pipe.execute()
+        except Exception as e:
+            logging.error(f"Failed to push views to shared buffer: {e}")
+            return deltas
+
+        # 여기부터 로컬 조회수는 공유 버퍼에 들어 있으므로 다시 반환하면 두 번 반영됩니다.
+        # RENAME은 원자적이므로 여러 워커가 동시에 flush 해도 한 워커만 가져갑니다.
+        flushing_key = f"{self.REDIS_KEY}:flushing:{uuid.uuid4()}"
+        try:
+            await redis_client.rename(self.REDIS_KEY, flushing_key)
+            self._claimed.append(flushing_key)
+        except Exception:
+            pass  # 공유 버퍼가 비어 있거나 다른 워커가 가져감
+
+        return await self._read_claimed()
+
+    async def _read_claimed(self) -> dict[int, int]:
+        """
+        가져온 해시를 읽고 지웁니다. 읽지 못한 해시는 다음 flush에서 다시 읽습니다.
+        """
+        shared: dict[int, int] = {}
+        for key in list(self._claimed):
+            try:
+                counts = await redis_client.hgetall(key)
+            except Exception as e:
+                logging.error(f"Failed to read shared view buffer {key}: {e}")
+                continue
+
+            self._claimed.remove(key)
+            for article_id, count in counts.items():
+                shared[int(article_id)] = shared.get(int(article_id), 0) + int(count)
+            try:
+                await redis_client.delete(key)
+            except Exception as e:
+                # 이미 읽은 값은 반영되므로, 남은 해시는 다시 읽지 않습니다.
+                logging.error(f"Failed to delete shared view buffer {key}: {e}")
+        return shared
+
+    def _restore(self, deltas: dict[int, int]) -> None:
+        for article_id, count in deltas.items():
+            self._pending[article_id] = self._pending.get(article_id, 0) + count
+            self._pending_events += count
+
+    def stats(self) -> dict:
+        return {
+            "pending_articles": len(self._pending),
+            "pending_events": self._pending_events,
+            "shared_buffer": self.use_redis,
+            "claimed_buffers": len(self._claimed),
+        }
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """
+        주기 작업을 멈추고 남은 조회수를 반영합니다.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._flush_task is not None:
+            try:
+                await self._flush_task
+            except Exception:
+                pass  # _flush_done에서 이미 기록함
+            self._flush_task = None
+        await self.flush()
+
+
+view_counter = ViewCountAggregator()
+metrics_registry.register("view_counter", view_counter.stats)
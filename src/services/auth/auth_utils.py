@@ -2,7 +2,16 @@
 
 from passlib.context import CryptContext
 
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+from src.core.config.settings import settings
+
+# min/max를 기본값과 같게 두어, 다른 cost로 만든 해시는 needs_update 대상이 됩니다.
+pwd_context = CryptContext(
+    schemes=["bcrypt"],
+    deprecated="auto",
+    bcrypt__default_rounds=settings.BCRYPT_ROUNDS,
+    bcrypt__min_rounds=settings.BCRYPT_ROUNDS,
+    bcrypt__max_rounds=settings.BCRYPT_ROUNDS,
+)
 
 
 def hash_password(plain_password: str) -> str:
@@ -11,3 +20,10 @@ def hash_password(plain_password: str) -> str:
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     return pwd_context.verify(plain_password, hashed_password)
+
+
+def verify_and_update_password(
+    plain_password: str, hashed_password: str
+) -> tuple[bool, str | None]:
+    """검증에 성공했고 해시 설정이 바뀌었다면 새 해시를 함께 반환합니다."""
+    return pwd_context.verify_and_update(plain_password, hashed_password)
@@ -1,36 +1,329 @@
-import redis
+import asyncio
 import logging
+import time
+from typing import Any
+
+import redis.asyncio as redis
+from redis.exceptions import RedisError
+
 from src.core.config.settings import settings
+from src.core.metrics.registry import metrics_registry
+from src.services.cache.memory_cache import TTLLRUCache
+
+REDIS_ERRORS = (RedisError, OSError, asyncio.TimeoutError)
+
+
+class FallbackCache:
+    """
+    Redis를 쓸 수 없을 때 사용하는 워커 내 대체 캐시입니다.
+
+    TTLLRUCache 위에 Redis와 같은 이름의 명령을 제공합니다.
+    키마다 만료 시간을 지키고, max_entries를 넘으면 가장 오래 쓰이지 않은 키부터 제거합니다.
+    만료된 키는 조회 시 정리되며, run_sweeper()가 주기적으로 한 번 더 정리합니다.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = settings.FALLBACK_CACHE_MAX_ENTRIES,
+        sweep_interval: float = settings.FALLBACK_CACHE_SWEEP_INTERVAL,
+    ):
+        self.cache = TTLLRUCache(maxsize=max_entries)
+        self.sweep_interval = sweep_interval
+
+    async def set(self, key, value, ex=None):
+        self.cache.set(key, value, ttl=ex)
+        return True
+
+    async def setex(self, key, ttl, value):
+        return await self.set(key, value, ex=ttl)
+
+    async def get(self, key):
+        return self.cache.get(key)
+
+    async def mget(self, *keys):
+        return [self.cache.get(key) for key in keys]
+
+    async def exists(self, *keys):
+        return sum(1 for key in keys if key in self.cache)
+
+    async def delete(self, *keys):
+        return sum(1 for key in keys if self.cache.delete(key))
+
+    async def incr(self, key, amount=1):
+        # Redis와 같이 기존 만료 시간은 유지합니다.
+        remaining = self.cache.ttl_of(key)
+        value = int(self.cache.get(key) or 0) + amount
+        ttl = remaining if remaining is not None and remaining > 0 else None
+        self.cache.set(key, str(value), ttl=ttl)
+        return value
+
+    async def expire(self, key, ttl):
+        value = self.cache.get(key)
+        if value is None:
+            return False
+        self.cache.set(key, value, ttl=ttl)
+        return True
+
+    async def ttl(self, key):
+        remaining = self.cache.ttl_of(key)
+        if remaining is None:
+            return -2
+        return -1 if remaining == -1 else int(remaining)
+
+    async def run_sweeper(self) -> None:
+        while True:
+            await asyncio.sleep(self.sweep_interval)
+            removed = self.cache.sweep()
+            if removed:
+                logging.debug(f"Fallback cache swept {removed} expired keys")
+
+    def stats(self) -> dict:
+        return self.cache.stats()
+
+
+class CircuitBreaker:
+    """
+    Redis 호출이 연속으로 failure_threshold 번 실패하면 reset_timeout 초 동안 회로를 엽니다.
+    열린 동안에는 Redis를 호출하지 않고, 시간이 지나면 한 번 시도(half-open)해서
+    성공하면 닫고 실패하면 다시 엽니다.
+    """
+
+    def __init__(self, failure_threshold: int, reset_timeout: float):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.failures = 0
+        self.opened_at: float | None = None
+        self.trips = 0
+
+    @property
+    def state(self) -> str:
+        if self.opened_at is None:
+            return "closed"
+        if time.monotonic() - self.opened_at >= self.reset_timeout:
+            return "half-open"
+        return "open"
+
+    def allow(self) -> bool:
+        return self.state != "open"
+
+    def record_success(self) -> None:
+        self.failures = 0
+        self.opened_at = None
+
+    def record_failure(self) -> None:
+        self.failures += 1
+        if self.opened_at is not None or self.failures >= self.failure_threshold:
+            self.trip()
+
+    def trip(self) -> None:
+        if self.opened_at is None:
+            self.trips += 1
+        self.opened_at = time.monotonic()
+
+
+class RedisCache:
+    """
+    redis.asyncio 연결 풀을 감싼 캐시 클라이언트입니다.
+
+    - connect()/close()는 lifespan에서 호출합니다. 연결 전에는 fallback을 사용합니다.
+    - 모든 명령에 소켓 타임아웃이 적용되고, 실패가 이어지면 회로 차단기가 열려
+      요청이 Redis를 기다리지 않고 곧바로 워커 내 fallback 캐시로 처리됩니다.
+    - 회로가 열린 동안 fallback에 쓴 값은 Redis로 옮겨지지 않습니다.
+    """
+
+    def __init__(self):
+        self._redis: redis.Redis | None = None
+        self.fallback = FallbackCache()
+        self.breaker = CircuitBreaker(
+            failure_threshold=settings.REDIS_BREAKER_FAILURES,
+            reset_timeout=settings.REDIS_BREAKER_RESET_SECONDS,
+        )
+        self.fallback_calls = 0
+        self._sweeper: asyncio.Task | None = None
+
+    async def connect(self) -> None:
+        if self._sweeper is None:
+            self._sweeper = asyncio.create_task(self.fallback.run_sweeper())
+
+        pool = redis.ConnectionPool(
+            host=settings.REDIS_HOST,
+            port=settings.REDIS_PORT,
+            db=settings.REDIS_DB,
+            max_connections=settings.REDIS_MAX_CONNECTIONS,
+            socket_timeout=settings.REDIS_SOCKET_TIMEOUT,
+            socket_connect_timeout=settings.REDIS_CONNECT_TIMEOUT,
+            health_check_interval=30,
+            encoding="UTF-8",
+            decode_responses=True,
+        )
+        self._redis = redis.Redis(connection_pool=pool)
+        try:
+            # Redis 연결 테스트
+            await self._redis.ping()
+            self.breaker.record_success()
+            logging.info("Redis connection established")
+        except REDIS_ERRORS as e:
+            logging.error(f"Redis connection error: {e}")
+            self.breaker.trip()
+            logging.warning("Using in-memory fallback cache until Redis recovers")
+
+    async def close(self) -> None:
+        if self._sweeper is not None:
+            self._sweeper.cancel()
+            self._sweeper = None
+        if self._redis is not None:
+            await self._redis.aclose()
+            self._redis = None
+
+    @property
+    def available(self) -> bool:
+        """
+        지금 Redis로 명령을 보낼 수 있는지 여부 (연결됨 + 회로가 열려 있지 않음)
+        """
+        return self._redis is not None and self.breaker.allow()
+
+    async def _call(self, command: str, *args: Any) -> Any:
+        if self.available:
+            try:
+                result = await getattr(self._redis, command)(*args)
+                self.breaker.record_success()
+                return result
+            except REDIS_ERRORS as e:
+                logging.error(f"Redis {command} failed: {e}")
+                self.breaker.record_failure()
+
+        self.fallback_calls += 1
+        return await getattr(self.fallback, command)(*args)
+
+    async def get(self, key: str) -> Any:
+        return await self._call("get", key)
+
+    async def mget(self, *keys: str) -> list[Any]:
+        return await self._call("mget", *keys)
+
+    async def setex(self, key: str, ttl: int, value: Any) -> Any:
+        return await self._call("setex", key, ttl, value)
+
+    async def exists(self, *keys: str) -> int:
+        return await self._call("exists", *keys)
+
+    async def delete(self, *keys: str) -> int:
+        return await self._call("delete", *keys)
+
+    async def incr(self, key: str, amount: int = 1) -> int:
+        return await self._call("incr", key, amount)
+
+    async def expire(self, key: str, ttl: int) -> bool:
+        return await self._call("expire", key, ttl)
+
+    async def ttl(self, key: str) -> int:
+        return await self._call("ttl", key)
+
+    async def rename(self, src: str, dst: str) -> Any:
+        return await self._direct("rename", src, dst)
+
+    async def hgetall(self, key: str) -> dict:
+        return await self._direct("hgetall", key)
+
+    async def _direct(self, command: str, *args: Any) -> Any:
+        """
+        fallback이 없는 명령(공유 상태가 필요한 명령)은 Redis에서만 실행합니다.
+        """
+        if not self.available:
+            raise ConnectionError("Redis is unavailable")
+        try:
+            result = await getattr(self._redis, command)(*args)
+        except REDIS_ERRORS:
+            self.breaker.record_failure()
+            raise
+        self.breaker.record_success()
+        return result
+
+    async def eval(self, script: str, numkeys: int, *keys_and_args: Any) -> Any:
+        return await self._direct("eval", script, numkeys, *keys_and_args)
+
+    async def rpush(self, key: str, *values: Any) -> int:
+        return await self._direct("rpush", key, *values)
+
+    async def llen(self, key: str) -> int:
+        return await self._direct("llen", key)
+
+    async def lrange(self, key: str, start: int, end: int) -> list:
+        return await self._direct("lrange", key, start, end)
+
+    async def ltrim(self, key: str, start: int, end: int) -> Any:
+        return await self._direct("ltrim", key, start, end)
+
+    async def publish(self, channel: str, message: str) -> int:
+        return await self._direct("publish", channel, message)
+
+    async def scan_iter(self, match: str, count: int = 1000):
+        """
+        패턴에 맞는 키를 SCAN으로 순회합니다. (Redis에서만 가능)
+        """
+        if not self.available:
+            raise ConnectionError("Redis is unavailable")
+        async for key in self._redis.scan_iter(match=match, count=count):
+            yield key
+
+    def pubsub(self):
+        if not self.available:
+            raise ConnectionError("Redis is unavailable")
+        return self._redis.pubsub(ignore_subscribe_messages=True)
+
+    def pipeline(self) -> "CachePipeline":
+        return CachePipeline(self)
+
+    def stats(self) -> dict:
+        return {
+            "connected": self._redis is not None,
+            "breaker": self.breaker.state,
+            "breaker_trips": self.breaker.trips,
+            "fallback_calls": self.fallback_calls,
+            "fallback": self.fallback.stats(),
+        }
+
+
+class CachePipeline:
+    """
+    여러 명령을 모아 한 번의 왕복으로 보냅니다. (transaction 없이 pipelining만 사용)
+    Redis를 쓸 수 없으면 같은 명령을 fallback 캐시에 순서대로 실행합니다.
+    """
+
+    def __init__(self, cache: RedisCache):
+        self.cache = cache
+        self.commands: list[tuple[str, tuple]] = []
+
+    def __getattr__(self, command: str):
+        def queue(*args: Any) -> "CachePipeline":
+            self.commands.append((command, args))
+            return self
+
+        return queue
+
+    async def execute(self) -> list[Any]:
+        commands, self.commands = self.commands, []
+        if not commands:
+            return []
+
+        if self.cache.available:
+            pipe = self.cache._redis.pipeline(transaction=False)
+            for command, args in commands:
+                getattr(pipe, command)(*args)
+            try:
+                results = await pipe.execute()
+                self.cache.breaker.record_success()
+                return results
+            except REDIS_ERRORS as e:
+                logging.error(f"Redis pipeline failed: {e}")
+                self.cache.breaker.record_failure()
+
+        self.cache.fallback_calls += 1
+        return [
+            await getattr(self.cache.fallback, command)(*args)
+            for command, args in commands
+        ]
+
 
-try:
-    redis_client = redis.Redis(
-        host=settings.REDIS_HOST,
-        port=settings.REDIS_PORT,
-        db=settings.REDIS_DB,
-        encoding="UTF-8",
-        decode_responses=True,
-    )
-    # Redis 연결 테스트
-    redis_client.ping()
-    logging.info("Redis connection established")
-
-except redis.ConnectionError as e:
-    logging.error(f"Redis connection error: {e}")
-
-    # 메모리 기반 /    Fallback 대체 구현 (선택 사항)
-    class FallbackCache:
-        def __init__(self):
-            self.cache = {}
-
-        def setex(self, key, ttl, value):
-            self.cache[key] = value
-            # 실제 TTL은 구현하지 않음, 메모리에만 저장
-
-        def get(self, key):
-            return self.cache.get(key)
-
-        def exists(self, key):
-            return key in self.cache
-
-    redis_client = FallbackCache()
-    logging.warning("Using in-memory fallback cache instead of Redis")
+redis_client = RedisCache()
+metrics_registry.register("redis", redis_client.stats)
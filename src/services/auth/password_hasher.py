@@ -0,0 +1,110 @@
+import asyncio
+import logging
+import time
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+from typing import Any, Callable
+
+from src.core.config.settings import settings
+from src.core.exceptions.base import ServiceUnavailableException
+from src.core.metrics.registry import metrics_registry
+from src.services.auth.auth_utils import (
+    hash_password,
+    verify_password,
+    verify_and_update_password,
+)
+
+
+class PasswordHasher:
+    """
+    bcrypt 해시/검증을 별도 프로세스 풀에서 실행하는 비동기 래퍼입니다.
+
+    bcrypt 한 번에 수백 ms의 CPU를 쓰므로 이벤트 루프에서 직접 실행하면 다른 요청이 모두 멈춥니다.
+    대기 중인 작업이 max_pending을 넘으면 큐를 더 쌓지 않고 503을 반환합니다.
+    """
+
+    def __init__(
+        self,
+        workers: int = settings.PASSWORD_HASH_WORKERS,
+        max_pending: int = settings.PASSWORD_HASH_MAX_PENDING,
+    ):
+        self.workers = workers
+        self.max_pending = max_pending
+        self._executor: ProcessPoolExecutor | None = None
+        self._pending = 0
+        self.rejected = 0
+        self._latency: dict[str, dict[str, float]] = {}
+
+    def start(self) -> None:
+        if self._executor is None:
+            self._executor = ProcessPoolExecutor(max_workers=self.workers)
+
+    def shutdown(self) -> None:
+        if self._executor is not None:
+            self._executor.shutdown(wait=True)
+            self._executor = None
+
+    async def _submit(self, name: str, func: Callable[..., Any], *args) -> Any:
+        if self._pending >= self.max_pending:
+            self.rejected += 1
+            logging.warning("Password hashing queue is full")
+            raise ServiceUnavailableException(
+                detail="Too many authentication requests. Please retry shortly."
+            )
+
+        self.start()
+        self._pending += 1
+        started = time.perf_counter()
+        try:
+            loop = asyncio.get_running_loop()
+            return await loop.run_in_executor(self._executor, partial(func, *args))
+        finally:
+            self._pending -= 1
+            self._record(name, time.perf_counter() - started)
+
+    def _record(self, name: str, elapsed: float) -> None:
+        latency = self._latency.setdefault(
+            name, {"count": 0, "total_ms": 0.0, "max_ms": 0.0}
+        )
+        elapsed_ms = elapsed * 1000
+        latency["count"] += 1
+        latency["total_ms"] += elapsed_ms
+        latency["max_ms"] = max(latency["max_ms"], elapsed_ms)
+
+    async def hash(self, plain_password: str) -> str:
+        return await self._submit("hash", hash_password, plain_password)
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._submit(
+            "verify", verify_password, plain_password, hashed_password
+        )
+
+    async def verify_and_update(
+        self, plain_password: str, hashed_password: str
+    ) -> tuple[bool, str | None]:
+        """
+        비밀번호를 검증하고, BCRYPT_ROUNDS가 바뀌었다면 새 해시도 함께 반환합니다.
+        """
+        return await self._submit(
+            "verify", verify_and_update_password, plain_password, hashed_password
+        )
+
+    def stats(self) -> dict:
+        return {
+            "pending": self._pending,
+            "max_pending": self.max_pending,
+            "rejected": self.rejected,
+            "latency": {
+                name: {
+                    "count": int(values["count"]),
+                    "avg_ms": round(values["total_ms"] / values["count"], 2),
+                    "max_ms": round(values["max_ms"], 2),
+                }
+                for name, values in self._latency.items()
+                if values["count"]
+            },
+        }
+
+
+password_hasher = PasswordHasher()
+metrics_registry.register("password_hasher", password_hasher.stats)
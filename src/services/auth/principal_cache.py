@@ -0,0 +1,108 @@
+import time
+from typing import Any
+
+from src.core.config.settings import settings
+from src.core.metrics.registry import metrics_registry
+from src.services.cache.memory_cache import TTLLRUCache
+
+
+def without_secrets(user: Any) -> Any:
+    """
+    비밀번호 해시를 비운 사용자 사본을 반환합니다.
+    비밀번호 확인이 필요하면 캐시된 사용자가 아니라 DB에서 다시 조회해야 합니다.
+    """
+    return user.model_copy(update={"hashedpassword": ""})
+
+
+class PrincipalCache:
+    """
+    토큰 jti -> 인증된 사용자 캐시입니다.
+
+    get_current_user가 요청마다 이메일로 사용자를 조회하지 않도록 워커 내에 보관합니다.
+    항목의 TTL은 PRINCIPAL_CACHE_TTL과 토큰의 남은 유효 시간 중 작은 값이며,
+    역할/비밀번호 변경 시에는 이메일 인덱스로 해당 사용자의 항목을 모두 제거하고,
+    다른 워커에는 token_blacklist의 pub/sub 채널로 알립니다.
+    (구독이 끊긴 동안의 변경은 TTL 만료로 반영됩니다.)
+    캐시된 사용자에는 비밀번호 해시를 보관하지 않습니다.
+    """
+
+    def __init__(
+        self,
+        max_entries: int = settings.PRINCIPAL_CACHE_MAX_ENTRIES,
+        ttl: int = settings.PRINCIPAL_CACHE_TTL,
+    ):
+        self.ttl = ttl
+        self.cache = TTLLRUCache(maxsize=max_entries, ttl=ttl)
+        self._jtis_by_email: dict[str, set[str]] = {}
+
+    def get(self, jti: str | None) -> Any | None:
+        if not jti or self.ttl <= 0:
+            return None
+        user = self.cache.get(jti)
+        return user.model_copy() if user is not None else None
+
+    def set(self, jti: str | None, user: Any, exp: int | None) -> None:
+        if not jti or self.ttl <= 0:
+            return
+
+        ttl = self.ttl
+        if exp is not None:
+            ttl = min(ttl, exp - int(time.time()))
+        if ttl <= 0:
+            return
+
+        self.cache.set(jti, without_secrets(user), ttl=ttl)
+        # LRU로 밀려나거나 만료된 jti는 인덱스에서도 정리합니다.
+        jtis = self._jtis_by_email.get(user.email, set())
+        self._jtis_by_email[user.email] = {
+            cached for cached in jtis if cached in self.cache
+        } | {jti}
+        # 다시 로그인하지 않는 사용자의 이메일은 위에서 정리되지 않으므로,
+        # 인덱스가 캐시 최대 개수의 2배를 넘으면 전체를 한 번 정리합니다.
+        # (정리 후에는 최대 maxsize개이므로 정리 비용은 set 한 번당 상수입니다.)
+        if len(self._jtis_by_email) > 2 * self.cache.maxsize:
+            self._prune()
+
+    def _prune(self) -> None:
+        """
+        캐시에 남은 항목이 없는 jti와 이메일을 인덱스에서 제거합니다.
+        """
+        self.cache.sweep()
+        for email, jtis in list(self._jtis_by_email.items()):
+            alive = {jti for jti in jtis if jti in self.cache}
+            if alive:
+                self._jtis_by_email[email] = alive
+            else:
+                del self._jtis_by_email[email]
+
+    def evict(self, jti: str | None, email: str | None) -> None:
+        """
+        로그아웃한 토큰의 항목을 제거합니다.
+        """
+        if not jti:
+            return
+        self.cache.delete(jti)
+        jtis = self._jtis_by_email.get(email)
+        if jtis is not None:
+            jtis.discard(jti)
+            if not jtis:
+                del self._jtis_by_email[email]
+
+    def invalidate_user(self, email: str) -> None:
+        """
+        사용자 정보(역할, 비밀번호)가 바뀌었을 때 해당 사용자의 모든 토큰 항목을 제거합니다.
+        """
+        for jti in self._jtis_by_email.pop(email, set()):
+            self.cache.delete(jti)
+
+    def clear(self) -> None:
+        self.cache.clear()
+        self._jtis_by_email.clear()
+
+    def stats(self) -> dict:
+        self._prune()
+        return {**self.cache.stats(), "users": len(self._jtis_by_email)}
+
+
+principal_cache = PrincipalCache()
+metrics_registry.register("principal_cache", principal_cache.stats)
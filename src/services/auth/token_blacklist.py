@@ -0,0 +1,175 @@
+import asyncio
+import hashlib
+import logging
+
+from src.core.config.settings import settings
+from src.core.metrics.registry import metrics_registry
+from src.services.auth.cache import redis_client
+from src.services.auth.principal_cache import principal_cache
+from src.services.cache.bloom_filter import BloomFilter
+
+BLACKLIST_PREFIX = "bl_"
+USER_CHANGED_PREFIX = "user:"
+
+
+def blacklist_key(token: str) -> str:
+    """
+    로그아웃한 토큰의 Redis 키입니다.
+    다른 캐시 조회와 함께 redis_client.pipeline()에 넣어 한 번에 확인할 수 있습니다.
+    """
+    return f"{BLACKLIST_PREFIX}{token}"
+
+
+def _fingerprint(token: str) -> str:
+    # 토큰 원문 대신 해시를 필터와 pub/sub 메시지에 사용합니다.
+    return hashlib.sha256(token.encode("utf-8")).hexdigest()
+
+
+class TokenBlacklist:
+    """
+    로그아웃한 토큰 목록(Redis bl_<token>) 앞에 두는 워커 내 Bloom filter 입니다.
+
+    - 필터에 없다고 나오면 Redis를 조회하지 않습니다. (대부분의 요청)
+    - 필터에 있다고 나오면(실제 로그아웃 또는 오탐) Redis에서 확인합니다.
+    - 다른 워커의 로그아웃은 pub/sub으로 받아 필터에 추가합니다.
+    - 시작 시, 구독이 끊겼다 다시 연결될 때, 그리고 rebuild_interval 마다
+      Redis의 bl_* 키로 필터를 다시 만듭니다. (만료된 토큰 정리)
+    - 필터가 준비되지 않았거나 구독이 끊긴 동안에는 항상 Redis를 조회합니다.
+    - 같은 채널로 사용자 정보(역할, 비밀번호) 변경도 알려 각 워커의 principal_cache를
+      비웁니다. (메시지 "user:<email>")
+    """
+
+    CHANNEL = "token_blacklist"
+
+    def __init__(
+        self,
+        capacity: int = settings.TOKEN_BLACKLIST_BLOOM_CAPACITY,
+        error_rate: float = settings.TOKEN_BLACKLIST_BLOOM_ERROR_RATE,
+        rebuild_interval: float = settings.TOKEN_BLACKLIST_REBUILD_INTERVAL,
+    ):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.rebuild_interval = rebuild_interval
+        self.bloom = BloomFilter(capacity, error_rate)
+        self.ready = False
+        self._rebuilding: BloomFilter | None = None
+        self._task: asyncio.Task | None = None
+        self.redis_checks = 0
+        self.skipped_checks = 0
+        self.false_positives = 0
+
+    def _add_local(self, fingerprint: str) -> None:
+        self.bloom.add(fingerprint)
+        if self._rebuilding is not None:
+            self._rebuilding.add(fingerprint)
+
+    async def add(self, token: str, ttl: int) -> None:
+        """
+        토큰을 블랙리스트에 추가하고 다른 워커에 알립니다.
+        """
+        await redis_client.setex(blacklist_key(token), ttl, "1")
+        fingerprint = _fingerprint(token)
+        self._add_local(fingerprint)
+        try:
+            await redis_client.publish(self.CHANNEL, fingerprint)
+        except Exception as e:
+            logging.error(f"Failed to publish blacklisted token: {e}")
+
+    async def publish_user_change(self, email: str) -> None:
+        """
+        사용자 정보가 바뀌었을 때 이 워커와 다른 워커의 principal_cache 항목을 제거합니다.
+        """
+        principal_cache.invalidate_user(email)
+        try:
+            await redis_client.publish(self.CHANNEL, f"{USER_CHANGED_PREFIX}{email}")
+        except Exception as e:
+            logging.error(f"Failed to publish user change: {e}")
+
+    def _on_message(self, data: str) -> None:
+        if data.startswith(USER_CHANGED_PREFIX):
+            principal_cache.invalidate_user(data[len(USER_CHANGED_PREFIX) :])
+        else:
+            self._add_local(data)
+
+    async def contains(self, token: str) -> bool:
+        if self.ready and _fingerprint(token) not in self.bloom:
+            self.skipped_checks += 1
+            return False
+
+        self.redis_checks += 1
+        blacklisted = bool(await redis_client.exists(blacklist_key(token)))
+        if self.ready and not blacklisted:
+            self.false_positives += 1
+        return blacklisted
+
+    async def rebuild(self) -> None:
+        """
+        Redis의 bl_* 키로 필터를 새로 만듭니다.
+        스캔하는 동안 들어온 로그아웃은 기존 필터와 새 필터 모두에 추가됩니다.
+        """
+        self._rebuilding = BloomFilter(self.capacity, self.error_rate)
+        try:
+            async for key in redis_client.scan_iter(match=f"{BLACKLIST_PREFIX}*"):
+                self._rebuilding.add(_fingerprint(key[len(BLACKLIST_PREFIX) :]))
+            self.bloom = self._rebuilding
+        finally:
+            self._rebuilding = None
+
+    async def _listen(self) -> None:
+        pubsub = redis_client.pubsub()
+        try:
+            await pubsub.subscribe(self.CHANNEL)
+            # 구독 이후에 다시 만들어야 그 사이의 로그아웃을 놓치지 않습니다.
+            # 구독이 끊긴 동안 놓친 사용자 변경이 있을 수 있으므로 캐시도 비웁니다.
+            principal_cache.clear()
+            await self.rebuild()
+            self.ready = True
+            loop = asyncio.get_running_loop()
+            rebuild_at = loop.time() + self.rebuild_interval
+
+            while True:
+                message = await pubsub.get_message(timeout=1.0)
+                if message is not None and message["type"] == "message":
+                    self._on_message(message["data"])
+                if loop.time() >= rebuild_at:
+                    await self.rebuild()
+                    rebuild_at = loop.time() + self.rebuild_interval
+        finally:
+            self.ready = False
+            await pubsub.aclose()
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self._listen()
+            except asyncio.CancelledError:
+                raise
+            except Exception as e:
+                logging.error(f"Token blacklist sync failed, retrying: {e}")
+                await asyncio.sleep(settings.REDIS_BREAKER_RESET_SECONDS)
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+    def stats(self) -> dict:
+        return {
+            "ready": self.ready,
+            "redis_checks": self.redis_checks,
+            "skipped_checks": self.skipped_checks,
+            "false_positives": self.false_positives,
+            "bloom": self.bloom.stats(),
+        }
+
+
+token_blacklist = TokenBlacklist()
+metrics_registry.register("token_blacklist", token_blacklist.stats)
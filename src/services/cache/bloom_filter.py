@@ -0,0 +1,60 @@
+import hashlib
+import math
+
+
+class BloomFilter:
+    """
+    고정 크기 비트 배열 기반 Bloom filter 입니다.
+
+    capacity 개를 넣었을 때 오탐률이 error_rate가 되도록 크기를 정합니다.
+      - 비트 수 m = -n * ln(p) / (ln 2)^2  (p=0.1% 기준 원소당 약 14.4 bit)
+      - 해시 수 k = m / n * ln 2
+    없는 값은 항상 "없음"으로 답하고(false negative 없음), 있는 값은 p 확률로 오탐합니다.
+    삭제는 지원하지 않으므로 만료된 값을 비우려면 새로 만들어야 합니다.
+    """
+
+    def __init__(self, capacity: int, error_rate: float):
+        self.capacity = capacity
+        self.error_rate = error_rate
+        self.size = max(
+            8, math.ceil(-capacity * math.log(error_rate) / math.log(2) ** 2)
+        )
+        self.hash_count = max(1, round(self.size / capacity * math.log(2)))
+        self.bits = bytearray((self.size + 7) // 8)
+        self.count = 0
+
+    def _positions(self, item: str):
+        # 128bit 해시 하나를 둘로 나눠 k개의 위치를 만듭니다. (double hashing)
+        digest = hashlib.blake2b(item.encode("utf-8"), digest_size=16).digest()
+        h1 = int.from_bytes(digest[:8], "big")
+        h2 = int.from_bytes(digest[8:], "big") | 1
+        for i in range(self.hash_count):
+            yield (h1 + i * h2) % self.size
+
+    def add(self, item: str) -> None:
+        for position in self._positions(item):
+            self.bits[position >> 3] |= 1 << (position & 7)
+        self.count += 1
+
+    def __contains__(self, item: str) -> bool:
+        return all(
+            self.bits[position >> 3] & (1 << (position & 7))
+            for position in self._positions(item)
+        )
+
+    def estimated_error_rate(self) -> float:
+        """
+        지금까지 넣은 개수 기준 예상 오탐률 (1 - e^(-kn/m))^k
+        """
+        return (
+            1 - math.exp(-self.hash_count * self.count / self.size)
+        ) ** self.hash_count
+
+    def stats(self) -> dict:
+        return {
+            "items": self.count,
+            "capacity": self.capacity,
+            "bytes": len(self.bits),
+            "hash_count": self.hash_count,
+            "estimated_error_rate": round(self.estimated_error_rate(), 6),
+        }
@@ -0,0 +1,94 @@
+import time
+from collections import OrderedDict
+from typing import Any, Hashable
+
+
+class TTLLRUCache:
+    """
+    항목별 만료 시간(TTL)과 최대 개수를 가진 프로세스 내 LRU 캐시입니다.
+    가득 차면 가장 오래 사용되지 않은 항목부터 제거하며,
+    만료된 항목은 조회 시(lazy) 또는 sweep() 호출 시 정리됩니다.
+    """
+
+    def __init__(self, maxsize: int = 1024, ttl: float | None = None):
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._data: OrderedDict[Hashable, tuple[Any, float | None]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def get(self, key: Hashable, default: Any = None) -> Any:
+        entry = self._data.get(key)
+        if entry is None:
+            self.misses += 1
+            return default
+
+        value, expires_at = entry
+        if expires_at is not None and expires_at <= time.monotonic():
+            del self._data[key]
+            self.misses += 1
+            return default
+
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any, ttl: float | None = None) -> None:
+        """
+        값을 저장합니다. ttl을 지정하지 않으면 캐시 기본 TTL을 사용합니다.
+        """
+        ttl = self.ttl if ttl is None else ttl
+        expires_at = time.monotonic() + ttl if ttl is not None else None
+        self._data[key] = (value, expires_at)
+        self._data.move_to_end(key)
+        while len(self._data) > self.maxsize:
+            self._data.popitem(last=False)
+
+    def delete(self, key: Hashable) -> bool:
+        return self._data.pop(key, None) is not None
+
+    def ttl_of(self, key: Hashable) -> float | None:
+        """
+        남은 유효 시간(초)을 반환합니다. 없거나 만료된 키는 None, 만료가 없으면 -1 입니다.
+        """
+        entry = self._data.get(key)
+        if entry is None:
+            return None
+        _, expires_at = entry
+        if expires_at is None:
+            return -1
+        remaining = expires_at - time.monotonic()
+        return remaining if remaining > 0 else None
+
+    def sweep(self) -> int:
+        """
+        만료된 항목을 모두 제거하고 제거한 개수를 반환합니다.
+        """
+        now = time.monotonic()
+        expired = [
+            key
+            for key, (_, expires_at) in self._data.items()
+            if expires_at is not None and expires_at <= now
+        ]
+        for key in expired:
+            del self._data[key]
+        return len(expired)
+
+    def clear(self) -> None:
+        self._data.clear()
+
+    def __contains__(self, key: Hashable) -> bool:
+        return self.ttl_of(key) is not None
+
+    def __len__(self) -> int:
+        return len(self._data)
+
+    def stats(self) -> dict[str, Any]:
+        total = self.hits + self.misses
+        return {
+            "size": len(self._data),
+            "maxsize": self.maxsize,
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0,
+        }
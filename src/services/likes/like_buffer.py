@@ -0,0 +1,370 @@
+import asyncio
+import logging
+import uuid
+
+from src.api.v1.likes.like_repository import LikeRepository
+from src.core.config.settings import settings
+from src.core.metrics.registry import metrics_registry
+from src.services.articles.article_cache import article_cache
+from src.services.auth.cache import redis_client
+from src.services.likes.like_state import like_state
+
+JOURNAL_PREFIX = "like_journal:"
+OWNER_PREFIX = "like_journal_owner:"
+VERSION_PREFIX = "like_version:"
+SEQUENCE_KEY = "like_journal_seq"
+
+# 이벤트에 전역 순번을 붙여 journal에 넣고, (게시글, 사용자)별 마지막 순번을 남깁니다.
+# 한 스크립트로 실행되므로 journal 안의 순서와 순번의 순서가 항상 같습니다.
+_JOURNAL_SCRIPT = """
+local seq = redis.call('INCR', KEYS[3])
+redis.call('RPUSH', KEYS[1], ARGV[1] .. ':' .. seq)
+redis.call('SET', KEYS[2], seq, 'EX', ARGV[2])
+return seq
+"""
+
+
+class LikeBuffer:
+    """
+    좋아요/취소를 모아 두었다가 주기적으로 한 번에 반영하는 write-behind 버퍼입니다.
+    (LIKE_BUFFER_ENABLED=True 일 때만 사용)
+
+    - (article_id, user_id)별로 DB와 다른 최종 상태만 보관하므로, 같은 사용자가
+      좋아요 후 취소하면 두 이벤트가 서로 상쇄되어 아무것도 쓰지 않습니다.
+    - flush_interval_ms 마다, 또는 max_events 건이 쌓이면 한 문장으로 like 행과
+      게시글별 likes_count 순변화량을 반영합니다. 인기 게시글의 likes_count 행을
+      요청마다 잠그지 않습니다.
+    - Redis를 쓸 수 있으면 이벤트를 전역 순번과 함께 journal 리스트에도 기록합니다.
+      리스트는 flush 배치(세대)마다 따로 두고(like_journal:<id>:<세대>), 배치가
+      커밋된 뒤 그 세대의 리스트만 지웁니다.
+    - owner 키가 만료된(죽은) 인스턴스의 리스트는 다른 인스턴스가 가져가 다시 반영합니다.
+      같은 (게시글, 사용자)에 더 늦은 순번의 이벤트가 있으면(다른 인스턴스에서 다시
+      누른 경우) 그 항목은 재생하지 않습니다. 순번 기록은 version_ttl 동안 유지됩니다.
+    - Redis 없이 동작하면 프로세스가 비정상 종료될 때 flush_interval_ms 이내의 이벤트를 잃습니다.
+    """
+
+    def __init__(
+        self,
+        enabled: bool = settings.LIKE_BUFFER_ENABLED,
+        flush_interval_ms: int = settings.LIKE_BUFFER_FLUSH_INTERVAL_MS,
+        max_events: int = settings.LIKE_BUFFER_MAX_EVENTS,
+        owner_ttl: int = settings.LIKE_BUFFER_OWNER_TTL,
+        version_ttl: int = settings.LIKE_BUFFER_VERSION_TTL,
+    ):
+        self.like_repository = LikeRepository()
+        self.enabled = enabled
+        self.flush_interval = flush_interval_ms / 1000
+        self.max_events = max_events
+        self.owner_ttl = owner_ttl
+        self.version_ttl = version_ttl
+        self.instance_id = uuid.uuid4().hex
+        self._pending: dict[tuple[int, int], bool] = {}
+        self._flushing: dict[tuple[int, int], bool] = {}
+        self._deltas: dict[int, int] = {}
+        # _pending의 이벤트는 _generation 세대의 리스트에 기록됩니다.
+        # _committed 보다 앞선 세대는 모두 반영(또는 상쇄)되었고,
+        # _cleared 보다 앞선 세대의 리스트는 이미 지웠습니다.
+        self._generation = 0
+        self._committed = 0
+        self._cleared = 0
+        self._recorded = False
+        self._flush_lock = asyncio.Lock()
+        self._flush_task: asyncio.Task | None = None
+        self._task: asyncio.Task | None = None
+        self.flushed_changes = 0
+        self.cancelled_events = 0
+        self.duplicate_events = 0
+        self.replayed_journals = 0
+        self.skipped_replays = 0
+
+    def _journal_key(self, generation: int) -> str:
+        return f"{JOURNAL_PREFIX}{self.instance_id}:{generation}"
+
+    def state(self, article_id: int, user_id: int) -> bool | None:
+        """
+        아직 DB에 반영되지 않은 좋아요 상태를 반환합니다. 없으면 None 입니다.
+        """
+        key = (article_id, user_id)
+        if key in self._pending:
+            return self._pending[key]
+        return self._flushing.get(key)
+
+    def pending_delta(self, article_id: int) -> int:
+        """
+        아직 DB에 반영되지 않은 좋아요 수 변화량을 반환합니다.
+        """
+        return self._deltas.get(article_id, 0)
+
+    def _add_delta(self, article_id: int, liked: bool, sign: int = 1) -> None:
+        delta = self._deltas.get(article_id, 0) + (sign if liked else -sign)
+        if delta:
+            self._deltas[article_id] = delta
+        else:
+            self._deltas.pop(article_id, None)
+
+    async def record(self, article_id: int, user_id: int, liked: bool) -> None:
+        """
+        현재 상태와 다른 좋아요/취소 1건을 기록합니다.
+        """
+        key = (article_id, user_id)
+        if self._pending.get(key) == liked:
+            # 같은 방향의 중복 요청(동시에 두 번 누른 경우)은 이미 기록되어 있습니다.
+            self.duplicate_events += 1
+            return
+
+        # 버퍼 변경과 세대 확인 사이에 await가 없으므로, 이 이벤트는 항상
+        # 자신이 들어간 배치의 세대 리스트에 기록됩니다.
+        generation = self._generation
+        self._recorded = True
+        if key in self._pending:
+            # 반영 전에 반대로 다시 누르면 원래 상태로 돌아가므로 서로 상쇄됩니다.
+            self._add_delta(article_id, self._pending.pop(key), sign=-1)
+            self.cancelled_events += 2
+        else:
+            self._pending[key] = liked
+            self._add_delta(article_id, liked)
+
+        if redis_client.available:
+            await self._journal(generation, article_id, user_id, liked)
+
+        if len(self._pending) >= self.max_events and (
+            self._flush_task is None or self._flush_task.done()
+        ):
+            self._flush_task = asyncio.create_task(self.flush())
+            self._flush_task.add_done_callback(self._flush_done)
+
+    async def _journal(
+        self, generation: int, article_id: int, user_id: int, liked: bool
+    ) -> None:
+        journal_key = self._journal_key(generation)
+        try:
+            await redis_client.eval(
+                _JOURNAL_SCRIPT,
+                3,
+                journal_key,
+                f"{VERSION_PREFIX}{article_id}:{user_id}",
+                SEQUENCE_KEY,
+                f"{article_id}:{user_id}:{int(liked)}",
+                self.version_ttl,
+            )
+        except Exception as e:
+            logging.error(f"Failed to journal like event: {e}")
+            return
+
+        if generation < self._cleared:
+            # 기록이 끝나기 전에 이 세대가 커밋되어 리스트가 이미 지워진 경우입니다.
+            # 이벤트는 반영되었으므로 다시 생긴 리스트를 지웁니다.
+            try:
+                await redis_client.delete(journal_key)
+            except Exception as e:
+                logging.error(f"Failed to clear like journal: {e}")
+
+    @staticmethod
+    def _flush_done(task: asyncio.Task) -> None:
+        if not task.cancelled() and task.exception() is not None:
+            logging.error(f"Like buffer flush failed: {task.exception()}")
+
+    async def flush(self) -> None:
+        """
+        버퍼에 쌓인 좋아요 변경을 DB에 반영합니다. 실패하면 다음 주기에 다시 시도합니다.
+        """
+        async with self._flush_lock:
+            if not self._pending:
+                if self._recorded:
+                    # 남은 변경이 없으면 지금 세대의 이벤트는 모두 서로 상쇄되었습니다.
+                    self._recorded = False
+                    self._generation += 1
+                    self._committed = self._generation
+                await self._clear_journals()
+                return
+
+            # 버퍼 교체와 세대 증가를 await 없이 함께 해야, 이후 이벤트가 모두
+            # 다음 세대의 리스트로 갑니다.
+            self._flushing, self._pending = self._pending, {}
+            generation = self._generation
+            self._generation += 1
+            self._recorded = False
+            try:
+                changed = await self.like_repository.apply_changes(self._flushing)
+            except Exception as e:
+                logging.error(f"Failed to flush likes: {e}")
+                self._restore()
+                return
+
+            for (article_id, _), liked in self._flushing.items():
+                self._add_delta(article_id, liked, sign=-1)
+            self._flushing = {}
+            self.flushed_changes += len(changed)
+
+            # 앞서 실패해 되돌린 배치도 이번 배치에 포함되어 함께 반영되었습니다.
+            self._committed = generation + 1
+            await self._clear_journals()
+            await self._publish(changed)
+
+    async def _clear_journals(self) -> None:
+        """
+        커밋된 세대의 journal 리스트를 지웁니다. 실패하면 다음 flush에서 다시 지웁니다.
+        """
+        if self._cleared >= self._committed or not redis_client.available:
+            return
+
+        keys = [
+            self._journal_key(generation)
+            for generation in range(self._cleared, self._committed)
+        ]
+        try:
+            await redis_client.delete(*keys)
+        except Exception as e:
+            logging.error(f"Failed to clear like journal: {e}")
+            return
+        self._cleared = self._committed
+
+    def _restore(self) -> None:
+        batch, self._flushing = self._flushing, {}
+        for key, liked in batch.items():
+            if self._pending.get(key) == liked:
+                # 같은 변경이 다시 기록된 경우: 한 번만 반영합니다.
+                self._add_delta(key[0], liked, sign=-1)
+            elif key in self._pending:
+                # 실패한 배치 이후 반대로 다시 누른 경우: DB 상태로 돌아가므로 상쇄
+                self._add_delta(key[0], liked, sign=-1)
+                self._add_delta(key[0], self._pending.pop(key), sign=-1)
+            else:
+                self._pending[key] = liked
+        self._recorded = True
+
+    @staticmethod
+    async def _publish(changed: list[tuple[int, int, bool]]) -> None:
+        for article_id, user_id, liked in changed:
+            await like_state.record(article_id, user_id, liked)
+        for article_id in {article_id for article_id, _, _ in changed}:
+            await article_cache.invalidate(article_id)
+
+    async def _latest_changes(self, key: str) -> dict[tuple[int, int], bool]:
+        """
+        journal에서 (게시글, 사용자)별 마지막 이벤트를 읽고,
+        그보다 늦은 이벤트가 기록된 항목은 제외합니다.
+        """
+        latest: dict[tuple[int, int], tuple[int, bool]] = {}
+        for entry in await redis_client.lrange(key, 0, -1):
+            article_id, user_id, liked, seq = (int(value) for value in entry.split(":"))
+            latest[(article_id, user_id)] = (seq, bool(liked))
+        if not latest:
+            return {}
+
+        versions = await redis_client.mget(
+            *(
+                f"{VERSION_PREFIX}{article_id}:{user_id}"
+                for article_id, user_id in latest
+            )
+        )
+        changes = {}
+        for (like_key, (seq, liked)), version in zip(latest.items(), versions):
+            if version is not None and int(version) > seq:
+                self.skipped_replays += 1
+                continue
+            changes[like_key] = liked
+        return changes
+
+    async def recover(self) -> int:
+        """
+        owner 키가 만료된 인스턴스의 journal을 가져와 다시 반영하고, 처리한 journal 수를 반환합니다.
+        """
+        recovered = 0
+        async for key in redis_client.scan_iter(match=f"{JOURNAL_PREFIX}*"):
+            name = key[len(JOURNAL_PREFIX) :]
+            owner, _, rest = name.partition(":")
+            if owner == self.instance_id:
+                if not rest.startswith("recovered:"):
+                    continue  # 이 인스턴스가 아직 쓰고 있는 세대 리스트
+                claimed = key  # 이전에 가져왔지만 반영하지 못한 journal
+            elif await redis_client.exists(f"{OWNER_PREFIX}{owner}"):
+                continue
+            else:
+                # RENAME으로 가져가므로 여러 인스턴스가 동시에 복구해도 한 곳만 성공합니다.
+                # 가져간 뒤 이 인스턴스가 죽으면 이 키도 다른 인스턴스가 다시 복구합니다.
+                claimed = f"{JOURNAL_PREFIX}{self.instance_id}:recovered:{name}"
+                try:
+                    await redis_client.rename(key, claimed)
+                except Exception:
+                    continue
+
+            changes = await self._latest_changes(claimed)
+            changed = await self.like_repository.apply_changes(changes)
+            await redis_client.delete(claimed)
+            await self._publish(changed)
+            if changes:
+                logging.warning(
+                    f"Replayed like journal {name}: {len(changed)} changes applied"
+                )
+            recovered += 1
+
+        self.replayed_journals += recovered
+        return recovered
+
+    async def _heartbeat(self) -> None:
+        await redis_client.setex(
+            f"{OWNER_PREFIX}{self.instance_id}", self.owner_ttl, "1"
+        )
+
+    def stats(self) -> dict:
+        return {
+            "enabled": self.enabled,
+            "pending_changes": len(self._pending),
+            "flushed_changes": self.flushed_changes,
+            "cancelled_events": self.cancelled_events,
+            "duplicate_events": self.duplicate_events,
+            "replayed_journals": self.replayed_journals,
+            "skipped_replays": self.skipped_replays,
+        }
+
+    async def _run(self) -> None:
+        loop = asyncio.get_running_loop()
+        recover_at = loop.time()
+        while True:
+            try:
+                if redis_client.available:
+                    await self._heartbeat()
+                    if loop.time() >= recover_at:
+                        await self.recover()
+                        recover_at = loop.time() + self.owner_ttl
+            except Exception as e:
+                logging.error(f"Failed to recover like journals: {e}")
+
+            await asyncio.sleep(self.flush_interval)
+            await self.flush()
+
+    async def start(self) -> None:
+        if self.enabled and self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        """
+        주기 작업을 멈추고 남은 좋아요를 반영합니다.
+        """
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+        if self._flush_task is not None:
+            try:
+                await self._flush_task
+            except Exception:
+                pass  # _flush_done에서 이미 기록함
+            self._flush_task = None
+
+        # 남은 좋아요를 반영하고 커밋된 세대의 journal을 지웁니다.
+        await self.flush()
+
+        if self.enabled and not self._pending and redis_client.available:
+            try:
+                await redis_client.delete(f"{OWNER_PREFIX}{self.instance_id}")
+            except Exception as e:
+                logging.error(f"Failed to clear like journal owner: {e}")
+
+
+like_buffer = LikeBuffer()
+metrics_registry.register("like_buffer", like_buffer.stats)
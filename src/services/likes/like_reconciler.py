@@ -0,0 +1,85 @@
+import asyncio
+import logging
+
+from src.api.v1.articles.article_repository import ArticleRepository
+from src.core.config.settings import settings
+from src.core.metrics.registry import metrics_registry
+from src.services.articles.article_cache import article_cache
+
+
+class LikeCountReconciler:
+    """
+    article.likes_count 컬럼을 like 테이블 집계와 주기적으로 맞추는 백그라운드 작업입니다.
+
+    - interval 초마다 게시글을 id 순서로 batch_size 개씩 훑으며 그룹 집계로 어긋난 행을 찾습니다.
+    - 어긋난 게시글만 행을 잠근 뒤 다시 세어 고칩니다.
+    - 고친 개수는 metrics에 누적되고, 고친 게시글의 캐시는 무효화합니다.
+    """
+
+    def __init__(
+        self,
+        interval: float = settings.LIKE_RECONCILE_INTERVAL,
+        batch_size: int = settings.LIKE_RECONCILE_BATCH_SIZE,
+    ):
+        self.article_repository = ArticleRepository()
+        self.interval = interval
+        self.batch_size = batch_size
+        self._task: asyncio.Task | None = None
+        self.runs = 0
+        self.corrected = 0
+        self.last_corrected = 0
+
+    async def reconcile(self) -> int:
+        """
+        모든 게시글을 한 번 훑고, 고친 likes_count 개수를 반환합니다.
+        """
+        corrected = 0
+        after_id: int | None = 0
+        while after_id is not None:
+            last_id, drifted = await self.article_repository.find_drifted_likes_counts(
+                after_id=after_id, limit=self.batch_size
+            )
+            fixed = await self.article_repository.fix_likes_counts(drifted)
+            for article_id in fixed:
+                await article_cache.invalidate(article_id)
+            corrected += len(fixed)
+            after_id = last_id
+
+        self.runs += 1
+        self.corrected += corrected
+        self.last_corrected = corrected
+        if corrected:
+            logging.warning(f"Reconciled {corrected} drifted likes_count values")
+        return corrected
+
+    def stats(self) -> dict:
+        return {
+            "runs": self.runs,
+            "corrected": self.corrected,
+            "last_corrected": self.last_corrected,
+        }
+
+    async def _run(self) -> None:
+        while True:
+            await asyncio.sleep(self.interval)
+            try:
+                await self.reconcile()
+            except Exception as e:
+                logging.error(f"Failed to reconcile likes_count: {e}")
+
+    async def start(self) -> None:
+        if self._task is None:
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+like_reconciler = LikeCountReconciler()
+metrics_registry.register("like_reconciler", like_reconciler.stats)
@@ -0,0 +1,175 @@
+import asyncio
+import logging
+
+from src.api.v1.likes.like_repository import LikeRepository
+from src.core.config.settings import settings
+from src.core.metrics.registry import metrics_registry
+from src.services.auth.cache import redis_client
+
+# 게시글의 버전(KEYS[2])은 항상 올리고, 집합은 키가 있을 때만(이미 불러온 게시글) 고칩니다.
+# 일부만 담긴 집합이 만들어져 "좋아요 안 함"으로 잘못 답하는 것을 막기 위함입니다.
+_TOGGLE_SCRIPT = """
+redis.call('INCR', KEYS[2])
+redis.call('EXPIRE', KEYS[2], ARGV[3])
+if redis.call('EXISTS', KEYS[1]) == 0 then
+    return 0
+end
+if ARGV[1] == '1' then
+    redis.call('SADD', KEYS[1], ARGV[2])
+else
+    redis.call('SREM', KEYS[1], ARGV[2])
+end
+return 1
+"""
+
+# DB를 읽기 전에 확인한 버전(ARGV[1])이 그대로이고 집합이 아직 없을 때만 채웁니다.
+# 그 사이에 좋아요가 바뀌었으면 DB에서 읽은 목록이 오래된 것일 수 있으므로 쓰지 않습니다.
+_WARM_SCRIPT = """
+if (redis.call('GET', KEYS[2]) or '') ~= ARGV[1] then
+    return 0
+end
+if redis.call('EXISTS', KEYS[1]) == 1 then
+    return 0
+end
+for i = 3, #ARGV, 1000 do
+    redis.call('SADD', KEYS[1], unpack(ARGV, i, math.min(i + 999, #ARGV)))
+end
+redis.call('EXPIRE', KEYS[1], ARGV[2])
+return 1
+"""
+
+
+class LikeStateCache:
+    """
+    게시글별로 좋아요한 사용자 id를 Redis 집합(likes:<article_id>)에 보관합니다.
+
+    - 집합에는 항상 SENTINEL(0)이 들어 있어, 빈 집합(좋아요 0개)과 아직 불러오지 않은
+      게시글을 구분합니다. 좋아요 수는 SCARD - 1 입니다.
+    - 조회는 SMISMEMBER/SCARD를 한 번의 pipeline으로 보냅니다.
+    - 좋아요 추가/취소 시 게시글 버전(likes_version:<article_id>)을 올리고, 키가 있을 때만
+      집합을 갱신합니다. (Lua 스크립트)
+    - 없는 게시글은 DB에서 답한 뒤 백그라운드로 채웁니다. DB를 읽는 동안 버전이 바뀌었으면
+      채우지 않고 다음 조회 때 다시 시도합니다. 좋아요가 max_set_size보다 많은
+      게시글은 채우지 않고 계속 DB로 답합니다.
+    """
+
+    KEY_PREFIX = "likes:"
+    VERSION_PREFIX = "likes_version:"
+    SENTINEL = "0"
+
+    def __init__(
+        self,
+        ttl: int = settings.LIKE_STATE_TTL,
+        max_set_size: int = settings.LIKE_STATE_MAX_SET_SIZE,
+    ):
+        self.like_repository = LikeRepository()
+        self.ttl = ttl
+        self.max_set_size = max_set_size
+        self._warming: set[asyncio.Task] = set()
+        self.hits = 0
+        self.misses = 0
+
+    def _key(self, article_id: int) -> str:
+        return f"{self.KEY_PREFIX}{article_id}"
+
+    def _version_key(self, article_id: int) -> str:
+        return f"{self.VERSION_PREFIX}{article_id}"
+
+    async def get(
+        self, article_ids: list[int], user_id: int
+    ) -> dict[int, tuple[bool, int]]:
+        """
+        Redis에 불러와 둔 게시글의 (좋아요 여부, 좋아요 수)를 반환합니다.
+        """
+        if not redis_client.available:
+            return {}
+
+        pipe = redis_client.pipeline()
+        for article_id in article_ids:
+            key = self._key(article_id)
+            pipe.smismember(key, self.SENTINEL, user_id)
+            pipe.scard(key)
+        try:
+            results = await pipe.execute()
+        except Exception as e:
+            logging.error(f"Failed to read like state: {e}")
+            return {}
+
+        states = {}
+        for index, article_id in enumerate(article_ids):
+            (loaded, liked), size = results[2 * index], results[2 * index + 1]
+            if loaded:
+                states[article_id] = (bool(liked), size - 1)
+        self.hits += len(states)
+        self.misses += len(article_ids) - len(states)
+        return states
+
+    async def record(self, article_id: int, user_id: int, liked: bool) -> None:
+        """
+        좋아요 추가/취소를 집합에 반영합니다. 실패하면 집합을 지워 DB에서 다시 불러오게 합니다.
+        """
+        key = self._key(article_id)
+        try:
+            await redis_client.eval(
+                _TOGGLE_SCRIPT,
+                2,
+                key,
+                self._version_key(article_id),
+                int(liked),
+                user_id,
+                self.ttl,
+            )
+        except Exception as e:
+            logging.error(f"Failed to update like state: {e}")
+            await redis_client.delete(key)
+
+    def warm(self, counts: dict[int, int]) -> None:
+        """
+        {article_id: 좋아요 수} 중 채울 수 있는 게시글의 집합을 백그라운드로 채웁니다.
+        """
+        article_ids = [
+            article_id
+            for article_id, count in counts.items()
+            if count <= self.max_set_size
+        ]
+        if not article_ids or not redis_client.available:
+            return
+
+        task = asyncio.create_task(self._warm(article_ids))
+        self._warming.add(task)
+        task.add_done_callback(self._warming.discard)
+
+    async def _warm(self, article_ids: list[int]) -> None:
+        try:
+            # 버전을 DB 조회보다 먼저 읽어야, 조회 이후의 변경을 알아챌 수 있습니다.
+            versions = await redis_client.mget(
+                *(self._version_key(article_id) for article_id in article_ids)
+            )
+            user_ids = await self.like_repository.find_user_ids(article_ids)
+            pipe = redis_client.pipeline()
+            for article_id, version in zip(article_ids, versions):
+                pipe.eval(
+                    _WARM_SCRIPT,
+                    2,
+                    self._key(article_id),
+                    self._version_key(article_id),
+                    version or "",
+                    self.ttl,
+                    self.SENTINEL,
+                    *user_ids[article_id],
+                )
+            await pipe.execute()
+        except Exception as e:
+            logging.error(f"Failed to warm like state: {e}")
+
+    def stats(self) -> dict:
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "hit_rate": round(self.hits / total, 4) if total else 0.0,
+        }
+
+
+like_state = LikeStateCache()
+metrics_registry.register("like_state", like_state.stats)
@@ -1,13 +1,32 @@
+import asyncio
 import os
 import uuid
+from concurrent.futures import Executor
+from functools import partial
 import boto3
-from botocore.exceptions import BotoCoreError, NoCredentialsError
+from botocore.exceptions import BotoCoreError, ClientError, NoCredentialsError
 from botocore.config import Config
 from fastapi import UploadFile, HTTPException
 import logging
-from typing import List
+from typing import Any, Callable, List
 
 from src.core.config.settings import settings
+from src.core.exceptions.base import BadRequestException
+from src.services.cache.memory_cache import TTLLRUCache
+
+
+def create_s3_client():
+    """
+    S3 클라이언트를 생성합니다. boto3 클라이언트는 스레드 안전하므로 앱 전체에서 공유합니다.
+    """
+    config = Config(signature_version="s3v4")
+    return boto3.client(
+        "s3",
+        region_name=settings.AWS_S3_REGION,
+        aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
+        aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
+        config=config,
+    )
 
 
 class BaseS3Service:
@@ -15,14 +34,12 @@ class BaseS3Service:
     S3 파일 저장소 작업을 위한 기본 클래스입니다.
     """
 
-    def __init__(self):
-        config = Config(signature_version="s3v4")
-        self.s3_client = boto3.client(
-            "s3",
-            region_name=settings.AWS_S3_REGION,
-            aws_access_key_id=settings.AWS_ACCESS_KEY_ID,
-            aws_secret_access_key=settings.AWS_SECRET_ACCESS_KEY,
-            config=config,
+    def __init__(self, s3_client=None, executor: Executor | None = None):
+        self.s3_client = s3_client or create_s3_client()
+        # boto3 호출은 블로킹이므로 이벤트 루프가 아닌 전용 스레드 풀에서 실행합니다.
+        self.executor = executor
+        self.signed_url_cache = TTLLRUCache(
+            maxsize=settings.SIGNED_URL_CACHE_MAX_ENTRIES
         )
         self.bucket_name = settings.AWS_S3_BUCKET_NAME
         self.base_url = (
@@ -30,6 +47,13 @@ class BaseS3Service:
         )
         logging.info(f"S3 service initialized for bucket: {self.bucket_name}")
 
+    async def _run_blocking(self, func: Callable[..., Any], *args, **kwargs) -> Any:
+        """
+        블로킹 S3 호출을 executor에서 실행하고 결과를 기다립니다.
+        """
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self.executor, partial(func, *args, **kwargs))
+
     def generate_unique_filename(self, original_filename: str) -> str:
         """
         고유한 파일 이름을 생성합니다.
@@ -39,32 +63,111 @@ class BaseS3Service:
         logging.debug(f"Generated unique filename: {unique_filename}")
         return unique_filename
 
-    async def upload_file(self, file: UploadFile, folder: str = "") -> str:
+    async def upload_file(
+        self, file: UploadFile, folder: str = "", max_size: int | None = None
+    ) -> str:
         """
         파일을 S3에 업로드합니다.
         """
+        key, _ = await self.upload_stream(file, folder=folder, max_size=max_size)
+        return key
+
+    async def upload_stream(
+        self, file: UploadFile, folder: str = "", max_size: int | None = None
+    ) -> tuple[str, int]:
+        """
+        파일을 고정 크기 청크로 읽으며 S3에 업로드하고 (key, 크기)를 반환합니다.
+        청크 하나에 들어가는 파일은 put_object로, 그보다 큰 파일은 multipart upload로
+        올리므로 파일 전체를 메모리에 담지 않습니다.
+        max_size를 넘는 순간 업로드를 중단하고 BadRequestException을 발생시킵니다.
+        """
+        unique_filename = self.generate_unique_filename(file.filename)
+        key = f"{folder}/{unique_filename}" if folder else unique_filename
+        chunk_size = settings.S3_MULTIPART_CHUNK_SIZE
+        upload_id = None
+
+        def check_size(total: int) -> None:
+            if max_size is not None and total > max_size:
+                raise BadRequestException(detail="File size exceeds the maximum limit")
+
         try:
-            unique_filename = self.generate_unique_filename(file.filename)
-            key = f"{folder}/{unique_filename}" if folder else unique_filename
+            chunk = await file.read(chunk_size)
+            total = len(chunk)
+            check_size(total)
+            next_chunk = await file.read(chunk_size)
 
-            # 파일 내용 읽기
-            contents = await file.read()
+            if not next_chunk:
+                # 작은 파일은 한 번의 요청으로 업로드
+                await self._run_blocking(
+                    self.s3_client.put_object,
+                    Bucket=self.bucket_name,
+                    Key=key,
+                    Body=chunk,
+                    ContentType=file.content_type,
+                )
+            else:
+                multipart = await self._run_blocking(
+                    self.s3_client.create_multipart_upload,
+                    Bucket=self.bucket_name,
+                    Key=key,
+                    ContentType=file.content_type,
+                )
+                upload_id = multipart["UploadId"]
+                parts = []
+                part_number = 1
+                while chunk:
+                    part = await self._run_blocking(
+                        self.s3_client.upload_part,
+                        Bucket=self.bucket_name,
+                        Key=key,
+                        UploadId=upload_id,
+                        PartNumber=part_number,
+                        Body=chunk,
+                    )
+                    parts.append({"ETag": part["ETag"], "PartNumber": part_number})
+                    part_number += 1
 
-            # S3에 업로드
-            self.s3_client.put_object(
-                Bucket=self.bucket_name,
-                Key=key,
-                Body=contents,
-                ContentType=file.content_type,
-            )
+                    chunk, next_chunk = next_chunk, None
+                    if chunk:
+                        total += len(chunk)
+                        check_size(total)
+                        next_chunk = await file.read(chunk_size)
+
+                await self._run_blocking(
+                    self.s3_client.complete_multipart_upload,
+                    Bucket=self.bucket_name,
+                    Key=key,
+                    UploadId=upload_id,
+                    MultipartUpload={"Parts": parts},
+                )
 
             # 파일 포인터 위치 초기화
             await file.seek(0)
 
-            return key
-        except (BotoCoreError, NoCredentialsError) as e:
-            logging.error(f"S3 upload error: {str(e)}")
-            raise HTTPException(status_code=500, detail=f"S3 upload failed: {str(e)}")
+            return key, total
+        except Exception as e:
+            if upload_id is not None:
+                await self._abort_multipart(key, upload_id)
+            if isinstance(e, (BotoCoreError, NoCredentialsError)):
+                logging.error(f"S3 upload error: {str(e)}")
+                raise HTTPException(
+                    status_code=500, detail=f"S3 upload failed: {str(e)}"
+                )
+            raise
+
+    async def _abort_multipart(self, key: str, upload_id: str) -> None:
+        """
+        실패한 multipart upload를 취소하여 남은 조각이 과금되지 않도록 합니다.
+        """
+        try:
+            await self._run_blocking(
+                self.s3_client.abort_multipart_upload,
+                Bucket=self.bucket_name,
+                Key=key,
+                UploadId=upload_id,
+            )
+        except Exception as e:
+            logging.error(f"Failed to abort multipart upload for key {key}: {e}")
 
     async def upload_files(
         self, files: List[UploadFile], folder: str = ""
@@ -75,17 +178,37 @@ class BaseS3Service:
         if not files:
             return []
 
-        uploaded_keys = []
-        for file in files:
-            key = await self.upload_file(file, folder)
-            uploaded_keys.append(key)
+        semaphore = asyncio.Semaphore(settings.S3_UPLOAD_CONCURRENCY)
+
+        async def upload_one(file: UploadFile) -> str:
+            async with semaphore:
+                return await self.upload_file(file, folder)
 
-        return uploaded_keys
+        return list(await asyncio.gather(*(upload_one(file) for file in files)))
 
-    def generate_signed_url(self, key: str, expires_in: int = 3600) -> str:
+    def generate_signed_url(
+        self, key: str, expires_in: int = settings.SIGNED_URL_EXPIRES_IN
+    ) -> str:
         """
         S3 객체에 대한 signed URL을 생성합니다.
         """
+        signed_url, _ = self.generate_signed_url_with_ttl(key, expires_in)
+        return signed_url
+
+    def generate_signed_url_with_ttl(
+        self, key: str, expires_in: int = settings.SIGNED_URL_EXPIRES_IN
+    ) -> tuple[str, int]:
+        """
+        signed URL과 그 URL을 안전하게 재사용할 수 있는 남은 시간(초)을 반환합니다.
+        같은 key의 URL은 만료 SIGNED_URL_REFRESH_MARGIN초 전까지 캐시에서 재사용하여
+        요청마다 SigV4 서명을 다시 계산하지 않습니다.
+        """
+        cache_key = (key, expires_in)
+        signed_url = self.signed_url_cache.get(cache_key)
+        remaining = self.signed_url_cache.ttl_of(cache_key)
+        if signed_url is not None and remaining is not None:
+            return signed_url, int(remaining)
+
         try:
             signed_url = self.s3_client.generate_presigned_url(
                 "get_object",
@@ -96,17 +219,63 @@ class BaseS3Service:
                 ExpiresIn=expires_in,
                 HttpMethod="GET",
             )
-            return signed_url
         except Exception as e:
             logging.error(f"Error generating signed URL for key {key}: {e}")
             raise HTTPException(status_code=500, detail="Failed to generate signed URL")
 
-    def delete_file(self, key: str) -> bool:
+        reusable_for = max(0, expires_in - settings.SIGNED_URL_REFRESH_MARGIN)
+        if reusable_for > 0:
+            self.signed_url_cache.set(cache_key, signed_url, ttl=reusable_for)
+        return signed_url, reusable_for
+
+    def generate_presigned_post(
+        self,
+        key: str,
+        content_type: str,
+        max_size: int,
+        expires_in: int = settings.PRESIGNED_POST_EXPIRES_IN,
+    ) -> dict:
+        """
+        클라이언트가 S3에 직접 업로드할 수 있는 presigned POST(url, fields)를 생성합니다.
+        크기와 Content-Type은 S3 정책 조건으로 강제됩니다.
+        """
+        try:
+            return self.s3_client.generate_presigned_post(
+                Bucket=self.bucket_name,
+                Key=key,
+                Fields={"Content-Type": content_type},
+                Conditions=[
+                    {"Content-Type": content_type},
+                    ["content-length-range", 1, max_size],
+                ],
+                ExpiresIn=expires_in,
+            )
+        except Exception as e:
+            logging.error(f"Error generating presigned POST for key {key}: {e}")
+            raise HTTPException(status_code=500, detail="Failed to generate upload URL")
+
+    async def head_file(self, key: str) -> dict | None:
+        """
+        S3 객체의 메타데이터를 조회합니다. 객체가 없으면 None을 반환합니다.
+        """
+        try:
+            return await self._run_blocking(
+                self.s3_client.head_object, Bucket=self.bucket_name, Key=key
+            )
+        except ClientError as e:
+            if e.response.get("Error", {}).get("Code") in ("404", "NoSuchKey"):
+                return None
+            logging.error(f"Error reading metadata for key {key}: {e}")
+            raise HTTPException(status_code=500, detail="Failed to read file metadata")
+
+    async def delete_file(self, key: str) -> bool:
         """
         S3에서 파일을 삭제합니다.
         """
         try:
-            self.s3_client.delete_object(Bucket=self.bucket_name, Key=key)
+            await self._run_blocking(
+                self.s3_client.delete_object, Bucket=self.bucket_name, Key=key
+            )
             return True
         except Exception as e:
             logging.error(f"Error deleting file with key {key}: {e}")
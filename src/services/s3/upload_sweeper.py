@@ -0,0 +1,80 @@
+import asyncio
+import logging
+from datetime import datetime, timedelta, timezone
+
+from src.core.config.settings import settings
+from src.core.metrics.registry import metrics_registry
+
+
+class PendingUploadSweeper:
+    """
+    upload-intent로 발급받고 complete하지 않은 직접 업로드를 주기적으로 정리하는 백그라운드 작업입니다.
+
+    - interval 초마다 ttl 초보다 오래된 pending 파일 정보를 batch_size 개씩 지우고,
+      S3에 올라간 객체가 있으면 함께 삭제합니다.
+    - ttl은 PRESIGNED_POST_EXPIRES_IN보다 길어야 아직 올릴 수 있는 업로드를 지우지 않습니다.
+    - S3 클라이언트가 필요하므로 lifespan에서 컨테이너의 file_service로 시작합니다.
+    """
+
+    def __init__(
+        self,
+        ttl: int = settings.PENDING_UPLOAD_TTL,
+        interval: float = settings.PENDING_UPLOAD_SWEEP_INTERVAL,
+        batch_size: int = settings.PENDING_UPLOAD_SWEEP_BATCH_SIZE,
+    ):
+        self.ttl = ttl
+        self.interval = interval
+        self.batch_size = batch_size
+        self.file_service = None
+        self._task: asyncio.Task | None = None
+        self.runs = 0
+        self.expired = 0
+
+    async def sweep(self) -> int:
+        """
+        오래된 pending 업로드를 모두 정리하고, 정리한 개수를 반환합니다.
+        """
+        created_before = datetime.now(timezone.utc) - timedelta(seconds=self.ttl)
+        expired = 0
+        while True:
+            count = await self.file_service.expire_pending_uploads(
+                created_before, limit=self.batch_size
+            )
+            expired += count
+            if count < self.batch_size:
+                break
+
+        self.runs += 1
+        self.expired += expired
+        if expired:
+            logging.warning(f"Expired {expired} pending uploads")
+        return expired
+
+    def stats(self) -> dict:
+        return {"runs": self.runs, "expired": self.expired}
+
+    async def _run(self) -> None:
+        while True:
+            try:
+                await self.sweep()
+            except Exception as e:
+                logging.error(f"Failed to expire pending uploads: {e}")
+            await asyncio.sleep(self.interval)
+
+    async def start(self, file_service) -> None:
+        if self._task is None:
+            self.file_service = file_service
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self) -> None:
+        if self._task is not None:
+            self._task.cancel()
+            try:
+                await self._task
+            except asyncio.CancelledError:
+                pass
+            self._task = None
+
+
+upload_sweeper = PendingUploadSweeper()
+metrics_registry.register("upload_sweeper", upload_sweeper.stats)